@@ -16,7 +16,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from src.app.infrastructure.config import config
-from src.app.infrastructure.external import mexc_client
+from src.app.infrastructure.external import mexc_client, redis_client
 
 # Configure logging
 logging.basicConfig(
@@ -50,27 +50,85 @@ async def lifespan(app: FastAPI):
     )
     logger.info(f"Server is ready to accept requests on port {config.PORT}")
 
-    # Test MEXC API in background (non-blocking, fire-and-forget)
+    # Keep one pooled MEXC HTTP session for the app lifetime; request handlers
+    # and tasks that use `async with mexc_client` only lease it.
     import asyncio
 
-    async def test_mexc_api():
-        try:
-            logger.info("Testing MEXC API connection...")
-            await asyncio.wait_for(mexc_client.ping(), timeout=3.0)
+    await mexc_client.open()
+
+    # Track the exchange clock offset so signed requests are stamped with
+    # server-aligned timestamps and an adaptive recvWindow.
+    if config.MEXC_API_KEY and config.MEXC_SECRET_KEY:
+        mexc_client.start_clock_sync(config.MEXC_CLOCK_SYNC_INTERVAL)
+
+    # Symbol step/tick/min-notional rules used to quantize orders locally.
+    mexc_client.start_exchange_info_refresh(config.MEXC_EXCHANGE_INFO_REFRESH)
+
+    # Persist raw websocket frames for offline replay and benchmarks; must be
+    # active before the first stream connects.
+    from src.app.infrastructure.external.mexc.websocket import (
+        start_recording,
+        stop_recording,
+        stream_monitor,
+    )
+
+    if config.MEXC_WS_RECORD_DIR:
+        start_recording(
+            config.MEXC_WS_RECORD_DIR,
+            max_bytes=config.MEXC_WS_RECORD_SEGMENT_MB * 1024 * 1024,
+        )
+
+    # Websocket latency split (network / decode / queue dwell) per channel,
+    # measured against the exchange-aligned clock.
+    stream_monitor.enabled = config.MEXC_WS_STATS
+    stream_monitor.clock = mexc_client.clock
+    if config.MEXC_WS_STATS and config.MEXC_WS_STATS_LOG_INTERVAL > 0:
+        stream_monitor.start_reporting(config.MEXC_WS_STATS_LOG_INTERVAL)
+
+    # Live local order books (diff-depth stream + REST snapshot) used by the
+    # orderbook endpoint and the rebalance planners instead of REST depth.
+    from src.app.infrastructure.external.mexc.orderbook import order_books
+
+    order_books.start(
+        mexc_client,
+        config.MEXC_ORDERBOOK_SYMBOLS.split(","),
+        max_per_connection=config.MEXC_WS_MAX_SUBSCRIPTIONS,
+    )
+
+    # Private user-data stream keeps balances hot in memory and Redis; the
+    # signed account endpoint is then only hit for periodic reconciliation.
+    from src.app.application.account.balance_stream import balance_stream
+
+    if config.MEXC_BALANCE_STREAM and config.MEXC_API_KEY and config.MEXC_SECRET_KEY:
+        balance_stream.start(mexc_client, redis_client)
+
+    # One shared upstream for in-process market data subscribers (feeds,
+    # dashboards); channels are opened lazily on first subscription.
+    from src.app.infrastructure.external.mexc.websocket import market_hub
+
+    market_hub.configure(max_per_connection=config.MEXC_WS_MAX_SUBSCRIPTIONS)
+
+    async def warmup_mexc_api():
+        logger.info("Warming up MEXC API connection pool...")
+        if await mexc_client.warmup(timeout=3.0):
             logger.info("MEXC API connection successful")
-        except asyncio.TimeoutError:
-            logger.warning("MEXC API connection timeout - continuing anyway")
-        except Exception as e:
-            logger.warning(f"MEXC API connection test failed: {e} - continuing anyway")
+        else:
+            logger.warning("MEXC API warm-up failed - continuing anyway")
 
-    # Schedule background task without awaiting
-    asyncio.create_task(test_mexc_api())
+    # Schedule warm-up without awaiting (non-blocking startup)
+    asyncio.create_task(warmup_mexc_api())
 
     yield
 
     # Shutdown
     logger.info("Shutting down QRL Trading API...")
 
+    await balance_stream.stop()
+    await order_books.stop()
+    await market_hub.close()
+    stop_recording()
+    await stream_monitor.stop_reporting()
+
     try:
         await mexc_client.close()
     except Exception as e:
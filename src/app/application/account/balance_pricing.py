@@ -0,0 +1,37 @@
+"""
+Fresh QRL price for balance snapshots served from the user-data stream.
+
+Pushes keep amounts hot, but the price stored by the last REST reconcile
+can be minutes old. A synced order book gives a live mid; otherwise the
+ticker is fetched per request. ``None`` means no fresh price, so callers
+fall back to the full REST snapshot.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Optional
+
+from src.app.infrastructure.external import QRL_USDT_SYMBOL
+from src.app.infrastructure.external.mexc.orderbook import order_books
+from src.app.infrastructure.utils import safe_float
+
+logger = logging.getLogger(__name__)
+
+
+async def fresh_qrl_price(mexc_client) -> Optional[float]:
+    book = order_books.get(QRL_USDT_SYMBOL)
+    if book is not None and book.synced and book.mid_price():
+        return book.mid_price()
+    if mexc_client is None:
+        return None
+    try:
+        async with mexc_client:
+            ticker = await mexc_client.get_ticker_price(QRL_USDT_SYMBOL)
+    except Exception as exc:
+        logger.warning(f"QRL ticker refresh failed: {exc}")
+        return None
+    price = safe_float(ticker.get("price"))
+    return price if price > 0 else None
+
+
+__all__ = ["fresh_qrl_price"]
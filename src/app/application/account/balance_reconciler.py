@@ -0,0 +1,51 @@
+"""
+REST reconciliation and Redis write-through for :class:`LiveBalances`.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from src.app.application.account.live_balances import LiveBalances
+
+logger = logging.getLogger(__name__)
+
+
+class BalanceReconciler:
+    def __init__(self, state: LiveBalances, mexc_client, redis_client, interval: float):
+        self.state = state
+        self.mexc = mexc_client
+        self.redis = redis_client
+        self.interval = interval
+
+    async def reconcile(self) -> None:
+        """Reload balances and price from REST (one signed account call)."""
+        as_of = int(time.time() * 1000)
+        async with self.mexc:
+            snapshot = await self.mexc.get_balance_snapshot()
+        self.state.load(snapshot, as_of)
+        await self.publish()
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.reconcile()
+            except Exception as exc:
+                logger.warning(f"Balance reconciliation failed: {exc}")
+            await asyncio.sleep(self.interval)
+
+    async def publish(self) -> None:
+        """Write the current state through to the Redis balance cache."""
+        if not self.redis:
+            return
+        snapshot = self.state.snapshot()
+        try:
+            ttl = int(2 * self.interval)
+            await self.redis.set_cached_account_balance(snapshot, ttl=ttl)
+            await self.redis.set_mexc_account_balance(snapshot["balances"])
+        except Exception as exc:  # pragma: no cover - best-effort caching
+            logger.debug(f"Skipping balance cache write: {exc}")
+
+
+__all__ = ["BalanceReconciler"]
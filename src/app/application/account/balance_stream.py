@@ -0,0 +1,104 @@
+"""
+Private user-data stream that keeps account balances hot.
+
+``privateAccount`` pushes update :class:`LiveBalances` and are written
+through to the Redis cache; a REST snapshot seeds and reconciles it every
+``reconcile_interval`` seconds.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, Dict, List, Optional
+
+from src.app.application.account.balance_pricing import fresh_qrl_price
+from src.app.application.account.balance_reconciler import BalanceReconciler
+from src.app.application.account.live_balances import LiveBalances
+from src.app.application.market.ws_supervisor import MarketStreamSupervisor
+from src.app.infrastructure.config import config
+from src.app.infrastructure.external.mexc.websocket.push_records import AccountPush
+from src.app.infrastructure.external.mexc.ws.user_stream_session import (
+    UserStreamSession,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BalanceStream:
+    def __init__(self, reconcile_interval: float = 300.0, heartbeat_timeout: float = 60.0):
+        self.reconcile_interval = reconcile_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.state = LiveBalances()
+        self.events = {"privateDeals": 0, "privateOrders": 0}
+        self.reconciler: Optional[BalanceReconciler] = None
+        self._supervisor: Optional[MarketStreamSupervisor] = None
+        self._tasks: List[asyncio.Task] = []
+
+    @property
+    def live(self) -> bool:
+        """Connected and reconciled within two reconcile intervals."""
+        if self._supervisor is None or not self._supervisor.metrics.connected:
+            return False
+        return self.state.age() < 2 * self.reconcile_interval
+
+    def start(self, mexc_client, redis_client=None) -> None:
+        if self._supervisor is not None:
+            return
+        self.reconciler = BalanceReconciler(
+            self.state, mexc_client, redis_client, self.reconcile_interval
+        )
+        self._supervisor = MarketStreamSupervisor(
+            UserStreamSession(mexc_client),
+            self.on_message,
+            heartbeat_timeout=self.heartbeat_timeout,
+        )
+        self._tasks = [
+            asyncio.create_task(self._supervisor.run()),
+            asyncio.create_task(self.reconciler.run()),
+        ]
+        logger.info("Balance user-data stream started")
+
+    async def stop(self) -> None:
+        supervisor, self._supervisor = self._supervisor, None
+        if supervisor is not None:
+            supervisor.stop()
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        if supervisor is not None:
+            await supervisor.ws_client.close()
+
+    async def on_message(self, message: Any) -> None:
+        if isinstance(message, AccountPush):
+            if self.state.apply(message) and self.state.loaded:
+                await self.reconciler.publish()
+            return
+        for kind in self.events:
+            if isinstance(message, dict) and kind in message:
+                self.events[kind] += 1
+
+    async def snapshot(self, mexc_client=None) -> Optional[Dict[str, Any]]:
+        """Hot snapshot at a fresh price; ``None`` if not live or unpriced."""
+        if not self.live:
+            return None
+        price = await fresh_qrl_price(mexc_client)
+        return self.state.snapshot(price) if price is not None else None
+
+    def status(self) -> Dict[str, Any]:
+        supervisor = self._supervisor
+        return {
+            "live": self.live,
+            "pushes": self.state.pushes,
+            "stale_pushes": self.state.stale_pushes,
+            "events": dict(self.events),
+            "stream": supervisor.metrics.snapshot() if supervisor else None,
+        }
+
+
+balance_stream = BalanceStream(config.MEXC_BALANCE_RECONCILE)
+
+__all__ = ["BalanceStream", "balance_stream"]
@@ -0,0 +1,30 @@
+"""
+BalanceService that answers from the private user-data stream.
+
+While :data:`balance_stream` is live its snapshot (priced fresh per
+request) is served with ``source="stream"``; otherwise, or without API
+credentials, the REST/cache path of :class:`BalanceService` runs.
+"""
+from datetime import datetime
+from typing import Any, Dict
+
+from src.app.application.account.balance_service import BalanceService
+from src.app.application.account.balance_stream import balance_stream
+
+
+class LiveBalanceService(BalanceService):
+    def __init__(self, mexc_client, redis_client, cache_ttl: int = 45, live=None):
+        super().__init__(mexc_client, redis_client, cache_ttl)
+        self.live = live or balance_stream
+
+    async def get_account_balance(self) -> Dict[str, Any]:
+        if self._has_credentials():
+            snapshot = await self.live.snapshot(self.mexc)
+            if snapshot is not None:
+                now = datetime.now().isoformat()
+                snapshot.update({"success": True, "source": "stream", "timestamp": now})
+                return snapshot
+        return await super().get_account_balance()
+
+
+__all__ = ["LiveBalanceService"]
@@ -0,0 +1,88 @@
+"""
+In-memory account balances fed by REST snapshots and private account pushes.
+
+``privateAccount`` pushes carry absolute free/locked amounts, so applying one
+is an overwrite, not a sum: a push older than what we hold is dropped, and a
+REST reload never clobbers an asset that a newer push already updated.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from src.app.infrastructure.external import QRL_USDT_SYMBOL
+
+TRACKED_ASSETS = ("QRL", "USDT")
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class LiveBalances:
+    def __init__(self) -> None:
+        # asset -> (free, locked, as-of ms)
+        self._assets: Dict[str, Tuple[float, float, int]] = {}
+        self._price: Optional[float] = None
+        self.loaded_at: Optional[int] = None
+        self.updated_at: Optional[int] = None
+        self.pushes = 0
+        self.stale_pushes = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self.loaded_at is not None
+
+    def age(self) -> float:
+        """Seconds since the last REST load (``inf`` before the first)."""
+        if self.loaded_at is None:
+            return float("inf")
+        return (_now_ms() - self.loaded_at) / 1000
+
+    def load(self, snapshot: Dict[str, Any], as_of_ms: int) -> None:
+        """Reset from a REST snapshot requested at ``as_of_ms``."""
+        for item in snapshot.get("raw", {}).get("balances", []):
+            asset = item.get("asset")
+            current = self._assets.get(asset)
+            if not asset or (current and current[2] > as_of_ms):
+                continue
+            free, locked = float(item.get("free") or 0), float(item.get("locked") or 0)
+            self._assets[asset] = (free, locked, as_of_ms)
+        price = snapshot.get("prices", {}).get(QRL_USDT_SYMBOL)
+        if price is not None:
+            self._price = float(price)
+        self.loaded_at = self.updated_at = _now_ms()
+
+    def apply(self, push) -> bool:
+        """Apply an ``AccountPush``; ``False`` if it is older than our state."""
+        current = self._assets.get(push.asset)
+        if current and push.time < current[2]:
+            self.stale_pushes += 1
+            return False
+        self._assets[push.asset] = (push.free, push.locked, push.time)
+        self.pushes += 1
+        self.updated_at = _now_ms()
+        return True
+
+    def snapshot(self, price: Optional[float] = None) -> Dict[str, Any]:
+        """Same shape as ``get_balance_snapshot`` (balances, prices, raw)."""
+        price = self._price if price is None else price
+        balances: Dict[str, Dict[str, Any]] = {}
+        for asset in TRACKED_ASSETS:
+            free, locked, _ = self._assets.get(asset, (0.0, 0.0, 0))
+            balances[asset] = {
+                "free": str(free), "locked": str(locked), "total": free + locked
+            }
+        raw = [
+            {"asset": asset, "free": str(free), "locked": str(locked)}
+            for asset, (free, locked, _) in sorted(self._assets.items())
+        ]
+        balances["QRL"]["price"] = price
+        return {
+            "balances": balances,
+            "prices": {QRL_USDT_SYMBOL: price},
+            "raw": {"balances": raw, "updateTime": self.updated_at},
+        }
+
+
+__all__ = ["LiveBalances", "TRACKED_ASSETS"]
@@ -12,7 +12,10 @@ from fastapi import Header, HTTPException, params
 
 from src.app.infrastructure.config import config
 from src.app.infrastructure.external import mexc_client, redis_client
-from src.app.application.account.balance_service import BalanceService
+from src.app.infrastructure.external.mexc.deadline import deadline_scope
+from src.app.infrastructure.external.mexc.records import AccountRecord
+from src.app.application.account.live_balance_service import LiveBalanceService
+from src.app.application.account.value_portfolio import value_portfolio
 
 logger = logging.getLogger(__name__)
 
@@ -45,9 +48,11 @@ async def task_sync_balance(
             )
             return {"status": "skipped", "reason": "API keys not configured"}
 
-        # Use encapsulated BalanceService instead of direct API calls
-        balance_service = BalanceService(mexc_client, redis_client)
-        snapshot = await balance_service.get_account_balance()
+        # Use encapsulated LiveBalanceService instead of direct API calls; it
+        # answers from the user-data stream without a signed call when live
+        balance_service = LiveBalanceService(mexc_client, redis_client)
+        with deadline_scope(config.MEXC_TASK_DEADLINE) as deadline:
+            snapshot = await balance_service.get_account_balance()
 
         # Extract QRL and USDT balances from snapshot
         qrl_data = snapshot.get("balances", {}).get("QRL", {})
@@ -56,20 +61,18 @@ async def task_sync_balance(
         qrl_balance = float(qrl_data.get("free", 0))
         usdt_balance = float(usdt_data.get("free", 0))
 
-        # Count all non-zero assets from raw account info
-        all_balances = {}
-        raw_account = snapshot.get("raw", {})
-        for balance in raw_account.get("balances", []):
-            asset = balance.get("asset")
-            free = float(balance.get("free", 0))
-            locked = float(balance.get("locked", 0))
-
-            if free > 0 or locked > 0:
-                all_balances[asset] = {
-                    "free": str(free),
-                    "locked": str(locked),
-                    "total": str(free + locked),
-                }
+        # Count all non-zero assets from raw account info (decoded once)
+        account = AccountRecord.from_raw(snapshot.get("raw", {}))
+        all_balances = {
+            asset: {
+                "free": str(record.free),
+                "locked": str(record.locked),
+                "total": str(record.total),
+            }
+            for asset, record in account.non_zero().items()
+        }
+        with deadline_scope(deadline.remaining()):
+            total_value_usdt = await value_portfolio(mexc_client, account)
 
         logger.info(
             "[Cloud Task] Balance synced (via BalanceService) - "
@@ -81,9 +84,11 @@ async def task_sync_balance(
             "status": "success",
             "task": "01-min-job",
             "data": {
+                "source": snapshot.get("source"),
                 "qrl_balance": qrl_balance,
                 "usdt_balance": usdt_balance,
                 "total_assets": len(all_balances),
+                "total_value_usdt": total_value_usdt,
             },
             "timestamp": datetime.now().isoformat(),
         }
@@ -0,0 +1,30 @@
+"""
+Portfolio valuation use case - value all assets from one market snapshot.
+"""
+
+import logging
+from typing import Optional
+
+from src.app.infrastructure.external.mexc.records import AccountRecord
+
+logger = logging.getLogger(__name__)
+
+
+async def value_portfolio(
+    mexc_client, account: AccountRecord, quote: str = "USDT"
+) -> Optional[float]:
+    """Value every non-zero asset in ``quote`` with a single all-ticker call."""
+    try:
+        snapshot = await mexc_client.get_market_snapshot()
+    except Exception as exc:  # pragma: no cover - network call
+        logger.warning(f"Portfolio valuation skipped: {exc}")
+        return None
+    total = 0.0
+    for asset, record in account.non_zero().items():
+        value = snapshot.value_in(asset, record.total, quote)
+        if value is not None:
+            total += value
+    return total
+
+
+__all__ = ["value_portfolio"]
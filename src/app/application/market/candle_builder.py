@@ -0,0 +1,103 @@
+"""
+Candle Builder - trade ticks / kline pushes → epoch-aligned OHLCV bars.
+
+Bars close by time as well as by data: ``on_time`` closes every bar whose
+end has passed even without trades, emitting flat zero-volume bars for
+silent intervals so downstream timeframe counts stay exact.
+"""
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from src.app.application.market.timeframe_aggregator import MarketCandle
+
+
+def to_millis(timestamp: float) -> int:
+    """MEXC mixes second (kline windows) and millisecond (deals) stamps."""
+    return int(timestamp * 1000) if timestamp < 1e11 else int(timestamp)
+
+
+class _Bar:
+    __slots__ = ("start", "open", "high", "low", "close", "volume")
+
+    def __init__(self, start: int, price: float, volume: float = 0.0):
+        self.start = start
+        self.open = self.high = self.low = self.close = price
+        self.volume = volume
+
+
+class CandleBuilder:
+    def __init__(self, symbol: str, interval_seconds: int = 60):
+        self.symbol = symbol
+        self.interval_ms = interval_seconds * 1000
+        self.late_ticks = 0
+        self._bar: Optional[_Bar] = None
+        self._closed_until = 0  # end of the last emitted bar (ms)
+        self._last_close: Optional[float] = None
+
+    def _align(self, ts_ms: int) -> int:
+        return ts_ms - ts_ms % self.interval_ms
+
+    def _candle(self, bar: _Bar) -> MarketCandle:
+        closed_at = (bar.start + self.interval_ms) / 1000
+        return MarketCandle(
+            self.symbol, bar.open, bar.high, bar.low, bar.close, bar.volume,
+            datetime.fromtimestamp(closed_at, tz=timezone.utc),
+        )
+
+    def on_time(self, now_ms: int) -> List[MarketCandle]:
+        """Close every bar that ended at or before ``now_ms``."""
+        boundary = self._align(now_ms)
+        closed: List[MarketCandle] = []
+        if self._bar is not None and self._bar.start < boundary:
+            closed.append(self._candle(self._bar))
+            self._last_close = self._bar.close
+            self._closed_until = self._bar.start + self.interval_ms
+            self._bar = None
+        if self._last_close is not None and self._closed_until:
+            while self._closed_until < boundary:
+                flat = _Bar(self._closed_until, self._last_close)
+                closed.append(self._candle(flat))
+                self._closed_until += self.interval_ms
+        return closed
+
+    def _open(self, ts_ms: int) -> Optional[List[MarketCandle]]:
+        """Close older bars for ``ts_ms``; ``None`` if the tick is late."""
+        if ts_ms < self._closed_until:
+            self.late_ticks += 1
+            return None
+        return self.on_time(ts_ms)
+
+    def on_trade(self, price: float, quantity: float, ts_ms: int) -> List[MarketCandle]:
+        closed = self._open(ts_ms)
+        if closed is None:
+            return []
+        bar = self._bar
+        if bar is None:
+            self._bar = _Bar(self._align(ts_ms), price, quantity)
+            return closed
+        bar.high, bar.low = max(bar.high, price), min(bar.low, price)
+        bar.close = price
+        bar.volume += quantity
+        return closed
+
+    def on_kline(self, push) -> List[MarketCandle]:
+        """Apply a kline push; each push restates its whole window."""
+        start = self._align(to_millis(push.open_time))
+        closed = self._open(start)
+        if closed is None:
+            return []
+        bar = self._bar or _Bar(start, push.open)
+        bar.open, bar.high, bar.low = push.open, push.high, push.low
+        bar.close, bar.volume = push.close, push.volume
+        self._bar = bar
+        return closed
+
+    def provisional(self) -> Optional[MarketCandle]:
+        """Snapshot of the in-progress bar, if any."""
+        return self._candle(self._bar) if self._bar is not None else None
+
+    def next_close_ms(self, now_ms: int) -> int:
+        return self._align(now_ms) + self.interval_ms
+
+
+__all__ = ["CandleBuilder", "to_millis"]
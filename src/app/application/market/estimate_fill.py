@@ -0,0 +1,73 @@
+"""
+Market use case - estimate the cost of filling a market order.
+
+Walks the live local order book when it is in sync; otherwise builds a
+one-off book from a REST depth snapshot.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict
+
+from src.app.infrastructure.external.mexc.orderbook import (
+    BUY,
+    SELL,
+    SNAPSHOT_LIMIT,
+    OrderBook,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def estimate_fill(
+    symbol: str, side: str, quantity: float, mexc_client, book=None
+) -> Dict[str, Any]:
+    """
+    Estimate average price, worst price and total cost for ``quantity``.
+
+    Args:
+        symbol: Trading pair symbol (e.g., "QRLUSDT")
+        side: "BUY" (walks the asks) or "SELL" (walks the bids)
+        quantity: Base-asset quantity to fill
+        mexc_client: MEXC API client used when no live book is available
+        book: Synced local OrderBook (optional)
+
+    Raises:
+        ValueError: If side or quantity is invalid
+    """
+    side = side.upper()
+    if side not in (BUY, SELL):
+        raise ValueError(f"side must be {BUY} or {SELL}")
+    if quantity <= 0:
+        raise ValueError("quantity must be positive")
+
+    source = "stream"
+    if book is None or not book.synced:
+        source = "api"
+        async with mexc_client:
+            snapshot = await mexc_client.get_order_book(symbol, SNAPSHOT_LIMIT)
+        book = OrderBook.from_snapshot(symbol, snapshot)
+
+    estimate = book.cost_to_fill(side, quantity)
+    mid = book.mid_price()
+    slippage_pct = None
+    if mid and estimate.filled > 0:
+        slippage_pct = abs(estimate.avg_price - mid) / mid * 100
+    return {
+        "success": True,
+        "source": source,
+        "symbol": symbol,
+        "side": side,
+        "requested": estimate.requested,
+        "filled": estimate.filled,
+        "complete": estimate.complete,
+        "cost": estimate.cost,
+        "avg_price": estimate.avg_price,
+        "worst_price": estimate.worst_price,
+        "levels": estimate.levels,
+        "mid_price": mid,
+        "slippage_pct": slippage_pct,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+__all__ = ["estimate_fill"]
@@ -3,8 +3,13 @@ Market klines (candlestick) use case - get historical OHLCV data.
 """
 import logging
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any, Optional
 
+from src.app.application.market.stale_fallback import SOURCE_CACHE, fetch_or_stale
+from src.app.infrastructure.config import config
+from src.app.infrastructure.external.mexc.records import KlineRecord
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,6 +20,7 @@ async def get_klines(
     limit: int = 100,
     start_time: Optional[int] = None,
     end_time: Optional[int] = None,
+    cache=None,
 ) -> Dict[str, Any]:
     """
     Get candlestick (kline) data for a symbol from MEXC API.
@@ -26,6 +32,8 @@ async def get_klines(
         limit: Number of klines to return (default: 100)
         start_time: Start time in milliseconds (optional)
         end_time: End time in milliseconds (optional)
+        cache: Market cache used while the MEXC circuit is open (optional,
+            latest window only)
         
     Returns:
         Dict with klines data array and metadata
@@ -39,34 +47,35 @@ async def get_klines(
     if not symbol or not symbol.isupper():
         symbol = symbol.upper()
     
+    read_cache = write_cache = None
+    # Only the latest window is cached, so ranged queries never fall back.
+    if cache is not None and start_time is None and end_time is None:
+        read_cache = partial(cache.get_klines, symbol, interval)
+        write_cache = partial(
+            cache.set_klines, symbol, interval, ttl=config.CACHE_TTL_KLINES
+        )
+
     async with mexc_client:
-        klines_raw = await mexc_client.get_klines(
-            symbol=symbol,
-            interval=interval,
-            limit=limit,
-            start_time=start_time,
-            end_time=end_time,
+        klines_raw, source = await fetch_or_stale(
+            lambda: mexc_client.get_klines(
+                symbol=symbol,
+                interval=interval,
+                limit=limit,
+                start_time=start_time,
+                end_time=end_time,
+            ),
+            read_cache,
+            write_cache,
         )
         
-        # Parse K-line arrays into structured format
+        # Parse K-line arrays into structured format (floats converted once)
         # MEXC returns: [[openTime, open, high, low, close, volume, closeTime, quoteVolume, ...]]
-        klines = [
-            {
-                "open_time": int(k[0]),
-                "open": float(k[1]),
-                "high": float(k[2]),
-                "low": float(k[3]),
-                "close": float(k[4]),
-                "volume": float(k[5]),
-                "close_time": int(k[6]),
-                "quote_volume": float(k[7]) if len(k) > 7 else 0.0,
-            }
-            for k in klines_raw
-        ]
+        klines = [KlineRecord.from_raw(k).as_dict() for k in klines_raw]
         
         return {
             "success": True,
-            "source": "api",
+            "source": source,
+            "stale": source == SOURCE_CACHE,
             "symbol": symbol,
             "interval": interval,
             "data": klines,
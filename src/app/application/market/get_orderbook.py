@@ -3,19 +3,51 @@ Market orderbook use case - get order book depth for a symbol.
 """
 import logging
 from datetime import datetime
-from typing import Dict, Any
+from functools import partial
+from typing import Any, Dict, List
+
+from src.app.application.market.stale_fallback import SOURCE_CACHE, fetch_or_stale
+from src.app.infrastructure.external.mexc.records import DepthRecord
 
 logger = logging.getLogger(__name__)
 
+SOURCE_STREAM = "stream"
+
+
+def _levels(levels) -> List[Dict[str, float]]:
+    return [
+        {"price": price, "quantity": quantity, "total": price * quantity}
+        for price, quantity in levels
+    ]
+
+
+def orderbook_from_book(symbol: str, book, limit: int = 20) -> Dict[str, Any]:
+    """Render a live local order book in the REST response shape."""
+    top = book.top(limit)
+    return {
+        "success": True,
+        "source": SOURCE_STREAM,
+        "stale": False,
+        "symbol": symbol,
+        "version": book.version,
+        "bids": _levels(top["bids"]),
+        "asks": _levels(top["asks"]),
+        "timestamp": datetime.now().isoformat(),
+    }
+
 
-async def get_orderbook(symbol: str, mexc_client, limit: int = 20) -> Dict[str, Any]:
+async def get_orderbook(
+    symbol: str, mexc_client, limit: int = 20, cache=None, book=None
+) -> Dict[str, Any]:
     """
-    Get order book depth for a symbol from MEXC API.
+    Get order book depth for a symbol, from the live book when it is in sync.
     
     Args:
         symbol: Trading pair symbol (e.g., "QRLUSDT")
         mexc_client: MEXC API client instance
         limit: Number of bids/asks to return (default: 20)
+        cache: Market cache used while the MEXC circuit is open (optional)
+        book: Synced local OrderBook; skips the REST call when given (optional)
         
     Returns:
         Dict with orderbook data including bids, asks, and timestamp
@@ -23,27 +55,30 @@ async def get_orderbook(symbol: str, mexc_client, limit: int = 20) -> Dict[str,
     Raises:
         Exception: If API call fails
     """
+    if book is not None and book.synced:
+        return orderbook_from_book(symbol, book, limit)
+
     logger.info(f"Fetching orderbook for {symbol} from MEXC API (limit={limit})")
     
+    read_cache = write_cache = None
+    if cache is not None:
+        read_cache = partial(cache.get_orderbook, symbol)
+        write_cache = partial(cache.set_orderbook, symbol)
+
     async with mexc_client:
-        depth_data = await mexc_client.get_orderbook(symbol, limit=limit)
-        
-        # Parse bid/ask arrays into structured format
-        # MEXC returns: [[price, quantity], ...]
-        bids = [
-            {"price": float(bid[0]), "quantity": float(bid[1]), "total": float(bid[0]) * float(bid[1])}
-            for bid in depth_data.get("bids", [])
-        ]
-        asks = [
-            {"price": float(ask[0]), "quantity": float(ask[1]), "total": float(ask[0]) * float(ask[1])}
-            for ask in depth_data.get("asks", [])
-        ]
-        
+        depth_data, source = await fetch_or_stale(
+            lambda: mexc_client.get_orderbook(symbol, limit=limit),
+            read_cache,
+            write_cache,
+        )
+        depth = DepthRecord.from_raw(depth_data)
+
         return {
             "success": True,
-            "source": "api",
+            "source": source,
+            "stale": source == SOURCE_CACHE,
             "symbol": symbol,
-            "bids": bids,
-            "asks": asks,
+            "bids": _levels(depth.bids),
+            "asks": _levels(depth.asks),
             "timestamp": datetime.now().isoformat(),
         }
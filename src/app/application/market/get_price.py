@@ -5,16 +5,20 @@ import logging
 from datetime import datetime
 from typing import Dict, Any
 
+from src.app.application.market.stale_fallback import SOURCE_CACHE, fetch_or_stale
+from src.app.infrastructure.external.mexc.records import TickerRecord
+
 logger = logging.getLogger(__name__)
 
 
-async def get_price(symbol: str, mexc_client) -> Dict[str, Any]:
+async def get_price(symbol: str, mexc_client, cache=None) -> Dict[str, Any]:
     """
     Get current price for a symbol from MEXC API.
     
     Args:
         symbol: Trading pair symbol (e.g., "QRLUSDT")
         mexc_client: MEXC API client instance
+        cache: Market cache used while the MEXC circuit is open (optional)
         
     Returns:
         Dict with price data including symbol, price, and timestamp
@@ -24,13 +28,20 @@ async def get_price(symbol: str, mexc_client) -> Dict[str, Any]:
     """
     logger.info(f"Fetching price for {symbol} from MEXC API")
     
+    async def cached_price():
+        ticker = await cache.get_ticker_24hr(symbol) if cache else None
+        return {"price": TickerRecord.from_raw(ticker).last_price} if ticker else None
+
     async with mexc_client:
-        price_data = await mexc_client.get_ticker_price(symbol)
+        price_data, source = await fetch_or_stale(
+            lambda: mexc_client.get_ticker_price(symbol), cached_price
+        )
         price = float(price_data.get("price", 0))
         
         return {
             "success": True,
-            "source": "api",
+            "source": source,
+            "stale": source == SOURCE_CACHE,
             "symbol": symbol,
             "price": str(price),
             "timestamp": datetime.now().isoformat(),
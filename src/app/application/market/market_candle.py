@@ -0,0 +1,18 @@
+"""Immutable market candle shared by the feeds and the aggregators."""
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class MarketCandle:
+    """Immutable market candle data (DTO from ✨.md)."""
+    symbol: str
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    closed_at: datetime
+
+
+__all__ = ["MarketCandle"]
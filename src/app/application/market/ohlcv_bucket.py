@@ -0,0 +1,55 @@
+"""
+Running OHLCV accumulator for one timeframe bucket.
+
+Folding a candle in is a handful of comparisons; nothing is buffered, and
+``len()`` reports how many inputs the open bucket has absorbed.
+"""
+from typing import Optional, Tuple
+
+
+class OHLCVBucket:
+    __slots__ = (
+        "size", "warm", "symbol", "end", "head", "count",
+        "open", "high", "low", "close", "volume",
+    )
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.warm = False  # a bucket has been emitted before
+        self.symbol = ""
+        self.end = self.head = self.count = 0
+        self.open = self.high = self.low = self.close = self.volume = 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def add(self, candle, end: int, start: int) -> None:
+        """Fold ``candle`` (covering ``start``..its close) into bucket ``end``."""
+        if not self.count:
+            self.symbol, self.end, self.head = candle.symbol, end, start
+            self.open, self.high, self.low = candle.open, candle.high, candle.low
+            self.volume = 0.0
+        else:
+            if candle.high > self.high:
+                self.high = candle.high
+            if candle.low < self.low:
+                self.low = candle.low
+        self.close = candle.close
+        self.volume += candle.volume
+        self.count += 1
+
+    def take(self) -> Optional[Tuple[float, float, float, float, float]]:
+        """OHLCV of the bucket, emptying it.
+
+        ``None`` for a leading bucket whose first input started after the
+        bucket did: the stream was joined mid-bucket, so the bar is partial.
+        """
+        self.count = 0
+        joined_late = not self.warm and self.head != self.end - self.size
+        self.warm = True
+        if joined_late:
+            return None
+        return self.open, self.high, self.low, self.close, self.volume
+
+
+__all__ = ["OHLCVBucket"]
@@ -0,0 +1,45 @@
+"""
+Market read helper that serves cached values while MEXC is failing.
+
+When the client's market circuit is open, reads come from the Redis market
+cache instead of waiting on the exchange; successful live reads refresh it.
+"""
+import logging
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from src.app.infrastructure.external.mexc.exceptions import MexcCircuitOpen
+
+logger = logging.getLogger(__name__)
+
+SOURCE_API = "api"
+SOURCE_CACHE = "cache"
+
+
+async def fetch_or_stale(
+    fetch: Callable[[], Awaitable[Any]],
+    read_cache: Optional[Callable[[], Awaitable[Any]]] = None,
+    write_cache: Optional[Callable[[Any], Awaitable[Any]]] = None,
+) -> Tuple[Any, str]:
+    """
+    Run ``fetch``; fall back to ``read_cache`` if the circuit is open.
+
+    Returns:
+        ``(data, source)`` where source is ``"api"`` or ``"cache"`` (stale)
+
+    Raises:
+        MexcCircuitOpen: If the circuit is open and nothing is cached
+    """
+    try:
+        data = await fetch()
+    except MexcCircuitOpen as exc:
+        cached = await read_cache() if read_cache is not None else None
+        if cached is None:
+            raise
+        logger.warning(f"{exc}; serving stale cached market data")
+        return cached, SOURCE_CACHE
+    if write_cache is not None:
+        await write_cache(data)
+    return data, SOURCE_API
+
+
+__all__ = ["fetch_or_stale", "SOURCE_API", "SOURCE_CACHE"]
@@ -0,0 +1,95 @@
+"""
+Connection health metrics and reconnect backoff for market streams.
+"""
+from __future__ import annotations
+
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+def jittered_backoff(
+    attempt: int,
+    base: float,
+    cap: float,
+    rng: Optional[random.Random] = None,
+) -> float:
+    """
+    Exponential backoff with equal jitter: half fixed, half random.
+
+    Spreads reconnects of many supervisors after a shared outage while
+    still waiting at least ``base * 2**attempt / 2`` (capped).
+    """
+    ceiling = min(cap, base * (2 ** max(attempt, 0)))
+    return ceiling / 2 + (rng or random).uniform(0, ceiling / 2)
+
+
+@dataclass(slots=True)
+class StreamMetrics:
+    connects: int = 0
+    reconnects: int = 0
+    stale_timeouts: int = 0
+    messages: int = 0
+    total_downtime: float = 0.0
+    last_downtime: Optional[float] = None
+    time_to_first_message: Optional[float] = None
+    last_error: Optional[str] = None
+    _connected_at: Optional[float] = field(default=None, repr=False)
+    _down_since: Optional[float] = field(default=None, repr=False)
+    _awaiting_first: bool = field(default=False, repr=False)
+
+    def on_connect(self) -> None:
+        now = time.monotonic()
+        self.connects += 1
+        self._connected_at = now
+        self._awaiting_first = True
+
+    def on_message(self) -> None:
+        self.messages += 1
+        if not self._awaiting_first:
+            return
+        now = time.monotonic()
+        self._awaiting_first = False
+        self.time_to_first_message = now - (self._connected_at or now)
+        if self._down_since is not None:
+            self.last_downtime = now - self._down_since
+            self.total_downtime += self.last_downtime
+            self._down_since = None
+
+    def on_disconnect(
+        self, error: Optional[BaseException] = None, since: Optional[float] = None
+    ) -> None:
+        """
+        Downtime runs from ``since`` (last data seen, monotonic) or now until
+        the next connection delivers data.
+        """
+        if self._down_since is None:
+            self._down_since = time.monotonic() if since is None else since
+        self.reconnects += 1
+        self._connected_at = None
+        self._awaiting_first = False
+        if error is not None:
+            self.last_error = f"{type(error).__name__}: {error}"
+
+    @property
+    def connected(self) -> bool:
+        return self._connected_at is not None
+
+    def snapshot(self) -> Dict[str, Any]:
+        down = self._down_since
+        return {
+            "connected": self.connected,
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "stale_timeouts": self.stale_timeouts,
+            "messages": self.messages,
+            "total_downtime": round(self.total_downtime, 3),
+            "last_downtime": self.last_downtime,
+            "current_downtime": None if down is None else time.monotonic() - down,
+            "time_to_first_message": self.time_to_first_message,
+            "last_error": self.last_error,
+        }
+
+
+__all__ = ["StreamMetrics", "jittered_backoff"]
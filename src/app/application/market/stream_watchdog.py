@@ -0,0 +1,73 @@
+"""
+Consume a market stream under an independent data-flow watchdog.
+
+The watchdog runs as its own task, so a stream that silently stalls inside
+``recv`` is still cancelled after ``timeout`` seconds without data. Time
+spent inside the message handler does not count as a stall.
+"""
+import asyncio
+import time
+from contextlib import suppress
+from typing import Awaitable, Callable, Optional
+
+from src.app.application.market.stream_metrics import StreamMetrics
+
+
+class StaleStreamError(RuntimeError):
+    """No data arrived within the heartbeat timeout."""
+
+
+class StreamWatch:
+    def __init__(
+        self,
+        timeout: float,
+        metrics: StreamMetrics,
+        on_data: Optional[Callable[[], None]] = None,
+    ):
+        self.timeout = timeout
+        self.metrics = metrics
+        self._on_data = on_data
+        self.last_data = time.monotonic()
+        self._busy = False
+
+    async def run(self, stream, on_message: Callable[..., Awaitable]) -> None:
+        """Consume until the stream ends (returns) or goes stale (raises)."""
+        self.last_data = time.monotonic()
+        consumer = asyncio.create_task(self._consume(stream, on_message))
+        watchdog = asyncio.create_task(self._watchdog())
+        try:
+            done, _ = await asyncio.wait(
+                {consumer, watchdog}, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            for task in (consumer, watchdog):
+                task.cancel()
+            for task in (consumer, watchdog):
+                with suppress(asyncio.CancelledError):
+                    await task
+        for task in done:
+            task.result()
+
+    async def _consume(self, stream, on_message) -> None:
+        async for message in stream:
+            self.last_data = time.monotonic()
+            self.metrics.on_message()
+            if self._on_data is not None:
+                self._on_data()
+            self._busy = True
+            try:
+                await on_message(message)
+            finally:
+                self._busy = False
+                self.last_data = time.monotonic()
+
+    async def _watchdog(self) -> None:
+        while True:
+            idle = 0.0 if self._busy else time.monotonic() - self.last_data
+            if idle >= self.timeout:
+                self.metrics.stale_timeouts += 1
+                raise StaleStreamError(f"Heartbeat timeout - no data for {idle:.1f}s")
+            await asyncio.sleep(self.timeout - idle)
+
+
+__all__ = ["StaleStreamError", "StreamWatch"]
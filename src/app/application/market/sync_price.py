@@ -8,7 +8,10 @@ from typing import Optional
 
 from fastapi import Header, HTTPException, params
 
+from src.app.infrastructure.config import config
 from src.app.infrastructure.external import mexc_client
+from src.app.infrastructure.external.mexc.deadline import deadline_scope
+from src.app.infrastructure.external.mexc.records import TickerRecord
 
 logger = logging.getLogger(__name__)
 
@@ -36,12 +39,15 @@ async def task_update_price(
 
     try:
         async with mexc_client:
-            ticker = await mexc_client.get_ticker_24hr("QRLUSDT")
-            price = float(ticker.get("lastPrice", 0))
-            volume_24h = float(ticker.get("volume", 0))
-            price_change_pct = float(ticker.get("priceChangePercent", 0))
-            high_24h = float(ticker.get("highPrice", 0))
-            low_24h = float(ticker.get("lowPrice", 0))
+            with deadline_scope(config.MEXC_TASK_DEADLINE):
+                ticker = TickerRecord.from_raw(
+                    await mexc_client.get_ticker_24hr("QRLUSDT")
+                )
+            price = ticker.last_price
+            volume_24h = ticker.volume
+            price_change_pct = ticker.price_change_percent
+            high_24h = ticker.high_price
+            low_24h = ticker.low_price
 
         logger.info(
             "[Cloud Task] Price fetched (Direct API) - "
@@ -1,133 +1,103 @@
 """
-Timeframe Aggregator - Multi-timeframe support from ✨.md
+Timeframe Aggregator - one base candle stream → epoch-aligned timeframes.
 
-Implements single WS → multiple timeframes pattern:
-- Single WS connection provides 1m candles
-- Aggregates into 5m, 15m, 1h etc.
-- Synchronizes strategy triggers across timeframes
+Every timeframe keeps a running ``OHLCVBucket`` for the bucket ending
+on the next multiple of its length since the epoch (:05/:15, UTC midnight
+for days), so each input is O(1) work. Timeframes cascade from the largest
+smaller one that divides them (1h from 15m). ``closed_at`` is the bar end,
+as ``CandleBuilder`` stamps it.
+
+A bucket is emitted when its last input arrives, when an input for a later
+bucket exposes a gap, or from ``on_time`` ``grace`` seconds after it ended
+(more than the feed's close delay). Inputs at or before the newest one
+seen are dropped and counted in ``late``.
 """
-from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from src.app.application.market.market_candle import MarketCandle
+from src.app.application.market.ohlcv_bucket import OHLCVBucket
+from src.app.application.market.timeframes import (
+    Timeframe,
+    bucket_end,
+    cascade,
+    epoch_seconds,
+    settled,
+    timeframe_seconds,
+)
 
-@dataclass(frozen=True)
-class MarketCandle:
-    """
-    Market candle data (DTO from ✨.md).
-    
-    Immutable data structure for market data.
-    """
-    symbol: str
-    open: float
-    high: float
-    low: float
-    close: float
-    volume: float
-    closed_at: datetime
+Completed = List[Tuple[Timeframe, MarketCandle]]
 
 
 class TimeframeAggregator:
     """
-    Aggregates 1-minute candles into multiple timeframes.
-    
-    From ✨.md Section 6.4:
-    ❌ Wrong: Open separate WS for each timeframe
-    ✅ Right: Single WS → time aggregation
-    
+    Timeframes are int minutes or ``"30s"``/``"4h"``/``"1d"``.
+
     Usage:
-        aggregator = TimeframeAggregator([1, 5, 15])
-        
+        aggregator = TimeframeAggregator([1, 5, 15, "1h"])
+
         for candle_1m in ws_stream:
-            completed = aggregator.on_candle(candle_1m)
-            for timeframe, merged_candle in completed:
-                await bot.on_market_tick(timeframe, merged_candle)
+            for timeframe, candle in aggregator.on_candle(candle_1m):
+                await bot.on_market_tick(timeframe, candle)
     """
 
-    def __init__(self, timeframes: List[int]):
-        """
-        Initialize aggregator.
-        
-        Args:
-            timeframes: List of timeframes in minutes (e.g., [1, 5, 15, 60])
-        """
-        self.timeframes = sorted(timeframes)
-        self.buffers: Dict[int, List[MarketCandle]] = {
-            tf: [] for tf in timeframes
+    def __init__(
+        self, timeframes: List[Timeframe], base_seconds: int = 60, grace: float = 1.0
+    ):
+        self.base_seconds = base_seconds
+        self.grace = grace
+        self.timeframes = sorted(timeframes, key=timeframe_seconds)
+        self.buffers: Dict[Timeframe, OHLCVBucket] = {
+            tf: OHLCVBucket(timeframe_seconds(tf)) for tf in self.timeframes
         }
+        self.late = 0
+        self._children = cascade(self.timeframes, base_seconds)
+        self._watermark = 0
+
+    def on_candle(self, candle: MarketCandle) -> Completed:
+        """Fold one base candle in; returns completed (timeframe, candle) pairs."""
+        ts = epoch_seconds(candle.closed_at)
+        if ts <= self._watermark:
+            self.late += 1
+            return []
+        self._watermark = ts
+        completed: Completed = []
+        self._feed(None, candle, ts, self.base_seconds, completed)
+        return completed
 
-    def on_candle(self, candle: MarketCandle) -> List[Tuple[int, MarketCandle]]:
-        """
-        Process incoming 1-minute candle.
-        
-        Returns list of completed (timeframe, candle) pairs.
-        Different timeframes complete at different times.
-        
-        Args:
-            candle: 1-minute candle from WS
-            
-        Returns:
-            List of (timeframe, merged_candle) for completed timeframes
-        """
-        completed = []
-        
+    def on_time(self, now: datetime) -> Completed:
+        """Close every bucket that ended ``grace`` seconds before ``now``."""
+        cutoff, cutoff_ts = settled(now, self.grace)
+        self._watermark = max(self._watermark, cutoff_ts - cutoff_ts % self.base_seconds)
+        completed: Completed = []
         for tf in self.timeframes:
-            buf = self.buffers[tf]
-            buf.append(candle)
-            
-            if self._is_timeframe_closed(buf, tf):
-                merged = self._merge_candles(buf, tf)
-                completed.append((tf, merged))
-                buf.clear()
-        
+            bucket = self.buffers[tf]
+            if bucket.count and bucket.end <= cutoff_ts:
+                self._emit(tf, cutoff - timedelta(seconds=cutoff_ts - bucket.end), completed)
         return completed
 
-    def _is_timeframe_closed(self, buffer: List[MarketCandle], timeframe: int) -> bool:
-        """
-        Check if timeframe period is complete.
-        
-        Args:
-            buffer: Accumulated candles
-            timeframe: Target timeframe in minutes
-            
-        Returns:
-            True if timeframe period is complete
-        """
-        if not buffer:
-            return False
-        
-        if len(buffer) < timeframe:
-            return False
-        
-        start = buffer[0].closed_at
-        end = buffer[-1].closed_at
-        expected_duration = timedelta(minutes=timeframe)
-        
-        return (end - start) >= expected_duration
+    def _feed(
+        self, source: Optional[Timeframe], candle: MarketCandle, ts: int, span: int,
+        completed: Completed,
+    ) -> None:
+        for tf in self._children.get(source, ()):
+            bucket = self.buffers[tf]
+            end = bucket_end(ts, bucket.size)
+            if bucket.count and bucket.end != end:  # gap: older bucket is over
+                gap = timedelta(seconds=ts - bucket.end)
+                self._emit(tf, candle.closed_at - gap, completed)
+            bucket.add(candle, end, ts - span)
+            if ts == end:
+                self._emit(tf, candle.closed_at, completed)
 
-    def _merge_candles(self, buffer: List[MarketCandle], timeframe: int) -> MarketCandle:
-        """
-        Merge 1-minute candles into larger timeframe.
-        
-        Args:
-            buffer: Accumulated 1-minute candles
-            timeframe: Target timeframe in minutes
-            
-        Returns:
-            Merged candle for the timeframe
-        """
-        if not buffer:
-            raise ValueError("Cannot merge empty buffer")
-        
-        return MarketCandle(
-            symbol=buffer[0].symbol,
-            open=buffer[0].open,
-            high=max(c.high for c in buffer),
-            low=min(c.low for c in buffer),
-            close=buffer[-1].close,
-            volume=sum(c.volume for c in buffer),
-            closed_at=buffer[-1].closed_at,
-        )
+    def _emit(self, tf: Timeframe, closed_at: datetime, completed: Completed) -> None:
+        bucket = self.buffers[tf]
+        ohlcv = bucket.take()
+        if ohlcv is None:  # joined mid-bucket
+            return
+        merged = MarketCandle(bucket.symbol, *ohlcv, closed_at)
+        completed.append((tf, merged))
+        self._feed(tf, merged, bucket.end, bucket.size, completed)
 
 
 __all__ = ["MarketCandle", "TimeframeAggregator"]
@@ -0,0 +1,61 @@
+"""Timeframe specs and epoch arithmetic shared by the candle aggregators."""
+import calendar
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple, Union
+
+Timeframe = Union[int, str]
+_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def timeframe_seconds(timeframe: Timeframe) -> int:
+    """Length of int minutes or ``"30s"``/``"5m"``/``"4h"``/``"1d"``."""
+    if isinstance(timeframe, int):
+        return timeframe * 60
+    count, unit = timeframe[:-1], _UNITS.get(timeframe[-1:])
+    if unit is None or not count.isdigit() or not int(count):
+        raise ValueError(f"Unknown timeframe: {timeframe}")
+    return int(count) * unit
+
+
+def epoch_seconds(moment: datetime) -> int:
+    """Seconds since the epoch; naive datetimes are taken as UTC."""
+    return calendar.timegm(moment.utctimetuple())
+
+
+def settled(now: datetime, grace: float) -> Tuple[datetime, int]:
+    """``now - grace`` cut to whole seconds, with its epoch seconds."""
+    moment = (now - timedelta(seconds=grace)).replace(microsecond=0)
+    return moment, epoch_seconds(moment)
+
+
+def bucket_end(ts: int, size: int) -> int:
+    """End of the ``size``-second bucket a bar closing at ``ts`` belongs to."""
+    return -(-ts // size) * size
+
+
+def cascade(
+    timeframes: List[Timeframe], base_seconds: int
+) -> Dict[Optional[Timeframe], List[Timeframe]]:
+    """Group timeframes under the largest smaller one dividing them (``None``: base)."""
+    ordered = sorted(timeframes, key=timeframe_seconds)
+    children: Dict[Optional[Timeframe], List[Timeframe]] = {}
+    for index, tf in enumerate(ordered):
+        size = timeframe_seconds(tf)
+        if size <= 0 or size % base_seconds:
+            raise ValueError(f"{tf} is not a multiple of {base_seconds}s")
+        source = next(
+            (s for s in reversed(ordered[:index]) if size % timeframe_seconds(s) == 0),
+            None,
+        )
+        children.setdefault(source, []).append(tf)
+    return children
+
+
+__all__ = [
+    "Timeframe",
+    "bucket_end",
+    "cascade",
+    "epoch_seconds",
+    "settled",
+    "timeframe_seconds",
+]
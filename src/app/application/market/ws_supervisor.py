@@ -3,13 +3,16 @@ WebSocket Supervisor - Reconnection pattern from ✨.md
 
 Implements the reconnection supervisor pattern:
 - WS Client is always "killable"
-- Automatic reconnection on failure
-- Heartbeat monitoring (data flow, not just ping)
+- Automatic reconnection with jittered exponential backoff
+- Heartbeat monitoring by an independent watchdog (data flow, not just ping)
 - Clean separation: Infrastructure (WS) from Application (supervision)
 """
 import asyncio
 import logging
-from typing import AsyncIterator, Callable, Optional
+from typing import Callable, Optional
+
+from src.app.application.market.stream_metrics import StreamMetrics, jittered_backoff
+from src.app.application.market.stream_watchdog import StaleStreamError, StreamWatch
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +20,7 @@ logger = logging.getLogger(__name__)
 class MarketStreamSupervisor:
     """
     Supervises WebSocket connection with automatic reconnection.
-    
+
     From ✨.md Section 6.3:
     - WS Client is always "killable"
     - Heartbeat = "is data flowing"
@@ -29,57 +32,80 @@ class MarketStreamSupervisor:
         ws_client,
         on_message: Callable,
         reconnect_delay: float = 2.0,
+        max_reconnect_delay: float = 60.0,
+        heartbeat_timeout: float = 20.0,
     ):
         """
         Initialize supervisor.
-        
+
         Args:
-            ws_client: MEXCWebSocketClient instance
+            ws_client: MEXCWebSocketClient instance (re-entered on reconnect)
             on_message: Async callback for each message
-            reconnect_delay: Seconds to wait before reconnecting
+            reconnect_delay: Base backoff delay in seconds, doubled per failed
+                attempt with jitter
+            max_reconnect_delay: Backoff ceiling in seconds
+            heartbeat_timeout: Seconds without data before the watchdog
+                cancels the stream
         """
         self.ws_client = ws_client
         self.on_message = on_message
         self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.heartbeat_timeout = heartbeat_timeout
+        self.metrics = StreamMetrics()
+        self._watch = StreamWatch(heartbeat_timeout, self.metrics, self._reset_backoff)
+        self._attempt = 0
+        self._connection: Optional[asyncio.Task] = None
         self._running = False
 
     async def run(self) -> None:
         """
         Run supervisor loop with automatic reconnection.
-        
+
         Pattern from ✨.md:
         - Trading system ≠ "always running"
         - Trading system = "ready to run anytime"
         """
         self._running = True
         while self._running:
+            error: Optional[BaseException] = None
+            self._connection = asyncio.create_task(self._run_once())
             try:
-                await self._run_once()
+                await self._connection
+            except asyncio.CancelledError:
+                if self._running:
+                    raise
+                break
             except Exception as e:
-                logger.warning(
-                    f"WS died, reconnecting in {self.reconnect_delay}s",
-                    exc_info=e,
-                )
-                await asyncio.sleep(self.reconnect_delay)
+                error = e
+            if not self._running:
+                break
+            self.metrics.on_disconnect(error, since=self._watch.last_data)
+            delay = jittered_backoff(
+                self._attempt, self.reconnect_delay, self.max_reconnect_delay
+            )
+            self._attempt += 1
+            logger.warning(
+                f"WS died, reconnecting in {delay:.2f}s (attempt {self._attempt})",
+                exc_info=error,
+            )
+            await asyncio.sleep(delay)
 
     async def _run_once(self) -> None:
-        """
-        Single connection lifecycle.
-        
-        Raises RuntimeError if heartbeat timeout occurs.
-        """
+        """Single connection lifecycle; raises StaleStreamError on stalls."""
         async with self.ws_client as stream:
-            async for raw_message in stream:
-                # Process message
-                await self.on_message(raw_message)
-                
-                # Check heartbeat (data flow monitoring)
-                if not self.ws_client.is_alive():
-                    raise RuntimeError("Heartbeat timeout - no data flowing")
+            self.metrics.on_connect()
+            await self._watch.run(stream, self.on_message)
+        raise ConnectionError("Stream ended")
+
+    def _reset_backoff(self) -> None:
+        self._attempt = 0  # healthy again: next outage starts from base delay
 
     def stop(self) -> None:
-        """Stop the supervisor loop."""
+        """Stop the supervisor loop and drop the current connection."""
         self._running = False
+        if self._connection is not None and not self._connection.done():
+            self._connection.cancel()
 
 
-__all__ = ["MarketStreamSupervisor"]
+__all__ = ["MarketStreamSupervisor", "StaleStreamError"]
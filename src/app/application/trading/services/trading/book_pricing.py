@@ -0,0 +1,72 @@
+"""
+Price rebalance plans against the live local order book.
+
+When a synced book is available the planners value QRL at the book's mid
+price instead of the last ticker, and BUY/SELL plans are walked through the
+opposite side of the book: size is capped at visible depth (and, for BUY,
+at the USDT budget) and the plan carries the expected average fill price
+and slippage.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+from src.app.infrastructure.external import QRL_USDT_SYMBOL
+
+
+def _live(book) -> bool:
+    return book is not None and book.synced
+
+
+def price_snapshot_from_book(
+    snapshot: Dict[str, Any], book, symbol: str = QRL_USDT_SYMBOL
+) -> Dict[str, Any]:
+    """Copy of ``snapshot`` with the symbol priced at the book's mid."""
+    mid: Optional[float] = book.mid_price() if _live(book) else None
+    if not mid:
+        return snapshot
+    return {**snapshot, "prices": {**snapshot.get("prices", {}), symbol: mid}}
+
+
+def _buy_budget(plan: Dict[str, Any]) -> Optional[float]:
+    """USDT a BUY may spend: the plan notional capped at the USDT balance."""
+    notional = plan.get("notional_usdt")
+    if notional is None:
+        return None
+    caps = [
+        plan[key] for key in ("usdt_available", "usdt_balance") if plan.get(key) is not None
+    ]
+    return min([notional, *caps])
+
+
+def apply_book_liquidity(plan: Dict[str, Any], book) -> Dict[str, Any]:
+    """Fit a BUY/SELL plan to visible depth and attach fill estimates.
+
+    A BUY with a notional walks the asks by quote budget, so the expected
+    cost never exceeds the USDT the plan was sized against.
+    """
+    if not _live(book) or plan.get("action") not in ("BUY", "SELL"):
+        return plan
+    budget = _buy_budget(plan) if plan["action"] == "BUY" else None
+    if budget is not None:
+        estimate = book.cost_to_spend(budget)
+    else:
+        estimate = book.cost_to_fill(plan["action"], plan.get("quantity") or 0)
+    if estimate.filled <= 0:
+        plan.update({"action": "HOLD", "reason": "No order book liquidity"})
+        return plan
+    mid = book.mid_price()
+    plan.update(
+        {
+            "price_source": "orderbook",
+            "quantity": estimate.filled,
+            "notional_usdt": estimate.cost,
+            "expected_fill_price": estimate.avg_price,
+            "worst_fill_price": estimate.worst_price,
+            "slippage_pct": abs(estimate.avg_price - mid) / mid * 100 if mid else None,
+        }
+    )
+    return plan
+
+
+__all__ = ["apply_book_liquidity", "price_snapshot_from_book"]
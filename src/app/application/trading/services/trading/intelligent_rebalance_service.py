@@ -23,6 +23,8 @@ from src.app.infrastructure.utils import safe_float
 # Import extracted modules
 from ..indicators import MACalculator
 from ..position import CostTracker
+from .book_pricing import apply_book_liquidity, price_snapshot_from_book
+from .order_sizing import apply_symbol_filters
 
 
 class IntelligentRebalanceService:
@@ -48,6 +50,8 @@ class IntelligentRebalanceService:
         active_ratio: float = 0.1,
         ma_short_period: int = 7,
         ma_long_period: int = 25,
+        symbol_filters=None,
+        order_book=None,
     ) -> None:
         self.balance_service = balance_service
         self.mexc = mexc_client
@@ -60,6 +64,8 @@ class IntelligentRebalanceService:
         self.active_ratio = active_ratio
         self.ma_short_period = ma_short_period
         self.ma_long_period = ma_long_period
+        self.symbol_filters = symbol_filters
+        self.order_book = order_book
         
         # Initialize extracted components
         self.ma_calculator = MACalculator(ma_short_period, ma_long_period)
@@ -75,18 +81,22 @@ class IntelligentRebalanceService:
         1. Get account balance snapshot
         2. Calculate MA indicators
         3. Detect trading signals
-        4. Compute rebalance plan
+        4. Compute rebalance plan (fit to live book depth when available,
+           snapped to exchange lot/notional rules)
         5. Validate against risk rules
         6. Record plan to Redis
         """
         # Step 1: Get balance snapshot
         snapshot = snapshot or await self.balance_service.get_account_balance()
+        snapshot = price_snapshot_from_book(snapshot, self.order_book)
 
         # Step 2: Calculate MA indicators
         ma_data = await self._calculate_ma_indicators()
 
         # Step 3: Compute plan with MA signals
         plan = await self.compute_plan(snapshot, ma_data)
+        plan = apply_book_liquidity(plan, self.order_book)
+        plan = apply_symbol_filters(plan, self.symbol_filters)
 
         # Step 4: Record plan
         await self._record_plan(plan)
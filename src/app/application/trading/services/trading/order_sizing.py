@@ -0,0 +1,53 @@
+"""
+Fit rebalance plan quantities to the exchange's lot and notional rules.
+
+Planners size orders as ``notional / price``; snapping that to the symbol's
+step size here means the planned quantity is exactly what gets sent, and
+plans the exchange would reject turn into HOLDs instead of failed orders.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional
+
+from src.app.infrastructure.external.mexc.symbol_filters import (
+    OrderFilterError,
+    SymbolFilters,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def load_symbol_filters(mexc_client, symbol: str) -> Optional[SymbolFilters]:
+    """Cached symbol filters, or ``None`` when exchange info is unavailable."""
+    try:
+        return await mexc_client.get_symbol_filters(symbol)
+    except Exception as exc:
+        logger.warning(f"Symbol filters unavailable for {symbol}: {exc}")
+        return None
+
+
+def apply_symbol_filters(
+    plan: Dict[str, Any], filters: Optional[SymbolFilters]
+) -> Dict[str, Any]:
+    """Quantize a BUY/SELL plan in place; HOLD if it cannot be traded.
+
+    A book-priced plan keeps its walked cost: the notional is repriced at
+    ``expected_fill_price`` rather than the mid/ticker ``price``.
+    """
+    if filters is None or plan.get("action") not in ("BUY", "SELL"):
+        return plan
+    price = plan.get("expected_fill_price") or plan.get("price") or 0
+    try:
+        quantity, _, _ = filters.prepare(
+            quantity=plan.get("quantity"), reference_price=price
+        )
+    except OrderFilterError as exc:
+        plan.update({"action": "HOLD", "reason": f"Below exchange minimum ({exc})"})
+        return plan
+    plan["quantity"] = float(quantity)
+    plan["notional_usdt"] = float(quantity) * price
+    return plan
+
+
+__all__ = ["apply_symbol_filters", "load_symbol_filters"]
@@ -7,6 +7,10 @@ Rules:
   is below threshold_pct of total value.
 - SELL when QRL value is above target; clamp to current QRL balance.
 - BUY when QRL value is below target; clamp to available USDT.
+- With a synced local order book, QRL is valued at the book mid and BUY/SELL
+  quantities are capped at visible depth with expected fill price attached.
+- BUY/SELL quantities are snapped to the symbol's step size when filters are
+  given; plans below the exchange minimums become HOLD.
 - The planner only computes and records intent; it does not place orders.
 """
 from __future__ import annotations
@@ -17,6 +21,9 @@ from typing import Any, Dict, Optional
 from src.app.infrastructure.external import QRL_USDT_SYMBOL
 from src.app.infrastructure.utils import safe_float
 
+from .book_pricing import apply_book_liquidity, price_snapshot_from_book
+from .order_sizing import apply_symbol_filters
+
 
 class RebalanceService:
     def __init__(
@@ -26,12 +33,16 @@ class RebalanceService:
         target_ratio: float = 0.5,
         min_notional_usdt: float = 5.0,
         threshold_pct: float = 0.01,
+        symbol_filters=None,
+        order_book=None,
     ) -> None:
         self.balance_service = balance_service
         self.redis = redis_client
         self.target_ratio = target_ratio
         self.min_notional_usdt = min_notional_usdt
         self.threshold_pct = threshold_pct
+        self.symbol_filters = symbol_filters
+        self.order_book = order_book
 
     async def generate_plan(
         self, snapshot: Optional[Dict[str, Any]] = None
@@ -40,7 +51,9 @@ class RebalanceService:
         Build a rebalance plan based on live or provided balances.
         """
         snapshot = snapshot or await self.balance_service.get_account_balance()
-        plan = self.compute_plan(snapshot)
+        snapshot = price_snapshot_from_book(snapshot, self.order_book)
+        plan = apply_book_liquidity(self.compute_plan(snapshot), self.order_book)
+        plan = apply_symbol_filters(plan, self.symbol_filters)
         await self._record_plan(plan)
         return plan
 
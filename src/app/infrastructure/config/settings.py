@@ -35,6 +35,57 @@ class Config:
     MEXC_WS_URL: str = os.getenv("MEXC_WS_URL", "wss://wbs.mexc.com/ws")
     MEXC_TIMEOUT: int = int(os.getenv("MEXC_TIMEOUT", "10"))
 
+    # MEXC HTTP connection pool (kept alive for the app lifetime)
+    MEXC_HTTP2: bool = os.getenv("MEXC_HTTP2", "true").lower() == "true"
+    MEXC_MAX_KEEPALIVE: int = int(os.getenv("MEXC_MAX_KEEPALIVE", "20"))
+    MEXC_MAX_CONNECTIONS: int = int(os.getenv("MEXC_MAX_CONNECTIONS", "50"))
+    MEXC_KEEPALIVE_EXPIRY: float = float(os.getenv("MEXC_KEEPALIVE_EXPIRY", "60"))
+    # Reuse identical public GET results for late arrivals (seconds, 0 disables)
+    MEXC_COALESCE_TTL: float = float(os.getenv("MEXC_COALESCE_TTL", "0.25"))
+    # Cache lifetime of the all-symbol market snapshot (seconds)
+    MEXC_SNAPSHOT_TTL: float = float(os.getenv("MEXC_SNAPSHOT_TTL", "2"))
+    # Client-side request-weight budget per window (orders metered separately)
+    MEXC_RATE_LIMIT_WEIGHT: int = int(os.getenv("MEXC_RATE_LIMIT_WEIGHT", "500"))
+    MEXC_ORDER_RATE_LIMIT: int = int(os.getenv("MEXC_ORDER_RATE_LIMIT", "50"))
+    MEXC_RATE_LIMIT_WINDOW: float = float(os.getenv("MEXC_RATE_LIMIT_WINDOW", "10"))
+    # Server clock-offset sampling interval for signed requests (seconds)
+    MEXC_CLOCK_SYNC_INTERVAL: float = float(os.getenv("MEXC_CLOCK_SYNC_INTERVAL", "60"))
+    # Exchange-info (symbol filters) background refresh interval (seconds)
+    MEXC_EXCHANGE_INFO_REFRESH: float = float(
+        os.getenv("MEXC_EXCHANGE_INFO_REFRESH", "3600")
+    )
+    # Duplicate a public GET once it is slower than this latency percentile
+    # of its endpoint (0 disables hedging)
+    MEXC_HEDGE_PERCENTILE: float = float(os.getenv("MEXC_HEDGE_PERCENTILE", "0.95"))
+    # Total time budget for one scheduled MEXC job (seconds)
+    MEXC_TASK_DEADLINE: float = float(os.getenv("MEXC_TASK_DEADLINE", "20"))
+    # Consecutive exchange failures that open an endpoint family's circuit,
+    # and how long it stays open before a probe (seconds)
+    MEXC_BREAKER_FAILURES: int = int(os.getenv("MEXC_BREAKER_FAILURES", "5"))
+    MEXC_BREAKER_RESET: float = float(os.getenv("MEXC_BREAKER_RESET", "30"))
+    # Offline benchmarking: "record" REST responses to MEXC_CASSETTE or
+    # "replay" them without network; replay latency none|recorded|sampled
+    MEXC_CASSETTE: Optional[str] = os.getenv("MEXC_CASSETTE")
+    MEXC_CASSETTE_MODE: Optional[str] = os.getenv("MEXC_CASSETTE_MODE")
+    MEXC_REPLAY_LATENCY: str = os.getenv("MEXC_REPLAY_LATENCY", "none")
+    # Comma-separated symbols whose order book is kept live from the
+    # diff-depth stream (empty disables streaming)
+    MEXC_ORDERBOOK_SYMBOLS: str = os.getenv("MEXC_ORDERBOOK_SYMBOLS", "")
+    # Channels per websocket connection before the pool opens another shard
+    MEXC_WS_MAX_SUBSCRIPTIONS: int = int(os.getenv("MEXC_WS_MAX_SUBSCRIPTIONS", "30"))
+    # Keep balances hot from the private user-data stream (needs API keys);
+    # REST then only reconciles every MEXC_BALANCE_RECONCILE seconds
+    MEXC_BALANCE_STREAM: bool = os.getenv("MEXC_BALANCE_STREAM", "false").lower() == "true"
+    MEXC_BALANCE_RECONCILE: int = int(os.getenv("MEXC_BALANCE_RECONCILE", "300"))
+    # Directory for raw websocket frame recordings (empty disables) and the
+    # size at which a segment file rotates
+    MEXC_WS_RECORD_DIR: str = os.getenv("MEXC_WS_RECORD_DIR", "")
+    MEXC_WS_RECORD_SEGMENT_MB: int = int(os.getenv("MEXC_WS_RECORD_SEGMENT_MB", "256"))
+    # Per-channel websocket latency/throughput histograms, logged every
+    # MEXC_WS_STATS_LOG_INTERVAL seconds (0 = endpoint only)
+    MEXC_WS_STATS: bool = os.getenv("MEXC_WS_STATS", "true").lower() == "true"
+    MEXC_WS_STATS_LOG_INTERVAL: int = int(os.getenv("MEXC_WS_STATS_LOG_INTERVAL", "60"))
+
     # Sub-Account Configuration
     # MEXC v3 API supports two distinct sub-account systems:
     # 1. SPOT API: For regular users (uses numeric subAccountId)
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING, Any, Dict
 
 from src.app.infrastructure.utils import safe_float
 
+from .records import BalanceRecord
+
 
 QRL_USDT_SYMBOL = "QRLUSDT"
 
@@ -23,8 +25,7 @@ def build_balance_map(account_info: Dict[str, Any]) -> Dict[str, Dict[str, str]]
         balances[asset] = {
             "free": balance.get("free", "0"),
             "locked": balance.get("locked", "0"),
-            "total": safe_float(balance.get("free", 0))
-            + safe_float(balance.get("locked", 0)),
+            "total": BalanceRecord.from_raw(balance).total,
         }
     # Ensure keys exist even if exchange omits zero-balance assets
     balances.setdefault("QRL", {"free": "0", "locked": "0", "total": 0})
@@ -0,0 +1,86 @@
+"""Streaming history backfill for klines, aggTrades and myTrades."""
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Dict, List
+
+from .pagination import KLINE_INTERVAL_MS, ordered_windows, split_windows
+from .trade_pagination import iter_trades
+
+AGG_TRADES_WINDOW_MS = 3_600_000  # MEXC caps aggTrades ranges at one hour
+MY_TRADES_WINDOW_MS = 86_400_000  # and myTrades ranges at 24 hours
+
+
+class BackfillMixin:
+    """Async generators that walk history in windows under the rate limiter."""
+
+    async def iter_klines(
+        self,
+        symbol: str,
+        interval: str,
+        start: int,
+        end: int,
+        limit: int = 1000,
+        concurrency: int = 4,
+    ) -> AsyncIterator[List[Any]]:
+        """Yield raw kline rows in ``[start, end]`` ordered by open time."""
+        if interval not in KLINE_INTERVAL_MS:
+            raise ValueError(f"interval must be one of {list(KLINE_INTERVAL_MS)}")
+        span = KLINE_INTERVAL_MS[interval] * limit
+
+        async def fetch(window):
+            return await self.get_klines(symbol, interval, window[0], window[1], limit)
+
+        last_open = None
+        windows = split_windows(start, end, span)
+        async for rows in ordered_windows(windows, fetch, concurrency):
+            for row in rows:
+                open_time = int(row[0])
+                if last_open is not None and open_time <= last_open:
+                    continue
+                last_open = open_time
+                yield row
+
+    async def iter_aggregate_trades(
+        self,
+        symbol: str,
+        start: int,
+        end: int,
+        limit: int = 1000,
+        concurrency: int = 4,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield aggregate trades in ``[start, end]`` ordered by trade id."""
+
+        async def fetch(window_start, window_end, from_id):
+            if from_id is not None:
+                return await self.get_aggregate_trades(symbol, limit=limit, from_id=from_id)
+            return await self.get_aggregate_trades(
+                symbol, limit=limit, start_time=window_start, end_time=window_end
+            )
+
+        async for trade in iter_trades(
+            fetch, start, end, AGG_TRADES_WINDOW_MS, limit, "T", "a", concurrency
+        ):
+            yield trade
+
+    async def iter_my_trades(
+        self,
+        symbol: str,
+        start: int,
+        end: int,
+        limit: int = 1000,
+        concurrency: int = 2,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield the account's fills in ``[start, end]`` ordered by time."""
+
+        async def fetch(window_start, window_end, from_id):
+            if from_id is not None:
+                return await self.get_my_trades(symbol, limit=limit, from_id=from_id)
+            return await self.get_my_trades(symbol, window_start, window_end, limit)
+
+        async for trade in iter_trades(
+            fetch, start, end, MY_TRADES_WINDOW_MS, limit, "time", "id", concurrency
+        ):
+            yield trade
+
+
+__all__ = ["AGG_TRADES_WINDOW_MS", "MY_TRADES_WINDOW_MS", "BackfillMixin"]
@@ -0,0 +1,57 @@
+"""
+What the circuit breakers key on and what they count.
+
+Endpoints are grouped into families so a failing order path does not stop
+market data. Only MEXC's own behaviour moves a circuit: 5xx/429 and
+transport failures count against it, a real answer (a 4xx or an API error
+body) proves it healthy, and anything else (cancellation, the caller's
+deadline, local decoding bugs, cassette misses) is neutral.
+"""
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+
+from .exceptions import MexcAPIError, MexcDeadlineExceeded, MexcRequestError
+
+_ORDER_PATHS = ("/api/v3/order", "/api/v3/openOrders", "/api/v3/batchOrders")
+_ACCOUNT_PATHS = ("/api/v3/account", "/api/v3/myTrades", "/api/v3/allOrders")
+
+
+def endpoint_family(endpoint: str) -> str:
+    """Group an endpoint into market / account / order / sub-account."""
+    if "sub-account" in endpoint:
+        return "sub-account"
+    if endpoint.startswith(_ORDER_PATHS):
+        return "order"
+    if endpoint.startswith(_ACCOUNT_PATHS) or "userDataStream" in endpoint:
+        return "account"
+    return "market"
+
+
+def is_exchange_failure(exc: BaseException) -> bool:
+    """Failures that say MEXC is unhealthy, as opposed to a bad request."""
+    if isinstance(exc, MexcDeadlineExceeded):
+        return False  # the caller's budget (or local queueing) ran out
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status >= 500 or status == 429
+    return isinstance(
+        exc, (httpx.RequestError, MexcRequestError, asyncio.TimeoutError)
+    )
+
+
+def is_exchange_answer(exc: BaseException) -> bool:
+    """MEXC answered and rejected the request: proof that it is up."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return 400 <= status < 500 and status != 429
+    return isinstance(exc, MexcAPIError)
+
+
+__all__ = [
+    "endpoint_family",
+    "is_exchange_answer",
+    "is_exchange_failure",
+]
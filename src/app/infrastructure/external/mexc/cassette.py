@@ -0,0 +1,106 @@
+"""
+On-disk cassettes of recorded MEXC HTTP exchanges.
+
+A cassette is a gzip file of JSON lines, one per response, holding the
+status, the headers the client reads, the body and the observed latency.
+Recordings append a new gzip member, so several sessions can share a file.
+"""
+from __future__ import annotations
+
+import base64
+import gzip
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+import orjson
+
+# Per-call query values that would otherwise make every signed call unique.
+VOLATILE_PARAMS = frozenset({"timestamp", "signature", "recvWindow"})
+
+_KEPT_HEADERS = ("content-type", "retry-after")
+
+
+def request_key(method: str, url: str) -> str:
+    """Stable match key: method, path and non-volatile sorted query."""
+    parts = urlsplit(url)
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query) if k not in VOLATILE_PARAMS
+    )
+    encoded = "&".join(f"{k}={v}" for k, v in query)
+    return f"{method.upper()} {parts.path}?{encoded}"
+
+
+@dataclass(frozen=True, slots=True)
+class Interaction:
+    key: str
+    status: int
+    headers: Tuple[Tuple[str, str], ...]
+    body: bytes
+    latency: float
+
+    def to_json(self) -> bytes:
+        record = {
+            "key": self.key,
+            "status": self.status,
+            "headers": self.headers,
+            "latency": round(self.latency, 6),
+        }
+        try:
+            record["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            record["body64"] = base64.b64encode(self.body).decode("ascii")
+        return orjson.dumps(record)
+
+    @classmethod
+    def from_json(cls, line: bytes) -> "Interaction":
+        record = orjson.loads(line)
+        if "body64" in record:
+            body = base64.b64decode(record["body64"])
+        else:
+            body = record["body"].encode("utf-8")
+        return cls(
+            key=record["key"],
+            status=record["status"],
+            headers=tuple(tuple(h) for h in record["headers"]),
+            body=body,
+            latency=record["latency"],
+        )
+
+
+def kept_headers(headers: Iterable[Tuple[str, str]]) -> Tuple[Tuple[str, str], ...]:
+    """Headers worth replaying: content type, Retry-After, MEXC x- headers."""
+    return tuple(
+        (k.lower(), v)
+        for k, v in headers
+        if k.lower() in _KEPT_HEADERS or k.lower().startswith("x-")
+    )
+
+
+def save_interactions(path: str, interactions: List[Interaction]) -> None:
+    if not interactions:
+        return
+    with gzip.open(path, "ab") as fh:
+        for interaction in interactions:
+            fh.write(interaction.to_json() + b"\n")
+
+
+def load_interactions(path: str) -> Dict[str, List[Interaction]]:
+    """Interactions grouped by request key, in recorded order."""
+    grouped: Dict[str, List[Interaction]] = {}
+    with gzip.open(path, "rb") as fh:
+        for line in fh:
+            if line.strip():
+                interaction = Interaction.from_json(line)
+                grouped.setdefault(interaction.key, []).append(interaction)
+    return grouped
+
+
+__all__ = [
+    "Interaction",
+    "VOLATILE_PARAMS",
+    "kept_headers",
+    "load_interactions",
+    "request_key",
+    "save_interactions",
+]
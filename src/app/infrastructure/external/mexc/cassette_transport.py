@@ -0,0 +1,121 @@
+"""httpx transports that record MEXC traffic to, or replay it from, a cassette."""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional
+
+import httpx
+
+from .cassette import (
+    Interaction,
+    kept_headers,
+    load_interactions,
+    request_key,
+    save_interactions,
+)
+
+# The body is stored decoded, so framing headers no longer apply to it.
+_FRAMING = ("content-encoding", "content-length", "transfer-encoding")
+
+LATENCY_NONE = "none"
+LATENCY_RECORDED = "recorded"
+LATENCY_SAMPLED = "sampled"
+
+
+class CassetteMiss(LookupError):
+    """Raised when replay meets a request that was never recorded."""
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Forward to a real transport and keep every response for the cassette."""
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, path: str):
+        self.inner = inner
+        self.path = path
+        self.interactions: List[Interaction] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        response = await self.inner.handle_async_request(request)
+        body = await response.aread()
+        interaction = Interaction(
+            key=request_key(request.method, str(request.url)),
+            status=response.status_code,
+            headers=kept_headers(response.headers.items()),
+            body=body,
+            latency=time.monotonic() - started,
+        )
+        self.interactions.append(interaction)
+        headers = [(k, v) for k, v in response.headers.items() if k not in _FRAMING]
+        return httpx.Response(response.status_code, headers=headers, content=body)
+
+    async def aclose(self) -> None:
+        save_interactions(self.path, self.interactions)
+        self.interactions = []
+        await self.inner.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serve recorded responses without touching the network.
+
+    Responses for a repeated request are returned in recorded order and then
+    cycled. ``latency`` is ``"none"`` (instant), ``"recorded"`` (each
+    response's own latency) or ``"sampled"`` (seeded draw from that
+    endpoint's recorded latencies); ``speed`` scales any delay.
+    """
+
+    def __init__(
+        self,
+        interactions: Dict[str, List[Interaction]],
+        latency: str = LATENCY_NONE,
+        speed: float = 1.0,
+        seed: int = 0,
+    ):
+        self.interactions = interactions
+        self.latency = latency
+        self.speed = speed
+        self._rng = random.Random(seed)
+        self._cursor: Dict[str, int] = {}
+
+    @classmethod
+    def from_file(cls, path: str, **options) -> "ReplayTransport":
+        return cls(load_interactions(path), **options)
+
+    def _delay(self, key: str, interaction: Interaction) -> Optional[float]:
+        if self.latency == LATENCY_RECORDED:
+            return interaction.latency / self.speed
+        if self.latency == LATENCY_SAMPLED:
+            pick = self._rng.choice(self.interactions[key])
+            return pick.latency / self.speed
+        return None
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = request_key(request.method, str(request.url))
+        recorded = self.interactions.get(key)
+        if not recorded:
+            raise CassetteMiss(f"No recorded response for {key}")
+        index = self._cursor.get(key, 0)
+        self._cursor[key] = index + 1
+        interaction = recorded[index % len(recorded)]
+        delay = self._delay(key, interaction)
+        if delay:
+            await asyncio.sleep(delay)
+        return httpx.Response(
+            interaction.status,
+            headers=list(interaction.headers),
+            content=interaction.body,
+            request=request,
+        )
+
+
+__all__ = [
+    "CassetteMiss",
+    "LATENCY_NONE",
+    "LATENCY_RECORDED",
+    "LATENCY_SAMPLED",
+    "RecordingTransport",
+    "ReplayTransport",
+]
@@ -0,0 +1,93 @@
+"""
+Circuit breakers per MEXC endpoint family.
+
+After ``failure_threshold`` consecutive exchange-side failures a family's
+circuit opens and calls fail fast with :class:`MexcCircuitOpen`. Once
+``reset_timeout`` has passed a single probe is let through (half-open);
+its outcome closes the circuit or re-opens it for another period. What
+counts as a failure is decided in :mod:`breaker_policy`.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, TypeVar
+
+from .breaker_policy import is_exchange_answer, is_exchange_failure
+from .exceptions import MexcCircuitOpen
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probing = False
+
+    def before_call(self) -> None:
+        if self.state == OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise MexcCircuitOpen(f"MEXC {self.name} circuit is open")
+            self.state = HALF_OPEN
+        if self.state == HALF_OPEN:
+            if self._probing:
+                raise MexcCircuitOpen(f"MEXC {self.name} circuit is half-open")
+            self._probing = True
+
+    def record_success(self) -> None:
+        if self.state != CLOSED:
+            logger.info("MEXC %s circuit closed", self.name)
+        self.state, self.failures, self._probing = CLOSED, 0, False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.state == HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != OPEN:
+                logger.warning("MEXC %s circuit opened after %s failures", self.name, self.failures)
+            self.state, self.opened_at = OPEN, time.monotonic()
+
+    async def call(self, fn: Callable[[], Awaitable[T]]) -> T:
+        self.before_call()
+        try:
+            result = await fn()
+        except BaseException as exc:
+            if is_exchange_failure(exc):
+                self.record_failure()
+            elif is_exchange_answer(exc):
+                # A rejected request still proves MEXC is answering.
+                self.record_success()
+            else:
+                self._probing = False  # says nothing about MEXC
+            raise
+        self.record_success()
+        return result
+
+    def status(self) -> Dict[str, Any]:
+        return {"state": self.state, "failures": self.failures}
+
+
+FAMILIES = ("market", "account", "order", "sub-account")
+
+
+def build_breakers(failure_threshold: int, reset_timeout: float) -> Dict[str, CircuitBreaker]:
+    return {
+        family: CircuitBreaker(family, failure_threshold, reset_timeout)
+        for family in FAMILIES
+    }
+
+
+__all__ = [
+    "FAMILIES",
+    "CircuitBreaker",
+    "build_breakers",
+]
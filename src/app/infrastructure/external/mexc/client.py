@@ -2,11 +2,18 @@
 from __future__ import annotations
 
 import logging
-import time
 from typing import Any, Dict, Optional
 
+import httpx
+
+from .backfill import BackfillMixin
+from .breaker_policy import endpoint_family
+from .circuit_breaker import build_breakers
+from .clock_sync import ClockSyncMixin
 from .config import load_settings
-from .connection import MexcConnection
+from .deadline import Deadline, current_deadline, within
+from .exchange_info_cache import ExchangeInfoMixin
+from .factory import build_connection
 from .endpoints import (
     AccountEndpoints,
     MarketEndpoints,
@@ -14,7 +21,10 @@ from .endpoints import (
     TradingHelpersMixin,
     UserStreamMixin,
 )
-from .utils.signature import generate_signature
+from .lifecycle import ConnectionLifecycleMixin
+from .market_snapshot import MarketSnapshotMixin
+from .server_clock import ServerClock
+from .signing import SigningMixin, is_timestamp_rejection
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +35,12 @@ class MEXCClient(
     SubAccountEndpoints,
     TradingHelpersMixin,
     UserStreamMixin,
+    MarketSnapshotMixin,
+    ExchangeInfoMixin,
+    BackfillMixin,
+    SigningMixin,
+    ClockSyncMixin,
+    ConnectionLifecycleMixin,
 ):
     """Async MEXC client composed from endpoint mixins."""
 
@@ -33,28 +49,12 @@ class MEXCClient(
         self.headers: Dict[str, str] = {"Content-Type": "application/json"}
         if self.settings.api_key:
             self.headers["X-MEXC-APIKEY"] = self.settings.api_key
-        self._conn = MexcConnection(
-            self.settings.base_url, self.headers, self.settings.timeout
+        self._conn = build_connection(self.settings, self.headers)
+        self.clock = ServerClock()
+        self.breakers = build_breakers(
+            self.settings.breaker_failures, self.settings.breaker_reset
         )
 
-    async def __aenter__(self) -> "MEXCClient":
-        await self._conn.__aenter__()
-        return self
-
-    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        await self._conn.__aexit__(exc_type, exc_val, exc_tb)
-
-    def _require_credentials(self) -> None:
-        if not self.settings.api_key or not self.settings.secret_key:
-            raise ValueError(
-                "API key and secret key required for authenticated requests"
-            )
-
-    def _generate_signature(self, params: Dict[str, Any]) -> str:
-        if not self.settings.secret_key:
-            raise ValueError("Secret key required for authenticated requests")
-        return generate_signature(self.settings.secret_key, params)
-
     async def _request(
         self,
         method: str,
@@ -62,19 +62,65 @@ class MEXCClient(
         params: Optional[Dict[str, Any]] = None,
         signed: bool = False,
         max_retries: int = 3,
+        timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        breaker = self.breakers[endpoint_family(endpoint)]
+        return await breaker.call(
+            lambda: self._dispatch(method, endpoint, params, signed, max_retries, timeout)
+        )
+
+    async def _dispatch(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        signed: bool,
+        max_retries: int,
+        timeout: Optional[float],
+    ) -> Dict[str, Any]:
+        # ``timeout`` is a total budget; it can only shorten a deadline_scope.
+        deadline = current_deadline(timeout)
+        if not signed:
+            return await self._conn.request(
+                method,
+                endpoint,
+                params=params or {},
+                max_retries=max_retries,
+                deadline=deadline,
+            )
+        try:
+            return await self._send_signed(
+                method, endpoint, params, max_retries, deadline
+            )
+        except httpx.HTTPStatusError as exc:
+            if not is_timestamp_rejection(exc):
+                raise
+            logger.warning("MEXC rejected request timestamp, resyncing clock")
+            await within(self.sync_clock(), deadline)
+            return await self._send_signed(
+                method, endpoint, params, max_retries, deadline
+            )
+
+    async def _send_signed(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        max_retries: int,
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
         payload = params.copy() if params else {}
-        if signed:
-            self._require_credentials()
-            payload["timestamp"] = int(time.time() * 1000)
-            payload["signature"] = self._generate_signature(payload)
+        signed_query = self._sign_payload(payload)
         return await self._conn.request(
-            method, endpoint, params=payload, max_retries=max_retries
+            method,
+            endpoint,
+            params=payload,
+            max_retries=max_retries,
+            signed=True,
+            signed_query=signed_query,
+            deadline=deadline,
         )
 
-    async def close(self) -> None:
-        await self._conn.close()
-
 
 # Singleton instance
 mexc_client = MEXCClient()
@@ -0,0 +1,53 @@
+"""Background clock synchronisation against MEXC ``/api/v3/time``."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class ClockSyncMixin:
+    """Keeps ``self.clock`` (a ServerClock) aligned with the exchange."""
+
+    _clock_task: Optional[asyncio.Task] = None
+
+    async def sync_clock(self) -> Dict[str, Any]:
+        sent_ms = time.time() * 1000
+        response = await self.get_server_time()
+        received_ms = time.time() * 1000
+        server_ms = response.get("serverTime")
+        if server_ms is None:
+            raise ValueError("serverTime missing from /api/v3/time response")
+        self.clock.record(sent_ms, float(server_ms), received_ms)
+        return self.clock.status()
+
+    async def _clock_sync_loop(self, interval: float) -> None:
+        while True:
+            try:
+                await self.sync_clock()
+            except Exception as exc:
+                logger.warning(f"MEXC clock sync failed: {exc}")
+            await asyncio.sleep(interval)
+
+    def start_clock_sync(self, interval: float = 60.0) -> None:
+        """Start periodic offset/RTT sampling (idempotent)."""
+        if self._clock_task and not self._clock_task.done():
+            return
+        self._clock_task = asyncio.create_task(self._clock_sync_loop(interval))
+
+    async def stop_clock_sync(self) -> None:
+        task, self._clock_task = self._clock_task, None
+        if task:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+    def clock_status(self) -> Dict[str, Any]:
+        return self.clock.status()
+
+
+__all__ = ["ClockSyncMixin"]
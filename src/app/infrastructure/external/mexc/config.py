@@ -7,11 +7,27 @@ from src.app.infrastructure.config import config
 
 @dataclass
 class MexcSettings:
+    """Client settings; defaults are the ``Config`` (environment) values."""
+
     api_key: Optional[str]
     secret_key: Optional[str]
     base_url: str
     timeout: float
-
+    http2: bool = config.MEXC_HTTP2
+    max_keepalive: int = config.MEXC_MAX_KEEPALIVE
+    max_connections: int = config.MEXC_MAX_CONNECTIONS
+    keepalive_expiry: float = config.MEXC_KEEPALIVE_EXPIRY
+    coalesce_ttl: float = config.MEXC_COALESCE_TTL
+    snapshot_ttl: float = config.MEXC_SNAPSHOT_TTL
+    rate_limit_weight: int = config.MEXC_RATE_LIMIT_WEIGHT
+    order_rate_limit: int = config.MEXC_ORDER_RATE_LIMIT
+    rate_limit_window: float = config.MEXC_RATE_LIMIT_WINDOW
+    hedge_percentile: float = config.MEXC_HEDGE_PERCENTILE
+    breaker_failures: int = config.MEXC_BREAKER_FAILURES
+    breaker_reset: float = config.MEXC_BREAKER_RESET
+    cassette: Optional[str] = config.MEXC_CASSETTE
+    cassette_mode: Optional[str] = config.MEXC_CASSETTE_MODE
+    replay_latency: str = config.MEXC_REPLAY_LATENCY
 
 def load_settings(
     api_key: Optional[str] = None, secret_key: Optional[str] = None
@@ -24,6 +40,21 @@ def load_settings(
         secret_key=secret.strip() if secret else None,
         base_url=config.MEXC_BASE_URL,
         timeout=config.MEXC_TIMEOUT,
+        http2=config.MEXC_HTTP2,
+        max_keepalive=config.MEXC_MAX_KEEPALIVE,
+        max_connections=config.MEXC_MAX_CONNECTIONS,
+        keepalive_expiry=config.MEXC_KEEPALIVE_EXPIRY,
+        coalesce_ttl=config.MEXC_COALESCE_TTL,
+        snapshot_ttl=config.MEXC_SNAPSHOT_TTL,
+        rate_limit_weight=config.MEXC_RATE_LIMIT_WEIGHT,
+        order_rate_limit=config.MEXC_ORDER_RATE_LIMIT,
+        rate_limit_window=config.MEXC_RATE_LIMIT_WINDOW,
+        hedge_percentile=config.MEXC_HEDGE_PERCENTILE,
+        breaker_failures=config.MEXC_BREAKER_FAILURES,
+        breaker_reset=config.MEXC_BREAKER_RESET,
+        cassette=config.MEXC_CASSETTE,
+        cassette_mode=config.MEXC_CASSETTE_MODE,
+        replay_latency=config.MEXC_REPLAY_LATENCY,
     )
 
 
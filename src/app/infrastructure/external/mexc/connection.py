@@ -1,51 +1,59 @@
 """HTTP connection management with retry helpers."""
 from __future__ import annotations
 
-import asyncio
-import logging
 from typing import Any, Dict, Optional
 
-import httpx
-
-from .exceptions import MexcRequestError
+from .deadline import Deadline, within
+from .hedging import LatencyTracker
+from .pool import ClientPool
+from .rate_limiter import RateLimiter
+from .rate_limits import endpoint_bucket, endpoint_weight
+from .request_args import build_request_args
+from .retry import send_with_retries
 from .session import build_async_client
+from .single_flight import SingleFlight, request_key
 
-logger = logging.getLogger(__name__)
+# Endpoints whose responses are time-sensitive and must never be shared.
+_NO_COALESCE = {"/api/v3/time"}
 
 
 class MexcConnection:
-    """Thin wrapper around httpx.AsyncClient with retry/backoff."""
+    """Pooled httpx client with retry/backoff."""
 
-    def __init__(self, base_url: str, headers: Dict[str, str], timeout: float):
+    def __init__(
+        self,
+        base_url: str,
+        headers: Dict[str, str],
+        timeout: float,
+        coalesce_ttl: float = 0.0,
+        limiter: Optional[RateLimiter] = None,
+        hedge_percentile: float = 0.0,
+        **pool_options: Any,
+    ):
         self.base_url = base_url
         self.headers = headers
         self.timeout = timeout
-        self._client: Optional[httpx.AsyncClient] = None
+        self._pool = ClientPool(
+            lambda: build_async_client(self.headers, self.timeout, **pool_options)
+        )
+        self._single_flight = SingleFlight(ttl=coalesce_ttl)
+        self.limiter = limiter
+        self.hedge_percentile = hedge_percentile
+        self.latency = LatencyTracker()
 
     async def __aenter__(self) -> "MexcConnection":
-        self._client = build_async_client(self.headers, self.timeout)
+        self._pool.acquire()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        await self.close()
-
-    async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        await self._pool.release()
 
-    async def _ensure_client(self) -> httpx.AsyncClient:
-        if not self._client:
-            self._client = build_async_client(self.headers, self.timeout)
-        return self._client
+    async def open(self) -> None:
+        """Pin the pooled client for the application lifetime."""
+        self._pool.pin()
 
-    def _use_query_params(self, method: str, endpoint: str) -> bool:
-        normalized = method.upper()
-        if normalized in {"GET", "DELETE"}:
-            return True
-        if normalized == "PUT" and "userDataStream" in endpoint:
-            return True
-        return False
+    async def close(self) -> None:
+        await self._pool.close()
 
     async def request(
         self,
@@ -53,55 +61,57 @@ class MexcConnection:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         max_retries: int = 3,
+        signed: bool = False,
+        signed_query: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
     ) -> Dict[str, Any]:
-        url = f"{self.base_url}{endpoint}"
-        payload = params or {}
-        last_error: Optional[Exception] = None
-        normalized_method = method.upper()
-        use_query = self._use_query_params(normalized_method, endpoint)
-        request_kwargs = {"params": payload} if use_query else {"json": payload}
-
-        for attempt in range(max_retries):
-            try:
-                client = await self._ensure_client()
-                response = await client.request(
-                    normalized_method, url, **request_kwargs
+        verb = method.upper()
+        if verb == "GET" and not signed and endpoint not in _NO_COALESCE:
+            key = request_key(verb, endpoint, params)
+            if key is not None:
+                # The shared fetch runs unbounded: it must not inherit the
+                # first caller's budget. Each waiter applies its own below.
+                shared = self._single_flight.do(
+                    key, lambda: self._send(verb, endpoint, params, max_retries)
                 )
-                response.raise_for_status()
-                return response.json()
-            except httpx.HTTPStatusError as exc:
-                last_error = exc
-                status = exc.response.status_code
-                if status in (429, 503, 504) and attempt < max_retries - 1:
-                    wait = 2**attempt
-                    logger.warning(
-                        "MEXC API error %s, retrying in %ss (attempt %s/%s)",
-                        status,
-                        wait,
-                        attempt + 1,
-                        max_retries,
-                    )
-                    await asyncio.sleep(wait)
-                    continue
-                raise
-            except httpx.RequestError as exc:
-                last_error = exc
-                if attempt < max_retries - 1:
-                    wait = 2**attempt
-                    logger.warning(
-                        "MEXC API network error: %s, retrying in %ss (attempt %s/%s)",
-                        exc,
-                        wait,
-                        attempt + 1,
-                        max_retries,
-                    )
-                    await asyncio.sleep(wait)
-                    continue
-                raise
+                return await within(shared, deadline)
+        return await self._send(
+            verb, endpoint, params, max_retries, signed_query, deadline
+        )
 
-        if last_error:
-            raise last_error
-        raise MexcRequestError("Unknown request failure")
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]],
+        max_retries: int,
+        signed_query: Optional[str] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> Dict[str, Any]:
+        payload = params or {}
+        url, request_kwargs = build_request_args(
+            self.base_url, method, endpoint, payload, signed_query
+        )
+
+        # Only idempotent, unsigned reads are safe to duplicate.
+        hedge = self.hedge_percentile if signed_query is None and method == "GET" else 0
+        client = self._pool.acquire()
+        try:
+            return await send_with_retries(
+                client,
+                method,
+                url,
+                request_kwargs,
+                max_retries,
+                limiter=self.limiter,
+                bucket=endpoint_bucket(method, endpoint),
+                weight=endpoint_weight(method, endpoint, payload),
+                deadline=deadline,
+                hedge_after=self.latency.hedge_delay(endpoint, hedge),
+                on_latency=lambda seconds: self.latency.record(endpoint, seconds),
+            )
+        finally:
+            await self._pool.release(close_when_idle=False)
 
 
 __all__ = ["MexcConnection"]
@@ -0,0 +1,73 @@
+"""Per-call deadlines that propagate through the MEXC request path."""
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Awaitable, Iterator, Optional, TypeVar
+
+from .exceptions import MexcDeadlineExceeded
+
+T = TypeVar("T")
+
+_current_deadline: ContextVar[Optional[float]] = ContextVar(
+    "mexc_deadline", default=None
+)
+
+
+class Deadline:
+    """Absolute point in monotonic time by which a call must finish."""
+
+    __slots__ = ("expires_at",)
+
+    def __init__(self, expires_at: float):
+        self.expires_at = expires_at
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        return cls(time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0.0
+
+
+def current_deadline(timeout: Optional[float] = None) -> Optional[Deadline]:
+    """Combine an explicit per-call timeout with any enclosing deadline scope."""
+    candidates = [t for t in (_current_deadline.get(),) if t is not None]
+    if timeout is not None:
+        candidates.append(time.monotonic() + timeout)
+    return Deadline(min(candidates)) if candidates else None
+
+
+@contextmanager
+def deadline_scope(seconds: float) -> Iterator[Deadline]:
+    """Bound every MEXC call made inside the block to ``seconds`` in total.
+
+    Nested scopes can only shorten the budget, never extend it.
+    """
+    expires_at = time.monotonic() + seconds
+    outer = _current_deadline.get()
+    if outer is not None:
+        expires_at = min(expires_at, outer)
+    token = _current_deadline.set(expires_at)
+    try:
+        yield Deadline(expires_at)
+    finally:
+        _current_deadline.reset(token)
+
+
+async def within(awaitable: Awaitable[T], deadline: Optional[Deadline]) -> T:
+    """Await ``awaitable`` but give up once the deadline passes."""
+    if deadline is None:
+        return await awaitable
+    try:
+        return await asyncio.wait_for(awaitable, timeout=deadline.remaining())
+    except asyncio.TimeoutError as exc:
+        raise MexcDeadlineExceeded("MEXC request deadline exceeded") from exc
+
+
+__all__ = ["Deadline", "current_deadline", "deadline_scope", "within"]
@@ -35,6 +35,7 @@ class TradingHelpersMixin(OrderEndpoints):
         side: str,
         quantity: Optional[float] = None,
         quote_order_qty: Optional[float] = None,
+        reference_price: Optional[float] = None,
     ) -> Dict[str, Any]:
         if quantity is not None and quote_order_qty is not None:
             raise ValueError("Provide either quantity or quote_order_qty, not both")
@@ -48,6 +49,7 @@ class TradingHelpersMixin(OrderEndpoints):
             order_type="MARKET",
             quantity=quantity,
             quote_order_qty=quote_order_qty,
+            reference_price=reference_price,
         )
 
     async def get_my_trades(
@@ -56,11 +58,14 @@ class TradingHelpersMixin(OrderEndpoints):
         start_time: Optional[int] = None,
         end_time: Optional[int] = None,
         limit: int = 500,
+        from_id: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         params: Dict[str, Any] = {"symbol": symbol, "limit": limit}
-        if start_time:
+        if from_id is not None:
+            params["fromId"] = from_id
+        if start_time is not None:
             params["startTime"] = start_time
-        if end_time:
+        if end_time is not None:
             params["endTime"] = end_time
         return await self._request(
             "GET", "/api/v3/myTrades", params=params, signed=True
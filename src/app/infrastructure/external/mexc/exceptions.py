@@ -9,7 +9,21 @@ class MexcRequestError(Exception):
     """Raised for transport-level request failures."""
 
 
+class MexcDeadlineExceeded(MexcRequestError):
+    """Raised when a call runs out of its caller-supplied time budget."""
+
+
+class MexcCircuitOpen(MexcRequestError):
+    """Raised without a network call while an endpoint family is failing."""
+
+
 # Backward-compatible alias expected by legacy imports
 MEXCAPIException = MexcAPIError
 
-__all__ = ["MexcAPIError", "MexcRequestError", "MEXCAPIException"]
+__all__ = [
+    "MexcAPIError",
+    "MexcRequestError",
+    "MexcDeadlineExceeded",
+    "MexcCircuitOpen",
+    "MEXCAPIException",
+]
@@ -0,0 +1,78 @@
+"""Cached exchange info: precomputed symbol filters, refreshed in background."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, Dict, Optional
+
+from .symbol_filters import SymbolFilters
+
+logger = logging.getLogger(__name__)
+
+
+def parse_symbol_filters(exchange_info: Dict[str, Any]) -> Dict[str, SymbolFilters]:
+    return {
+        item["symbol"]: SymbolFilters.from_raw(item)
+        for item in exchange_info.get("symbols") or []
+        if item.get("symbol")
+    }
+
+
+class ExchangeInfoMixin:
+    """Keeps ``SymbolFilters`` for every symbol so orders can be quantized locally."""
+
+    # Replaced wholesale on refresh, never mutated, so readers need no lock.
+    _symbol_filters: Dict[str, SymbolFilters] = {}
+    _exchange_info_task: Optional[asyncio.Task] = None
+
+    async def refresh_exchange_info(self) -> int:
+        """Reload filters for all symbols; returns how many were parsed."""
+        parsed = parse_symbol_filters(await self.get_exchange_info())
+        if parsed:
+            self._symbol_filters = parsed
+        return len(parsed)
+
+    async def get_symbol_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        filters = self._symbol_filters.get(symbol)
+        if filters is None:
+            parsed = parse_symbol_filters(await self.get_exchange_info(symbol))
+            self._symbol_filters = {**self._symbol_filters, **parsed}
+            filters = parsed.get(symbol)
+        return filters
+
+    async def _order_filters(self, symbol: str) -> Optional[SymbolFilters]:
+        """Filters for the order path; unknown rules never block an order."""
+        try:
+            return await self.get_symbol_filters(symbol)
+        except Exception as exc:
+            logger.warning(f"MEXC exchange info unavailable for {symbol}: {exc}")
+            return None
+
+    async def _exchange_info_loop(self, interval: float) -> None:
+        while True:
+            try:
+                count = await self.refresh_exchange_info()
+                logger.debug(f"MEXC exchange info refreshed ({count} symbols)")
+            except Exception as exc:
+                logger.warning(f"MEXC exchange info refresh failed: {exc}")
+            await asyncio.sleep(interval)
+
+    def start_exchange_info_refresh(self, interval: float = 3600.0) -> None:
+        """Start periodic exchange-info refresh (idempotent)."""
+        task = self._exchange_info_task
+        if task and not task.done():
+            return
+        self._exchange_info_task = asyncio.create_task(
+            self._exchange_info_loop(interval)
+        )
+
+    async def stop_exchange_info_refresh(self) -> None:
+        task, self._exchange_info_task = self._exchange_info_task, None
+        if task:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+__all__ = ["ExchangeInfoMixin", "parse_symbol_filters"]
@@ -0,0 +1,32 @@
+"""Assemble the MEXC HTTP connection from client settings."""
+from typing import Dict
+
+from .config import MexcSettings
+from .connection import MexcConnection
+from .rate_limiter import RateLimiter
+
+
+def build_connection(settings: MexcSettings, headers: Dict[str, str]) -> MexcConnection:
+    """Create a pooled, rate-limited connection for ``MEXCClient``."""
+    return MexcConnection(
+        settings.base_url,
+        headers,
+        settings.timeout,
+        coalesce_ttl=settings.coalesce_ttl,
+        hedge_percentile=settings.hedge_percentile,
+        limiter=RateLimiter(
+            settings.rate_limit_weight,
+            settings.order_rate_limit,
+            settings.rate_limit_window,
+        ),
+        http2=settings.http2,
+        max_keepalive=settings.max_keepalive,
+        max_connections=settings.max_connections,
+        keepalive_expiry=settings.keepalive_expiry,
+        cassette=settings.cassette,
+        cassette_mode=settings.cassette_mode,
+        replay_latency=settings.replay_latency,
+    )
+
+
+__all__ = ["build_connection"]
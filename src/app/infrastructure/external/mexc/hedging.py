@@ -0,0 +1,68 @@
+"""Latency tracking and hedged requests for idempotent MEXC GETs."""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from typing import Awaitable, Callable, Deque, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class LatencyTracker:
+    """Rolling per-endpoint latency samples used to pick a hedge delay."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=window))
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        self._samples[endpoint].append(seconds)
+
+    def percentile(self, endpoint: str, pct: float) -> Optional[float]:
+        samples = self._samples.get(endpoint)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(pct * len(ordered)))
+        return ordered[index]
+
+    def hedge_delay(self, endpoint: str, pct: float) -> Optional[float]:
+        """Delay before duplicating a call, or ``None`` when hedging is off."""
+        return self.percentile(endpoint, pct) if pct > 0 else None
+
+
+async def hedged(
+    call: Callable[[], Awaitable[T]],
+    delay: Optional[float],
+    hedge: Optional[Callable[[], Awaitable[T]]] = None,
+) -> T:
+    """
+    Run ``call``; if it has not finished after ``delay`` seconds, start
+    ``hedge`` (default: ``call`` again) and return whichever succeeds first.
+
+    Every attempt still running when this returns or is cancelled (e.g. by
+    an enclosing deadline) is cancelled, so none outlives the caller.
+    """
+    if delay is None:
+        return await call()
+    pending = {asyncio.ensure_future(call())}
+    error: Optional[BaseException] = None
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if not done:
+            pending.add(asyncio.ensure_future((hedge or call)()))
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = error or task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+__all__ = ["LatencyTracker", "hedged"]
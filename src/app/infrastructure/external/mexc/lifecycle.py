@@ -0,0 +1,54 @@
+"""Connection lifecycle for the MEXC client (leases, pinning, warm-up)."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionLifecycleMixin:
+    """Expose ``self._conn`` lease/pin semantics on the client."""
+
+    async def __aenter__(self):
+        await self._conn.__aenter__()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._conn.__aexit__(exc_type, exc_val, exc_tb)
+
+    async def open(self) -> None:
+        """Keep the pooled HTTP session alive until :meth:`close` is called.
+
+        Intended for the application lifespan; nested ``async with`` blocks
+        then only lease the shared session instead of tearing it down.
+        """
+        await self._conn.open()
+
+    async def warmup(self, timeout: float = 3.0) -> bool:
+        """Establish a pooled connection ahead of the first real request."""
+        try:
+            await asyncio.wait_for(self.ping(), timeout=timeout)
+            return True
+        except Exception as exc:
+            logger.warning(f"MEXC connection warm-up failed: {exc}")
+            return False
+
+    def rate_limit_status(self) -> Dict[str, Any]:
+        """Current request-weight budget utilisation per bucket."""
+        if self._conn.limiter is None:
+            return {}
+        return self._conn.limiter.status()
+
+    def circuit_status(self) -> Dict[str, Any]:
+        """Breaker state per endpoint family."""
+        return {family: b.status() for family, b in self.breakers.items()}
+
+    async def close(self) -> None:
+        await self.stop_clock_sync()
+        await self.stop_exchange_info_refresh()
+        await self._conn.close()
+
+
+__all__ = ["ConnectionLifecycleMixin"]
@@ -49,9 +49,9 @@ class MarketEndpointsMixin:
         limit: int = 500,
     ) -> List[List]:
         params = {"symbol": symbol, "interval": interval, "limit": limit}
-        if start_time:
+        if start_time is not None:
             params["startTime"] = start_time
-        if end_time:
+        if end_time is not None:
             params["endTime"] = end_time
         return await self._request("GET", "/api/v3/klines", params=params)
 
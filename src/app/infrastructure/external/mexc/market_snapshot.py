@@ -0,0 +1,71 @@
+"""All-symbol market snapshot built from one unsymboled ticker call."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Optional
+
+from src.app.infrastructure.utils import safe_float
+
+
+@dataclass(frozen=True, slots=True)
+class MarketSnapshot:
+    """24h tickers for every symbol, indexed by symbol."""
+
+    tickers: Dict[str, Dict[str, Any]]
+    fetched_at: float
+
+    def get(self, symbol: str) -> Optional[Dict[str, Any]]:
+        return self.tickers.get(symbol.upper())
+
+    def price(self, symbol: str) -> Optional[float]:
+        ticker = self.get(symbol)
+        if ticker is None or ticker.get("lastPrice") is None:
+            return None
+        return safe_float(ticker.get("lastPrice"))
+
+    def value_in(self, asset: str, amount: float, quote: str = "USDT") -> Optional[float]:
+        """Value ``amount`` of ``asset`` in ``quote`` using direct or inverse pairs."""
+        if asset == quote:
+            return amount
+        direct = self.price(f"{asset}{quote}")
+        if direct is not None:
+            return amount * direct
+        inverse = self.price(f"{quote}{asset}")
+        if inverse:
+            return amount / inverse
+        return None
+
+    def subset(self, symbols: Iterable[str]) -> "MarketSnapshot":
+        wanted = {s.upper() for s in symbols}
+        return MarketSnapshot(
+            {s: t for s, t in self.tickers.items() if s in wanted}, self.fetched_at
+        )
+
+    def age(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+
+class MarketSnapshotMixin:
+    """Short-TTL cached view over ``GET /api/v3/ticker/24hr`` (all symbols)."""
+
+    _market_snapshot: Optional[MarketSnapshot] = None
+
+    async def get_market_snapshot(
+        self,
+        symbols: Optional[Iterable[str]] = None,
+        max_age: Optional[float] = None,
+    ) -> MarketSnapshot:
+        ttl = self.settings.snapshot_ttl if max_age is None else max_age
+        snapshot = self._market_snapshot
+        if snapshot is None or snapshot.age() >= ttl:
+            rows = await self._request("GET", "/api/v3/ticker/24hr")
+            snapshot = MarketSnapshot(
+                {row["symbol"]: row for row in rows if row.get("symbol")},
+                time.monotonic(),
+            )
+            self._market_snapshot = snapshot
+        return snapshot.subset(symbols) if symbols is not None else snapshot
+
+
+__all__ = ["MarketSnapshot", "MarketSnapshotMixin"]
@@ -0,0 +1,17 @@
+"""Local order books maintained from MEXC diff-depth streams."""
+from .book import BUY, SELL, OrderBook
+from .ladder import FillEstimate, PriceLadder
+from .manager import OrderBookManager, order_books
+from .sync import SNAPSHOT_LIMIT, OrderBookSync
+
+__all__ = [
+    "BUY",
+    "FillEstimate",
+    "OrderBook",
+    "OrderBookManager",
+    "OrderBookSync",
+    "PriceLadder",
+    "SELL",
+    "SNAPSHOT_LIMIT",
+    "order_books",
+]
@@ -0,0 +1,107 @@
+"""
+Local order book for one symbol, kept in sync by version-checked diffs.
+
+``load_snapshot`` seeds the book from ``GET /api/v3/depth``; ``apply``
+takes aggregated diff-depth pushes and returns ``False`` on a version gap,
+leaving the book unsynced until the next snapshot.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional
+
+from .ladder import FillEstimate, Level, PriceLadder
+
+BUY = "BUY"
+SELL = "SELL"
+
+
+class OrderBook:
+    def __init__(self, symbol: str):
+        self.symbol = symbol.upper()
+        self.bids = PriceLadder(descending=True)
+        self.asks = PriceLadder()
+        self.version = 0
+        self.synced = False
+        self.updated_at = 0.0
+
+    @classmethod
+    def from_snapshot(cls, symbol: str, snapshot: Dict[str, Any]) -> "OrderBook":
+        book = cls(symbol)
+        book.load_snapshot(snapshot)
+        return book
+
+    def load_snapshot(self, snapshot: Dict[str, Any]) -> None:
+        self.bids.load(snapshot.get("bids") or [])
+        self.asks.load(snapshot.get("asks") or [])
+        self.version = int(snapshot.get("lastUpdateId") or 0)
+        self.synced = True
+        self.updated_at = time.time()
+
+    def invalidate(self) -> None:
+        self.synced = False
+
+    def apply(self, push) -> bool:
+        """Apply a ``DepthPush``; stale pushes are ignored, gaps unsync."""
+        if not self.synced:
+            return False
+        last = push.to_version
+        first = push.from_version if push.from_version is not None else last
+        if last is not None and last <= self.version:
+            return True
+        if first is not None and first > self.version + 1:
+            self.synced = False
+            return False
+        for level in push.bids:
+            self.bids.update(level.price, level.quantity)
+        for level in push.asks:
+            self.asks.update(level.price, level.quantity)
+        if last is not None:
+            self.version = last
+        self.updated_at = time.time()
+        return True
+
+    def best_bid(self) -> Optional[Level]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[Level]:
+        return self.asks.best()
+
+    def mid_price(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return (bid[0] + ask[0]) / 2
+
+    def spread(self) -> Optional[float]:
+        bid, ask = self.bids.best(), self.asks.best()
+        if bid is None or ask is None:
+            return None
+        return ask[0] - bid[0]
+
+    def top(self, n: int = 20) -> Dict[str, List[Level]]:
+        return {"bids": self.bids.top(n), "asks": self.asks.top(n)}
+
+    def cumulative_depth(self, n: int = 20) -> Dict[str, List[Level]]:
+        return {"bids": self.bids.cumulative(n), "asks": self.asks.cumulative(n)}
+
+    def cost_to_fill(self, side: str, quantity: float) -> FillEstimate:
+        """Market-order estimate: BUY walks the asks, SELL walks the bids."""
+        ladder = self.asks if side.upper() == BUY else self.bids
+        return ladder.fill(quantity)
+
+    def cost_to_spend(self, budget: float) -> FillEstimate:
+        """Market BUY sized by quote currency: walk the asks up to ``budget``."""
+        return self.asks.fill_quote(budget)
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "synced": self.synced,
+            "version": self.version,
+            "bids": len(self.bids),
+            "asks": len(self.asks),
+            "age_seconds": round(time.time() - self.updated_at, 3),
+        }
+
+
+__all__ = ["BUY", "OrderBook", "SELL"]
@@ -0,0 +1,117 @@
+"""
+Sorted, array-backed price ladder for one side of an order book.
+
+Levels live in two parallel lists ordered best-first (bids are keyed by
+negated price), so best price, top-N and fill walks are slices and short
+loops, and updates are a bisect plus an in-place list edit.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+Level = Tuple[float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class FillEstimate:
+    requested: float
+    filled: float
+    cost: float
+    avg_price: float
+    worst_price: float
+    levels: int
+
+    @property
+    def complete(self) -> bool:
+        return self.filled >= self.requested
+
+
+class PriceLadder:
+    __slots__ = ("descending", "_keys", "_qty")
+
+    def __init__(self, descending: bool = False):
+        self.descending = descending
+        self._keys: List[float] = []
+        self._qty: List[float] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _price(self, key: float) -> float:
+        return -key if self.descending else key
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._qty.clear()
+
+    def load(self, levels: Iterable[Sequence]) -> None:
+        sign = -1.0 if self.descending else 1.0
+        book = {sign * float(p): float(q) for p, q, *_ in levels if float(q) > 0}
+        self._keys = sorted(book)
+        self._qty = [book[k] for k in self._keys]
+
+    def update(self, price: float, quantity: float) -> None:
+        """Set a level's quantity; zero removes the level."""
+        key = -price if self.descending else price
+        keys = self._keys
+        index = bisect_left(keys, key)
+        if index < len(keys) and keys[index] == key:
+            if quantity > 0:
+                self._qty[index] = quantity
+            else:
+                del keys[index]
+                del self._qty[index]
+        elif quantity > 0:
+            keys.insert(index, key)
+            self._qty.insert(index, quantity)
+
+    def best(self) -> Optional[Level]:
+        if not self._keys:
+            return None
+        return self._price(self._keys[0]), self._qty[0]
+
+    def top(self, n: int) -> List[Level]:
+        return [(self._price(k), q) for k, q in zip(self._keys[:n], self._qty[:n])]
+
+    def cumulative(self, n: int) -> List[Level]:
+        """Top-N levels as (price, cumulative quantity)."""
+        total, out = 0.0, []
+        for key, qty in zip(self._keys[:n], self._qty[:n]):
+            total += qty
+            out.append((self._price(key), total))
+        return out
+
+    def fill(self, quantity: float) -> FillEstimate:
+        """Walk the ladder to estimate filling ``quantity`` at market."""
+        remaining, cost, worst, levels = quantity, 0.0, 0.0, 0
+        for key, qty in zip(self._keys, self._qty):
+            if remaining <= 0:
+                break
+            take = qty if qty < remaining else remaining
+            worst = self._price(key)
+            cost += take * worst
+            remaining -= take
+            levels += 1
+        filled = quantity - max(remaining, 0.0)
+        avg = cost / filled if filled > 0 else 0.0
+        return FillEstimate(quantity, filled, cost, avg, worst, levels)
+
+    def fill_quote(self, budget: float) -> FillEstimate:
+        """Walk the ladder until ``budget`` (quote currency) is spent."""
+        filled, cost, worst, levels = 0.0, 0.0, 0.0, 0
+        for key, qty in zip(self._keys, self._qty):
+            if cost >= budget:
+                break
+            worst = self._price(key)
+            take = min(qty, (budget - cost) / worst)
+            filled += take
+            cost = min(cost + take * worst, budget)
+            levels += 1
+        requested = filled + (budget - cost) / worst if worst else filled
+        avg = cost / filled if filled > 0 else 0.0
+        return FillEstimate(requested, filled, cost, avg, worst, levels)
+
+
+__all__ = ["FillEstimate", "Level", "PriceLadder"]
@@ -0,0 +1,74 @@
+"""
+Process-wide registry of live order books fed by one websocket pool.
+
+``get`` only returns books that are currently in sync, so callers can fall
+back to REST depth whenever the stream is down or resyncing.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..websocket.connection_pool import WebSocketPool
+from ..websocket.fast_decoders import decode_push_records
+from ..websocket.market_streams import diff_depth_stream
+from .book import OrderBook
+from .sync import OrderBookSync
+
+logger = logging.getLogger(__name__)
+
+
+class OrderBookManager:
+    def __init__(self) -> None:
+        self._syncs: Dict[str, OrderBookSync] = {}
+        self._tasks: List[asyncio.Task] = []
+        self._pool: Optional[WebSocketPool] = None
+
+    @property
+    def running(self) -> bool:
+        return self._pool is not None
+
+    def start(self, mexc_client, symbols: Iterable[str], **pool_options: Any) -> None:
+        """Start streaming depth for ``symbols`` (idempotent)."""
+        symbols = [s.strip().upper() for s in symbols if s.strip()]
+        if self.running or not symbols:
+            return
+        pool_options.setdefault("binary_decoder", decode_push_records)
+        self._pool = WebSocketPool(**pool_options)
+        for symbol in symbols:
+            sync = OrderBookSync(symbol, mexc_client)
+            self._syncs[symbol] = sync
+            stream = self._pool.channel(diff_depth_stream(symbol))
+            self._tasks.append(asyncio.create_task(sync.run(stream)))
+        logger.info("Streaming order books for %s", ", ".join(symbols))
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+        self._syncs.clear()
+
+    def get(self, symbol: str) -> Optional[OrderBook]:
+        sync = self._syncs.get(symbol.upper())
+        if sync is None or not sync.book.synced:
+            return None
+        return sync.book
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            symbol: {**sync.book.status(), "resyncs": sync.resyncs}
+            for symbol, sync in self._syncs.items()
+        }
+
+
+order_books = OrderBookManager()
+
+__all__ = ["OrderBookManager", "order_books"]
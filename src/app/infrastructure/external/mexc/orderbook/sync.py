@@ -0,0 +1,66 @@
+"""
+Keep an :class:`OrderBook` in sync from a diff-depth push stream.
+
+The stream is consumed through a queue, so pushes arriving while the REST
+snapshot is in flight are buffered and replayed against it: pushes older
+than the snapshot are dropped and the first newer one must bridge its
+version. Any gap invalidates the book and the next push re-bootstraps.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Any, AsyncIterator
+
+from ..websocket.push_records import DepthPush
+from .book import OrderBook
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_LIMIT = 1000
+
+
+class OrderBookSync:
+    def __init__(self, symbol: str, mexc_client, snapshot_limit: int = SNAPSHOT_LIMIT):
+        self.book = OrderBook(symbol)
+        self.resyncs = 0
+        self._client = mexc_client
+        self._snapshot_limit = snapshot_limit
+
+    async def bootstrap(self) -> None:
+        async with self._client:
+            snapshot = await self._client.get_order_book(
+                self.book.symbol, self._snapshot_limit
+            )
+        self.book.load_snapshot(snapshot)
+        logger.info(
+            "Order book %s bootstrapped at version %s",
+            self.book.symbol,
+            self.book.version,
+        )
+
+    async def run(self, pushes: AsyncIterator[Any]) -> None:
+        """Consume pushes until the stream ends, resyncing on gaps."""
+        async for push in pushes:
+            if not isinstance(push, DepthPush):
+                continue
+            if not self.book.synced:
+                try:
+                    await self.bootstrap()
+                except Exception as exc:
+                    logger.warning(
+                        "Order book %s snapshot failed: %s", self.book.symbol, exc
+                    )
+                    continue
+            if not self.book.apply(push):
+                self.resyncs += 1
+                logger.warning(
+                    "Order book %s gap at version %s (push %s-%s), resyncing",
+                    self.book.symbol,
+                    self.book.version,
+                    push.from_version,
+                    push.to_version,
+                )
+        self.book.invalidate()
+
+
+__all__ = ["OrderBookSync", "SNAPSHOT_LIMIT"]
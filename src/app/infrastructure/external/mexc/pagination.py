@@ -0,0 +1,106 @@
+"""Time-window pagination helpers for history backfills."""
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, Optional, Tuple
+
+Window = Tuple[int, int]
+
+# MEXC REST kline intervals -> milliseconds (1M approximated as 31 days;
+# boundary de-duplication absorbs the overlap).
+KLINE_INTERVAL_MS = {
+    "1m": 60_000,
+    "5m": 300_000,
+    "15m": 900_000,
+    "30m": 1_800_000,
+    "60m": 3_600_000,
+    "4h": 14_400_000,
+    "1d": 86_400_000,
+    "1W": 604_800_000,
+    "1M": 2_678_400_000,
+}
+
+
+def split_windows(start: int, end: int, span: int) -> List[Window]:
+    """Split ``[start, end]`` (ms, inclusive) into consecutive windows."""
+    if span <= 0:
+        raise ValueError("span must be positive")
+    windows = []
+    cursor = start
+    while cursor <= end:
+        upper = min(cursor + span - 1, end)
+        windows.append((cursor, upper))
+        cursor = upper + 1
+    return windows
+
+
+async def ordered_windows(
+    windows: Iterable[Window],
+    fetch: Callable[[Window], Awaitable[List[Any]]],
+    concurrency: int = 4,
+) -> AsyncIterator[List[Any]]:
+    """
+    Fetch windows with at most ``concurrency`` in flight, yielding in order.
+
+    Only ``concurrency`` pages are ever buffered, so memory stays flat no
+    matter how long the requested range is.
+    """
+    pending: deque = deque()
+    iterator = iter(windows)
+    try:
+        for window in iterator:
+            pending.append(asyncio.ensure_future(fetch(window)))
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def page_window(
+    fetch: Callable[[int, int, Optional[int]], Awaitable[List[Any]]],
+    window: Window,
+    limit: int,
+    time_key: str,
+    id_key: str,
+) -> List[Any]:
+    """
+    Page through one window until a short page signals it is exhausted.
+
+    ``fetch(start, end, from_id)`` pages by time, or by id when ``from_id``
+    is set. A full page that ends on ``start`` holds only that millisecond,
+    so the next page continues from the id after its last row instead of
+    skipping the rest of that millisecond.
+    """
+    start, end = window
+    rows: List[Any] = []
+    from_id: Optional[int] = None
+    while True:
+        page = await fetch(start, end, from_id)
+        # Id paging is not bounded by ``end``; trim anything past the window.
+        in_window = [row for row in page if int(row[time_key]) <= end]
+        rows.extend(in_window)
+        if len(page) < limit or len(in_window) < len(page):
+            return rows
+        last_time = int(page[-1][time_key])
+        if last_time >= end or last_time < start:
+            return rows
+        last_id = page[-1].get(id_key)
+        if last_time > start:
+            # Restart at the last timestamp; duplicates are dropped by the caller.
+            start, from_id = last_time, None
+        elif last_id is not None:
+            from_id = int(last_id) + 1
+        else:
+            start = last_time + 1
+
+__all__ = [
+    "KLINE_INTERVAL_MS",
+    "Window",
+    "ordered_windows",
+    "page_window",
+    "split_windows",
+]
@@ -0,0 +1,72 @@
+"""Reference-counted ownership of the shared httpx.AsyncClient."""
+from __future__ import annotations
+
+import logging
+from typing import Callable, Optional
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+
+class ClientPool:
+    """
+    Keep one pooled AsyncClient alive across overlapping callers.
+
+    Every ``async with mexc_client`` block takes a lease; the client is only
+    torn down when the last lease is returned *and* nobody pinned it. The
+    application lifespan pins the client so nested blocks become no-ops and
+    TCP/TLS connections are reused for the whole process lifetime.
+    """
+
+    def __init__(self, factory: Callable[[], httpx.AsyncClient]):
+        self._factory = factory
+        self._client: Optional[httpx.AsyncClient] = None
+        self._leases = 0
+        self._pinned = False
+
+    @property
+    def is_open(self) -> bool:
+        return self._client is not None
+
+    @property
+    def is_pinned(self) -> bool:
+        return self._pinned
+
+    @property
+    def leases(self) -> int:
+        return self._leases
+
+    def get(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = self._factory()
+        return self._client
+
+    def acquire(self) -> httpx.AsyncClient:
+        self._leases += 1
+        return self.get()
+
+    async def release(self, close_when_idle: bool = True) -> None:
+        self._leases = max(0, self._leases - 1)
+        if close_when_idle and self._leases == 0 and not self._pinned:
+            await self._aclose()
+
+    def pin(self) -> httpx.AsyncClient:
+        """Keep the client open until :meth:`close` is called explicitly."""
+        self._pinned = True
+        return self.get()
+
+    async def close(self) -> None:
+        """Unpin and close the client regardless of outstanding leases."""
+        self._pinned = False
+        if self._leases:
+            logger.debug("Closing MEXC HTTP client with %s active leases", self._leases)
+        await self._aclose()
+
+    async def _aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+
+__all__ = ["ClientPool"]
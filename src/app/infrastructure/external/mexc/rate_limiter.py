@@ -0,0 +1,109 @@
+"""Weight-aware token-bucket rate limiter for the MEXC REST client."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Mapping, Optional
+
+from .rate_limits import IP_BUCKET, ORDER_BUCKET
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """FIFO token bucket; callers queue here before a request is sent."""
+
+    def __init__(self, capacity: float, period: float):
+        self.capacity = float(capacity)
+        self.rate = self.capacity / period
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, weight: float = 1.0) -> float:
+        """Wait until ``weight`` tokens are available; return seconds waited."""
+        weight = min(float(weight), self.capacity)
+        started = time.monotonic()
+        async with self._lock:
+            while True:
+                self._refill()
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    await asyncio.sleep(self._blocked_until - now)
+                    continue
+                if self._tokens >= weight:
+                    self._tokens -= weight
+                    return time.monotonic() - started
+                await asyncio.sleep((weight - self._tokens) / self.rate)
+
+    def block_for(self, seconds: float) -> None:
+        """Pause the bucket, e.g. after a ``Retry-After`` response."""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def sync_used(self, used: float) -> None:
+        """Align the local budget with server-reported used weight."""
+        self._refill()
+        self._tokens = min(self._tokens, max(0.0, self.capacity - used))
+
+    def utilization(self) -> float:
+        self._refill()
+        return round(1.0 - self._tokens / self.capacity, 4)
+
+
+class RateLimiter:
+    """Per-bucket token buckets plus response-header feedback."""
+
+    def __init__(self, weight_per_period: int, order_per_period: int, period: float):
+        self.buckets: Dict[str, TokenBucket] = {
+            IP_BUCKET: TokenBucket(weight_per_period, period),
+            ORDER_BUCKET: TokenBucket(order_per_period, period),
+        }
+
+    async def acquire(self, bucket: str, weight: int) -> float:
+        return await self.buckets[bucket].acquire(weight)
+
+    def observe(self, bucket: str, status: int, headers: Mapping[str, str]) -> Optional[float]:
+        """Feed response headers back; return the server-requested pause if any."""
+        target = self.buckets[bucket]
+        used = _header_float(headers, "x-mbx-used-weight", "x-ratelimit-used")
+        if used is not None:
+            target.sync_used(used)
+        retry_after = _header_float(headers, "retry-after")
+        if status in (429, 418) or retry_after is not None:
+            pause = retry_after if retry_after is not None else 1.0
+            logger.warning("MEXC rate limit hit on %s bucket, pausing %.2fs", bucket, pause)
+            target.block_for(pause)
+            return pause
+        return None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            name: {
+                "capacity": bucket.capacity,
+                "utilization": bucket.utilization(),
+            }
+            for name, bucket in self.buckets.items()
+        }
+
+
+def _header_float(headers: Mapping[str, str], *names: str) -> Optional[float]:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+__all__ = ["RateLimiter", "TokenBucket"]
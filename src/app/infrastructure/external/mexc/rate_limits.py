@@ -0,0 +1,73 @@
+"""
+MEXC spot v3 request weights used by the client-side rate limiter.
+
+Weights follow the MEXC API docs; endpoints not listed cost 1. Order
+placement and cancellation are metered against a separate bucket so that
+market-data bursts can never starve them.
+"""
+from typing import Any, Dict, Optional, Tuple
+
+IP_BUCKET = "ip"
+ORDER_BUCKET = "order"
+
+ORDER_ENDPOINTS = {
+    ("POST", "/api/v3/order"),
+    ("DELETE", "/api/v3/order"),
+    ("POST", "/api/v3/batchOrders"),
+    ("DELETE", "/api/v3/openOrders"),
+}
+
+_ENDPOINT_WEIGHTS: Dict[str, int] = {
+    "/api/v3/account": 10,
+    "/api/v3/exchangeInfo": 10,
+    "/api/v3/myTrades": 10,
+    "/api/v3/allOrders": 10,
+    "/api/v3/openOrders": 3,
+    "/api/v3/order": 2,
+    "/api/v3/trades": 5,
+    "/api/v3/historicalTrades": 1,
+    "/api/v3/aggTrades": 1,
+    "/api/v3/klines": 1,
+    "/api/v3/userDataStream": 1,
+}
+
+# Unsymboled ticker variants return every market and cost more.
+_ALL_SYMBOL_WEIGHTS: Dict[str, int] = {
+    "/api/v3/ticker/24hr": 40,
+    "/api/v3/ticker/price": 2,
+    "/api/v3/ticker/bookTicker": 2,
+}
+
+# (max limit, weight) steps for /api/v3/depth
+_DEPTH_WEIGHTS: Tuple[Tuple[int, int], ...] = ((100, 1), (500, 5), (1000, 10), (5000, 50))
+
+
+def endpoint_bucket(method: str, endpoint: str) -> str:
+    return ORDER_BUCKET if (method.upper(), endpoint) in ORDER_ENDPOINTS else IP_BUCKET
+
+
+def endpoint_weight(
+    method: str, endpoint: str, params: Optional[Dict[str, Any]] = None
+) -> int:
+    """Return the request weight MEXC charges for a call."""
+    params = params or {}
+    if endpoint == "/api/v3/depth":
+        limit = int(params.get("limit") or 100)
+        for max_limit, weight in _DEPTH_WEIGHTS:
+            if limit <= max_limit:
+                return weight
+        return _DEPTH_WEIGHTS[-1][1]
+    if endpoint in _ALL_SYMBOL_WEIGHTS:
+        return 1 if params.get("symbol") else _ALL_SYMBOL_WEIGHTS[endpoint]
+    if endpoint == "/api/v3/order" and method.upper() != "GET":
+        return 1
+    return _ENDPOINT_WEIGHTS.get(endpoint, 1)
+
+
+__all__ = [
+    "IP_BUCKET",
+    "ORDER_BUCKET",
+    "ORDER_ENDPOINTS",
+    "endpoint_bucket",
+    "endpoint_weight",
+]
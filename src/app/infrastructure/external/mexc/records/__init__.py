@@ -0,0 +1,14 @@
+"""Typed, slotted records decoded once at the MEXC REST boundary."""
+from .account import AccountRecord, BalanceRecord
+from .market import DepthRecord, KlineRecord, TickerRecord
+from .orders import BatchOrder, BatchResult
+
+__all__ = [
+    "AccountRecord",
+    "BalanceRecord",
+    "BatchOrder",
+    "BatchResult",
+    "DepthRecord",
+    "KlineRecord",
+    "TickerRecord",
+]
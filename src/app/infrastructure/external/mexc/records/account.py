@@ -0,0 +1,54 @@
+"""Account records for ``/api/v3/account`` payloads."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from src.app.infrastructure.utils import safe_float
+
+
+@dataclass(frozen=True, slots=True)
+class BalanceRecord:
+    asset: str
+    free: float
+    locked: float
+
+    @property
+    def total(self) -> float:
+        return self.free + self.locked
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "BalanceRecord":
+        return cls(
+            asset=raw.get("asset", ""),
+            free=safe_float(raw.get("free")),
+            locked=safe_float(raw.get("locked")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AccountRecord:
+    balances: Dict[str, BalanceRecord]
+    can_trade: bool = True
+    update_time: Optional[int] = None
+
+    def balance(self, asset: str) -> BalanceRecord:
+        return self.balances.get(asset) or BalanceRecord(asset, 0.0, 0.0)
+
+    def non_zero(self) -> Dict[str, BalanceRecord]:
+        return {a: b for a, b in self.balances.items() if b.free > 0 or b.locked > 0}
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "AccountRecord":
+        balances = {}
+        for item in raw.get("balances", []):
+            record = BalanceRecord.from_raw(item)
+            balances[record.asset] = record
+        return cls(
+            balances=balances,
+            can_trade=bool(raw.get("canTrade", True)),
+            update_time=raw.get("updateTime"),
+        )
+
+
+__all__ = ["AccountRecord", "BalanceRecord"]
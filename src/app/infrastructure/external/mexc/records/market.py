@@ -0,0 +1,90 @@
+"""Market-data records for ticker, depth and kline payloads."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+from src.app.infrastructure.utils import safe_float
+
+PriceLevel = Tuple[float, float]
+
+
+@dataclass(frozen=True, slots=True)
+class TickerRecord:
+    symbol: str
+    last_price: float
+    open_price: float
+    high_price: float
+    low_price: float
+    volume: float
+    quote_volume: float
+    price_change_percent: float
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "TickerRecord":
+        return cls(
+            symbol=raw.get("symbol", ""),
+            last_price=safe_float(raw.get("lastPrice")),
+            open_price=safe_float(raw.get("openPrice")),
+            high_price=safe_float(raw.get("highPrice")),
+            low_price=safe_float(raw.get("lowPrice")),
+            volume=safe_float(raw.get("volume")),
+            quote_volume=safe_float(raw.get("quoteVolume")),
+            price_change_percent=safe_float(raw.get("priceChangePercent")),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DepthRecord:
+    last_update_id: int
+    bids: List[PriceLevel]
+    asks: List[PriceLevel]
+
+    @classmethod
+    def from_raw(cls, raw: Dict[str, Any]) -> "DepthRecord":
+        return cls(
+            last_update_id=int(raw.get("lastUpdateId") or 0),
+            bids=[(float(p), float(q)) for p, q, *_ in raw.get("bids", [])],
+            asks=[(float(p), float(q)) for p, q, *_ in raw.get("asks", [])],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class KlineRecord:
+    open_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    close_time: int
+    quote_volume: float
+
+    @classmethod
+    def from_raw(cls, row: Sequence[Any]) -> "KlineRecord":
+        # MEXC: [openTime, open, high, low, close, volume, closeTime, quoteVolume]
+        return cls(
+            int(row[0]),
+            float(row[1]),
+            float(row[2]),
+            float(row[3]),
+            float(row[4]),
+            float(row[5]),
+            int(row[6]),
+            float(row[7]) if len(row) > 7 else 0.0,
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "open_time": self.open_time,
+            "open": self.open,
+            "high": self.high,
+            "low": self.low,
+            "close": self.close,
+            "volume": self.volume,
+            "close_time": self.close_time,
+            "quote_volume": self.quote_volume,
+        }
+
+
+__all__ = ["DepthRecord", "KlineRecord", "PriceLevel", "TickerRecord"]
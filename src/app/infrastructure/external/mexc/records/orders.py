@@ -0,0 +1,51 @@
+"""Order records for batch placement and cancellation."""
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+
+def new_client_order_id() -> str:
+    return uuid.uuid4().hex
+
+
+@dataclass(frozen=True, slots=True)
+class BatchOrder:
+    """One order of a batch; ``client_order_id`` keys its result."""
+
+    side: str
+    order_type: str = "LIMIT"
+    quantity: Optional[float] = None
+    price: Optional[float] = None
+    quote_order_qty: Optional[float] = None
+    client_order_id: str = field(default_factory=new_client_order_id)
+
+
+@dataclass(slots=True)
+class BatchResult:
+    """Per-order outcome of a batch call, keyed by client order ID.
+
+    ``unknown`` orders were sent but got no answer (timeout, dropped
+    connection, 5xx): they may exist on MEXC and must be reconciled by
+    client order ID before being retried.
+    """
+
+    succeeded: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    failed: Dict[str, str] = field(default_factory=dict)
+    unknown: Dict[str, str] = field(default_factory=dict)
+    requests: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.failed and not self.unknown
+
+    def merge(self, other: "BatchResult") -> "BatchResult":
+        self.succeeded.update(other.succeeded)
+        self.failed.update(other.failed)
+        self.unknown.update(other.unknown)
+        self.requests += other.requests
+        return self
+
+
+__all__ = ["BatchOrder", "BatchResult", "new_client_order_id"]
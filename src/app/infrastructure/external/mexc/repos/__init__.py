@@ -3,6 +3,9 @@ from src.app.infrastructure.external.mexc.repos.account_repo import (
     AccountRepoMixin,
     AccountRepository,
 )
+from src.app.infrastructure.external.mexc.repos.batch_order_repo import (
+    BatchOrderRepoMixin,
+)
 from src.app.infrastructure.external.mexc.repos.trade_repo import TradeRepoMixin
 from src.app.infrastructure.external.mexc.repos.sub_account_broker_repo import (
     SubAccountBrokerRepoMixin,
@@ -19,6 +22,7 @@ SubAccountSpotRepository = SubAccountSpotRepoMixin
 __all__ = [
     "AccountRepoMixin",
     "AccountRepository",
+    "BatchOrderRepoMixin",
     "TradeRepoMixin",
     "TradeRepository",
     "SubAccountBrokerRepoMixin",
@@ -0,0 +1,95 @@
+"""Batch order placement and cancellation for the MEXC client."""
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional, Sequence
+
+import httpx
+import orjson
+
+from src.app.infrastructure.external.mexc.exceptions import MexcCircuitOpen
+from src.app.infrastructure.external.mexc.records.orders import BatchOrder, BatchResult
+from src.app.infrastructure.external.mexc.repos.batch_payloads import (
+    BATCH_ORDER_LIMIT,
+    collect_results,
+    order_payload,
+)
+from src.app.infrastructure.external.mexc.symbol_filters import OrderFilterError
+
+
+def is_rejection(exc: Exception) -> bool:
+    """True when MEXC answered and the orders were certainly not placed."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code < 500
+    return isinstance(exc, MexcCircuitOpen)  # never sent
+
+
+class BatchOrderRepoMixin:
+    async def create_orders_batch(
+        self, symbol: str, orders: Sequence[BatchOrder]
+    ) -> BatchResult:
+        """Place orders in signed batches of ``BATCH_ORDER_LIMIT``.
+
+        Orders that break the symbol's filters are reported as failed
+        without being sent; one failed batch does not stop the others.
+        A batch whose outcome is unknown (timeout, transport error, 5xx)
+        lands in ``unknown``; reconcile it with
+        ``get_order(symbol, orig_client_order_id=...)``.
+        """
+        result = BatchResult()
+        filters = await self._order_filters(symbol)
+        payloads = []
+        for order in orders:
+            try:
+                payloads.append(order_payload(symbol, order, filters))
+            except OrderFilterError as exc:
+                result.failed[order.client_order_id] = str(exc)
+        chunks = [
+            payloads[i : i + BATCH_ORDER_LIMIT]
+            for i in range(0, len(payloads), BATCH_ORDER_LIMIT)
+        ]
+        for outcome in await asyncio.gather(*(self._send_batch(c) for c in chunks)):
+            result.merge(outcome)
+        return result
+
+    async def _send_batch(self, chunk: List[Dict[str, str]]) -> BatchResult:
+        ids = [payload["newClientOrderId"] for payload in chunk]
+        params = {"batchOrders": orjson.dumps(chunk).decode()}
+        try:
+            # Not idempotent: a resend after an unanswered attempt could
+            # place the orders twice, so unknown outcomes go to the caller.
+            items = await self._request(
+                "POST", "/api/v3/batchOrders", params=params, signed=True, max_retries=1
+            )
+        except Exception as exc:
+            outcome = {i: str(exc) for i in ids}
+            if is_rejection(exc):
+                return BatchResult(failed=outcome, requests=1)
+            return BatchResult(unknown=outcome, requests=1)
+        return collect_results(BatchResult(requests=1), ids, items, "newClientOrderId")
+
+    async def cancel_orders_batch(
+        self, symbol: str, client_order_ids: Optional[Sequence[str]] = None
+    ) -> BatchResult:
+        """Cancel the given orders, or every open order on ``symbol`` in one call."""
+        if client_order_ids is None:
+            items = await self._request(
+                "DELETE", "/api/v3/openOrders", params={"symbol": symbol}, signed=True
+            )
+            result = BatchResult(requests=1)
+            return collect_results(result, [], items, "origClientOrderId")
+        ids = list(client_order_ids)
+        outcomes = await asyncio.gather(
+            *(self.cancel_order(symbol, orig_client_order_id=i) for i in ids),
+            return_exceptions=True,
+        )
+        result = BatchResult(requests=len(ids))
+        for client_id, outcome in zip(ids, outcomes):
+            if isinstance(outcome, Exception):
+                result.failed[client_id] = str(outcome)
+            else:
+                result.succeeded[client_id] = outcome
+        return result
+
+
+__all__ = ["BATCH_ORDER_LIMIT", "BatchOrderRepoMixin", "is_rejection"]
@@ -0,0 +1,50 @@
+"""Request payloads and result mapping for MEXC batch order calls."""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from src.app.infrastructure.external.mexc.records.orders import BatchOrder, BatchResult
+from src.app.infrastructure.external.mexc.symbol_filters import SymbolFilters
+from src.app.infrastructure.external.mexc.utils.signature import _format_value
+
+# MEXC accepts at most 20 same-symbol orders per /api/v3/batchOrders call.
+BATCH_ORDER_LIMIT = 20
+
+
+def order_payload(
+    symbol: str, order: BatchOrder, filters: Optional[SymbolFilters]
+) -> Dict[str, str]:
+    quantity, quote, price = order.quantity, order.quote_order_qty, order.price
+    if filters is not None:
+        quantity, quote, price = filters.prepare(quantity, quote, price)
+    payload = {
+        "symbol": symbol,
+        "side": order.side.upper(),
+        "type": order.order_type,
+        "newClientOrderId": order.client_order_id,
+    }
+    amounts = (("quantity", quantity), ("quoteOrderQty", quote), ("price", price))
+    for key, value in amounts:
+        if value:
+            payload[key] = _format_value(value)
+    return payload
+
+
+def collect_results(
+    result: BatchResult, ids: List[str], items: Any, id_key: str
+) -> BatchResult:
+    """Map per-order results (in request order) back to client order IDs."""
+    for position, item in enumerate(items if isinstance(items, list) else []):
+        fallback = ids[position] if position < len(ids) else str(item.get("orderId"))
+        client_id = item.get(id_key) or item.get("clientOrderId") or fallback
+        if item.get("orderId"):
+            result.succeeded[client_id] = item
+        else:
+            result.failed[client_id] = item.get("msg") or f"code {item.get('code')}"
+    for client_id in ids:
+        if client_id not in result.succeeded and client_id not in result.failed:
+            result.failed[client_id] = "no result returned"
+    return result
+
+
+__all__ = ["BATCH_ORDER_LIMIT", "collect_results", "order_payload"]
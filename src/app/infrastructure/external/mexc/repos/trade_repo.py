@@ -1,8 +1,12 @@
 """Trading endpoints mixin for MEXC client."""
 from typing import Dict, Optional, Any
 
+from src.app.infrastructure.external.mexc.repos.batch_order_repo import (
+    BatchOrderRepoMixin,
+)
 
-class TradeRepoMixin:
+
+class TradeRepoMixin(BatchOrderRepoMixin):
     async def create_order(
         self,
         symbol: str,
@@ -12,7 +16,15 @@ class TradeRepoMixin:
         quote_order_qty: Optional[float] = None,
         price: Optional[float] = None,
         time_in_force: str = "GTC",
+        reference_price: Optional[float] = None,
     ) -> Dict[str, Any]:  # type: ignore[name-defined]
+        # Quantize to the symbol's step/tick and reject what MEXC would reject
+        # (OrderFilterError) before the order goes over the wire.
+        filters = await self._order_filters(symbol)
+        if filters is not None:
+            quantity, quote_order_qty, price = filters.prepare(
+                quantity, quote_order_qty, price, reference_price
+            )
         params = {"symbol": symbol, "side": side, "type": order_type}
         if quantity:
             params["quantity"] = quantity
@@ -0,0 +1,33 @@
+"""Translate a MEXC call into the URL and httpx keyword arguments."""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Tuple
+
+
+def use_query_params(method: str, endpoint: str) -> bool:
+    normalized = method.upper()
+    if normalized in {"GET", "DELETE"}:
+        return True
+    if normalized == "PUT" and "userDataStream" in endpoint:
+        return True
+    return False
+
+
+def build_request_args(
+    base_url: str,
+    method: str,
+    endpoint: str,
+    payload: Dict[str, Any],
+    signed_query: Optional[str] = None,
+) -> Tuple[str, Dict[str, Any]]:
+    url = f"{base_url}{endpoint}"
+    if signed_query is not None:
+        # Send exactly the bytes that were signed; MEXC accepts signed
+        # params in the query string for every method.
+        return f"{url}?{signed_query}", {}
+    if use_query_params(method, endpoint):
+        return url, {"params": payload}
+    return url, {"json": payload}
+
+
+__all__ = ["build_request_args", "use_query_params"]
@@ -0,0 +1,117 @@
+"""Retry/backoff loop for MEXC HTTP requests."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, Optional
+
+import httpx
+
+from .deadline import Deadline, within
+from .exceptions import MexcRequestError
+from .hedging import hedged
+from .rate_limiter import RateLimiter
+from .rate_limits import IP_BUCKET
+from .utils.parser import decode_json
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = (429, 503, 504)
+
+
+def _fits(wait: float, deadline: Optional[Deadline]) -> bool:
+    return deadline is None or wait < deadline.remaining()
+
+
+async def send_with_retries(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    request_kwargs: Dict[str, Any],
+    max_retries: int,
+    limiter: Optional[RateLimiter] = None,
+    bucket: str = IP_BUCKET,
+    weight: int = 1,
+    deadline: Optional[Deadline] = None,
+    hedge_after: Optional[float] = None,
+    on_latency: Optional[Callable[[float], None]] = None,
+) -> Any:
+    """Send a request, retrying throttling and transport errors with backoff.
+
+    With a limiter, every attempt first queues for its request weight, and
+    a server-requested pause (``Retry-After``) replaces the blind backoff.
+    With a deadline, queueing, attempts and backoff all share the remaining
+    budget and a retry that cannot fit is not started. ``hedge_after`` fires
+    a duplicate attempt when the first one is slower than that many seconds.
+    """
+
+    async def acquire() -> None:
+        if limiter is not None:
+            await limiter.acquire(bucket, weight)
+
+    async def send() -> httpx.Response:
+        started = time.monotonic()
+        response = await client.request(method, url, **request_kwargs)
+        if on_latency is not None:
+            on_latency(time.monotonic() - started)
+        return response
+
+    async def attempt_once() -> httpx.Response:
+        # Weight is held before the hedge timer starts, so time queued
+        # behind the local limiter never counts as exchange latency.
+        await acquire()
+        return await hedged(send, hedge_after, hedge=duplicate)
+
+    async def duplicate() -> httpx.Response:
+        await acquire()
+        return await send()
+
+    last_error: Optional[Exception] = None
+    for attempt in range(max_retries):
+        try:
+            response = await within(attempt_once(), deadline)
+        except httpx.RequestError as exc:
+            last_error = exc
+            wait = 2**attempt
+            if attempt < max_retries - 1 and _fits(wait, deadline):
+                logger.warning(
+                    "MEXC API network error: %s, retrying in %ss (attempt %s/%s)",
+                    exc,
+                    wait,
+                    attempt + 1,
+                    max_retries,
+                )
+                await asyncio.sleep(wait)
+                continue
+            raise
+
+        pause = None
+        if limiter is not None:
+            pause = limiter.observe(bucket, response.status_code, response.headers)
+        status = response.status_code
+        # A server-set pause is already enforced by the limiter's bucket.
+        wait = 0 if pause is not None else 2**attempt
+        if (
+            status in RETRYABLE_STATUS
+            and attempt < max_retries - 1
+            and _fits(pause or wait, deadline)
+        ):
+            logger.warning(
+                "MEXC API error %s, retrying in %ss (attempt %s/%s)",
+                status,
+                pause if pause is not None else wait,
+                attempt + 1,
+                max_retries,
+            )
+            await asyncio.sleep(wait)
+            continue
+        response.raise_for_status()
+        return decode_json(response.content)
+
+    if last_error:
+        raise last_error
+    raise MexcRequestError("Unknown request failure")
+
+
+__all__ = ["RETRYABLE_STATUS", "send_with_retries"]
@@ -0,0 +1,72 @@
+"""Server clock-offset and latency tracking for signed MEXC requests."""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_RECV_WINDOW_MS = 5000
+MAX_RECV_WINDOW_MS = 60000
+
+
+class ServerClock:
+    """
+    Smoothed estimate of (server time - local time) and round-trip time.
+
+    Each sample from ``/api/v3/time`` assumes the server stamped its clock
+    half-way through the round trip. Offset, RTT and jitter are kept as
+    exponentially weighted moving averages so one slow sample cannot yank
+    the clock around.
+    """
+
+    def __init__(
+        self,
+        alpha: float = 0.25,
+        min_recv_window: int = DEFAULT_RECV_WINDOW_MS,
+        max_recv_window: int = MAX_RECV_WINDOW_MS,
+    ):
+        self.alpha = alpha
+        self.min_recv_window = min_recv_window
+        self.max_recv_window = max_recv_window
+        self.offset_ms = 0.0
+        self.rtt_ms: Optional[float] = None
+        self.jitter_ms = 0.0
+        self.samples = 0
+        self.last_sync: Optional[float] = None
+
+    def record(self, sent_ms: float, server_ms: float, received_ms: float) -> None:
+        rtt = max(0.0, received_ms - sent_ms)
+        offset = server_ms - (sent_ms + rtt / 2)
+        if self.samples == 0:
+            self.offset_ms = offset
+            self.rtt_ms = rtt
+        else:
+            deviation = abs(offset - self.offset_ms)
+            self.jitter_ms += self.alpha * (deviation - self.jitter_ms)
+            self.offset_ms += self.alpha * (offset - self.offset_ms)
+            self.rtt_ms += self.alpha * (rtt - self.rtt_ms)
+        self.samples += 1
+        self.last_sync = time.time()
+
+    def now_ms(self) -> int:
+        """Local wall clock corrected to the exchange's clock."""
+        return int(time.time() * 1000 + self.offset_ms)
+
+    def recv_window(self) -> int:
+        """recvWindow sized to a few round trips plus observed jitter."""
+        if self.rtt_ms is None:
+            return self.min_recv_window
+        budget = 3 * (self.rtt_ms + 4 * self.jitter_ms)
+        return int(min(self.max_recv_window, max(self.min_recv_window, budget)))
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "offset_ms": round(self.offset_ms, 3),
+            "rtt_ms": round(self.rtt_ms, 3) if self.rtt_ms is not None else None,
+            "jitter_ms": round(self.jitter_ms, 3),
+            "recv_window_ms": self.recv_window(),
+            "samples": self.samples,
+            "last_sync": self.last_sync,
+        }
+
+
+__all__ = ["DEFAULT_RECV_WINDOW_MS", "MAX_RECV_WINDOW_MS", "ServerClock"]
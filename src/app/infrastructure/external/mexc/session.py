@@ -1,13 +1,70 @@
 """Session builders for HTTP clients."""
-from typing import Dict
+import logging
+from typing import Dict, Optional
 
 import httpx
 
+from .cassette_transport import LATENCY_NONE, RecordingTransport, ReplayTransport
 
-def build_async_client(headers: Dict[str, str], timeout: float) -> httpx.AsyncClient:
-    """Create a configured AsyncClient with sane defaults."""
-    limits = httpx.Limits(max_keepalive_connections=5, max_connections=10)
-    return httpx.AsyncClient(headers=headers, timeout=timeout, limits=limits)
+try:
+    import h2  # noqa: F401
+except ImportError:
+    h2 = None
 
+logger = logging.getLogger(__name__)
 
-__all__ = ["build_async_client"]
+CASSETTE_RECORD = "record"
+CASSETTE_REPLAY = "replay"
+
+
+def build_async_client(
+    headers: Dict[str, str],
+    timeout: float,
+    http2: bool = False,
+    max_keepalive: int = 5,
+    max_connections: int = 10,
+    keepalive_expiry: float = 5.0,
+    cassette: Optional[str] = None,
+    cassette_mode: Optional[str] = None,
+    replay_latency: str = LATENCY_NONE,
+) -> httpx.AsyncClient:
+    """Create a configured AsyncClient with sane defaults.
+
+    HTTP/2 needs the ``h2`` package (``httpx[http2]``); without it the
+    client warns and falls back to HTTP/1.1 keep-alive.
+    With a ``cassette`` path, ``cassette_mode="record"`` saves every
+    response to it and ``"replay"`` serves them back with no network;
+    any other mode raises ``ValueError`` rather than going live.
+    """
+    limits = httpx.Limits(
+        max_keepalive_connections=max_keepalive,
+        max_connections=max_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    use_http2 = http2 and h2 is not None
+    if http2 and not use_http2:
+        logger.warning("HTTP/2 requested but h2 is not installed; using HTTP/1.1")
+    transport: Optional[httpx.AsyncBaseTransport] = None
+    if cassette:
+        cassette_mode = (cassette_mode or "").strip().lower()
+        if cassette_mode not in (CASSETTE_RECORD, CASSETTE_REPLAY):
+            raise ValueError(
+                f"cassette_mode must be {CASSETTE_RECORD!r} or {CASSETTE_REPLAY!r}"
+                f" when a cassette is set, got {cassette_mode!r}"
+            )
+    if cassette and cassette_mode == CASSETTE_REPLAY:
+        transport = ReplayTransport.from_file(cassette, latency=replay_latency)
+    elif cassette and cassette_mode == CASSETTE_RECORD:
+        transport = RecordingTransport(
+            httpx.AsyncHTTPTransport(limits=limits, http2=use_http2), cassette
+        )
+    return httpx.AsyncClient(
+        headers=headers,
+        timeout=timeout,
+        limits=limits,
+        http2=use_http2,
+        transport=transport,
+    )
+
+
+__all__ = ["CASSETTE_RECORD", "CASSETTE_REPLAY", "build_async_client"]
@@ -1,4 +1,8 @@
 """Signing utilities kept for backward compatibility."""
-from src.app.infrastructure.external.mexc.utils.signature import generate_signature
+from src.app.infrastructure.external.mexc.utils.signature import (
+    Signer,
+    encode_params,
+    generate_signature,
+)
 
-__all__ = ["generate_signature"]
+__all__ = ["Signer", "encode_params", "generate_signature"]
@@ -0,0 +1,54 @@
+"""Signed-request helpers for the MEXC client."""
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import httpx
+
+from .utils.signature import Signer, encode_params
+
+# MEXC: "Timestamp for this request is outside of the recvWindow"
+TIMESTAMP_REJECTION_CODES = {700003}
+
+
+class SigningMixin:
+    """Credential checks, cached HMAC signer and clock-corrected stamping."""
+
+    _signer: Optional[Signer] = None
+
+    def _require_credentials(self) -> None:
+        if not self.settings.api_key or not self.settings.secret_key:
+            raise ValueError(
+                "API key and secret key required for authenticated requests"
+            )
+
+    def _get_signer(self) -> Signer:
+        if not self.settings.secret_key:
+            raise ValueError("Secret key required for authenticated requests")
+        if self._signer is None:
+            self._signer = Signer(self.settings.secret_key)
+        return self._signer
+
+    def _generate_signature(self, params: Dict[str, Any]) -> str:
+        return self._get_signer().sign(encode_params(params))
+
+    def _sign_payload(self, payload: Dict[str, Any]) -> str:
+        """Stamp server-aligned timestamp/recvWindow and return the signed query."""
+        self._require_credentials()
+        payload["timestamp"] = self.clock.now_ms()
+        payload.setdefault("recvWindow", self.clock.recv_window())
+        return self._get_signer().encode(payload)
+
+
+def is_timestamp_rejection(exc: Exception) -> bool:
+    """True when MEXC rejected a signed call because of clock drift."""
+    if not isinstance(exc, httpx.HTTPStatusError):
+        return False
+    try:
+        body = exc.response.json()
+    except ValueError:
+        return False
+    return isinstance(body, dict) and body.get("code") in TIMESTAMP_REJECTION_CODES
+
+
+__all__ = ["SigningMixin", "TIMESTAMP_REJECTION_CODES", "is_timestamp_rejection"]
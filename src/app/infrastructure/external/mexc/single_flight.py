@@ -0,0 +1,91 @@
+"""Single-flight coalescing for identical in-flight requests."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+_MAX_RECENT = 256
+
+
+class SingleFlight:
+    """
+    Share one in-flight call between concurrent callers with the same key.
+
+    Late arrivals within ``ttl`` seconds of completion reuse the last result.
+    The shared call runs as its own task, so a cancelled caller never cancels
+    the fetch other callers are waiting on. Results are shared objects and
+    must be treated as read-only.
+    """
+
+    def __init__(self, ttl: float = 0.0):
+        self.ttl = ttl
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._recent: Dict[Hashable, Tuple[float, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        cached = self._recent_result(key)
+        if cached is not None:
+            self.hits += 1
+            return cached[1]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.misses += 1
+            task = asyncio.ensure_future(self._run(key, fn))
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+        else:
+            self.hits += 1
+        return await asyncio.shield(task)
+
+    async def _run(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await fn()
+            if self.ttl > 0:
+                self._remember(key, result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def _recent_result(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        entry = self._recent.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            self._recent.pop(key, None)
+            return None
+        return entry
+
+    def _remember(self, key: Hashable, result: Any) -> None:
+        now = time.monotonic()
+        if len(self._recent) >= _MAX_RECENT:
+            expired = [k for k, (ts, _) in self._recent.items() if now - ts >= self.ttl]
+            for stale in expired:
+                del self._recent[stale]
+        self._recent[key] = (now, result)
+
+    def clear(self) -> None:
+        self._recent.clear()
+
+
+def request_key(
+    method: str, endpoint: str, params: Optional[Dict[str, Any]]
+) -> Optional[Hashable]:
+    """Build a hashable key for a request, or None if params are unhashable."""
+    try:
+        items = tuple(sorted((params or {}).items()))
+        hash(items)
+    except TypeError:
+        return None
+    return (method, endpoint, items)
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+__all__ = ["SingleFlight", "request_key"]
@@ -0,0 +1,102 @@
+"""
+Per-symbol trading rules precomputed from ``/api/v3/exchangeInfo``.
+
+MEXC reports precisions on the symbol itself (``baseAssetPrecision``,
+``quotePrecision``, ``baseSizePrecision`` as min quantity and
+``quoteAmountPrecision`` as min order value); Binance-style ``filters`` win
+when present. Amounts are floored to the step so an order never exceeds
+what the caller asked for.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple, Union
+
+Number = Union[float, int, str, Decimal]
+
+
+class OrderFilterError(ValueError):
+    """Raised when an order cannot satisfy its symbol's trading rules."""
+
+
+def _dec(value: Number) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(repr(value) if isinstance(value, float) else str(value))
+
+
+def _step(precision: Any) -> Decimal:
+    """Step for a decimal-places precision; 0 means unconstrained."""
+    return Decimal(1).scaleb(-int(precision)) if precision is not None else Decimal(0)
+
+
+def _floor(value: Decimal, step: Decimal) -> Decimal:
+    if step <= 0:
+        return value
+    return ((value // step) * step).normalize()
+
+
+@dataclass(frozen=True, slots=True)
+class SymbolFilters:
+    symbol: str
+    step_size: Decimal
+    tick_size: Decimal
+    quote_step: Decimal
+    min_qty: Decimal
+    min_notional: Decimal
+
+    @classmethod
+    def from_raw(cls, info: Dict[str, Any]) -> "SymbolFilters":
+        filters = {f.get("filterType"): f for f in info.get("filters") or []}
+        lot = filters.get("LOT_SIZE", {})
+        price = filters.get("PRICE_FILTER", {})
+        notional = filters.get("MIN_NOTIONAL") or filters.get("NOTIONAL") or {}
+        step = lot.get("stepSize") or _step(info.get("baseAssetPrecision"))
+        tick = price.get("tickSize") or _step(info.get("quotePrecision"))
+        min_value = notional.get("minNotional") or info.get("quoteAmountPrecision")
+        return cls(
+            symbol=info.get("symbol", ""),
+            step_size=_dec(step),
+            tick_size=_dec(tick),
+            quote_step=_step(info.get("quoteAssetPrecision")),
+            min_qty=_dec(lot.get("minQty") or info.get("baseSizePrecision") or 0),
+            min_notional=_dec(min_value or 0),
+        )
+
+    def quantize_qty(self, quantity: Number) -> Decimal:
+        return _floor(_dec(quantity), self.step_size)
+
+    def quantize_price(self, price: Number) -> Decimal:
+        return _floor(_dec(price), self.tick_size)
+
+    def quantize_quote(self, amount: Number) -> Decimal:
+        return _floor(_dec(amount), self.quote_step)
+
+    def prepare(
+        self,
+        quantity: Optional[Number] = None,
+        quote_order_qty: Optional[Number] = None,
+        price: Optional[Number] = None,
+        reference_price: Optional[Number] = None,
+    ) -> Tuple[Optional[Decimal], Optional[Decimal], Optional[Decimal]]:
+        """Quantize order amounts and reject what MEXC would reject."""
+        qty = self.quantize_qty(quantity) if quantity else None
+        quote = self.quantize_quote(quote_order_qty) if quote_order_qty else None
+        px = self.quantize_price(price) if price else None
+        if qty is not None and (qty <= 0 or qty < self.min_qty):
+            raise OrderFilterError(
+                f"{self.symbol}: quantity {quantity} below minimum {self.min_qty}"
+            )
+        value = quote
+        mark = px or (_dec(reference_price) if reference_price else None)
+        if qty is not None and mark is not None:
+            value = qty * mark
+        if value is not None and value < self.min_notional:
+            raise OrderFilterError(
+                f"{self.symbol}: value {value} below minimum {self.min_notional}"
+            )
+        return qty, quote, px
+
+
+__all__ = ["OrderFilterError", "SymbolFilters"]
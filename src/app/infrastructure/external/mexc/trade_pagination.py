@@ -0,0 +1,51 @@
+"""Windowed trade history walk shared by aggTrades and myTrades backfills."""
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from .pagination import ordered_windows, page_window, split_windows
+
+TradeFetch = Callable[[int, int, Optional[int]], Awaitable[List[Dict[str, Any]]]]
+
+
+async def iter_trades(
+    fetch: TradeFetch,
+    start: int,
+    end: int,
+    span: int,
+    limit: int,
+    time_key: str,
+    id_key: str,
+    concurrency: int,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Yield trades in ``[start, end]`` once each, ordered by time."""
+
+    async def fetch_window(window):
+        return await page_window(fetch, window, limit, time_key, id_key)
+
+    seen_at_boundary: set = set()
+    boundary_time = None
+    windows = split_windows(start, end, span)
+    async for rows in ordered_windows(windows, fetch_window, concurrency):
+        for row in rows:
+            row_time, row_id = int(row[time_key]), _row_key(row, id_key)
+            if boundary_time is not None and row_time < boundary_time:
+                continue
+            if row_time != boundary_time:
+                boundary_time, seen_at_boundary = row_time, set()
+            if row_id in seen_at_boundary:
+                continue
+            seen_at_boundary.add(row_id)
+            yield row
+
+
+def _row_key(row: Dict[str, Any], id_key: str) -> Any:
+    # MEXC may return a null aggregate id; fall back to the full row.
+    row_id = row.get(id_key)
+    return row_id if row_id is not None else tuple(row.values())
+
+
+__all__ = [
+    "TradeFetch",
+    "iter_trades",
+]
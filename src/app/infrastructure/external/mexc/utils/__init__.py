@@ -1,6 +1,13 @@
 """Utility helpers for MEXC client (signing, parsing, types)."""
-from .signature import generate_signature
-from .parser import ensure_dict
+from .signature import Signer, encode_params, generate_signature
+from .parser import decode_json, ensure_dict
 from .types import JSONMapping
 
-__all__ = ["generate_signature", "ensure_dict", "JSONMapping"]
+__all__ = [
+    "Signer",
+    "encode_params",
+    "generate_signature",
+    "decode_json",
+    "ensure_dict",
+    "JSONMapping",
+]
@@ -1,6 +1,13 @@
 """Lightweight helpers for normalising API payloads."""
 from typing import Any, Dict
 
+import orjson
+
+
+def decode_json(content: bytes) -> Any:
+    """Decode a raw response body straight from bytes with orjson."""
+    return orjson.loads(content)
+
 
 def ensure_dict(payload: Any) -> Dict[str, Any]:
     """Return payload if dict else wrap for uniform handling."""
@@ -9,4 +16,4 @@ def ensure_dict(payload: Any) -> Dict[str, Any]:
     return {"raw": payload}
 
 
-__all__ = ["ensure_dict"]
+__all__ = ["decode_json", "ensure_dict"]
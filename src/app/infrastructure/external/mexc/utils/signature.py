@@ -1,20 +1,66 @@
 """Signature helpers for MEXC v3 requests."""
+from decimal import Decimal
 from typing import Any, Dict
 import hashlib
 import hmac
 from urllib.parse import urlencode
 
 
-def generate_signature(secret_key: str, params: Dict[str, Any]) -> str:
-    """Generate HMAC SHA256 signature with sorted params."""
+def _format_value(value: Any) -> str:
+    """Render a param the way MEXC expects (no exponents, lowercase bools)."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, float):
+        return format(Decimal(repr(value)), "f")
+    if isinstance(value, Decimal):
+        return format(value, "f")
+    return str(value)
+
+
+def encode_params(params: Dict[str, Any]) -> str:
+    """Encode params into the canonical (sorted) query string that is signed."""
+    return urlencode(
+        [(key, _format_value(value)) for key, value in sorted(params.items())]
+    )
+
+
+def _require_secret(secret_key: str) -> None:
     if secret_key is None or not secret_key.strip():
         raise ValueError("Secret key must be a non-empty string")
-    query_string = urlencode(sorted(params.items()))
+
+
+def generate_signature(secret_key: str, params: Dict[str, Any]) -> str:
+    """Generate HMAC SHA256 signature with sorted params."""
+    _require_secret(secret_key)
     return hmac.new(
         secret_key.encode("utf-8"),
-        query_string.encode("utf-8"),
+        encode_params(params).encode("utf-8"),
         hashlib.sha256,
     ).hexdigest()
 
 
-__all__ = ["generate_signature"]
+class Signer:
+    """
+    Reusable HMAC-SHA256 signer for MEXC signed requests.
+
+    The keyed HMAC state is built once and copied per request, and
+    :meth:`encode` returns the final query string so the exact bytes that
+    were signed are the bytes sent on the wire.
+    """
+
+    def __init__(self, secret_key: str):
+        _require_secret(secret_key)
+        self._mac = hmac.new(secret_key.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def sign(self, payload: str) -> str:
+        mac = self._mac.copy()
+        mac.update(payload.encode("utf-8"))
+        return mac.hexdigest()
+
+    def encode(self, params: Dict[str, Any]) -> str:
+        """Return ``<canonical query>&signature=<hex>`` ready to send."""
+        query = encode_params(params)
+        return f"{query}&signature={self.sign(query)}"
+
+
+__all__ = ["Signer", "encode_params", "generate_signature"]
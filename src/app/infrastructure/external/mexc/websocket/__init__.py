@@ -1,14 +1,37 @@
 """Websocket utilities for MEXC client."""
+from .channel_router import (
+    OVERFLOW_BLOCK,
+    OVERFLOW_CONFLATE,
+    OVERFLOW_DROP_OLDEST,
+    ChannelQueue,
+    ChannelRouter,
+)
 from .client import MEXCWebSocketClient, WS_BASE
+from .connection_pool import MAX_SUBSCRIPTIONS_PER_CONNECTION, WebSocketPool
 from .data_streams import (
     DEFAULT_USER_STREAM_CHANNELS,
     account_update_stream,
     user_deals_stream,
     user_orders_stream,
 )
+from .delivery_queues import (
+    DELIVER_ALL,
+    DELIVER_LATEST,
+    DELIVER_SAMPLED,
+    KeyedLatestQueue,
+)
+from .fanout_hub import MarketDataHub, market_hub
+from .hub_subscription import HubSubscription
+from .fast_decoders import build_fast_decoder, decode_push_records, peek_channel
+from .frame_reader import RecordedFrame, read_frames
+from .frame_recorder import FrameRecorder, start_recording, stop_recording
+from .frame_replay import ReplayClient
 from .handlers import MessageHandler
-from .manager import websocket_manager
+from .manager import websocket_manager, websocket_pool_manager
+from .latency_histogram import LatencyHistogram
+from .stream_monitor import StreamMonitor, stream_monitor
 from .market_streams import (
+    CANDLE_INTERVALS,
     BinaryDecoder,
     book_ticker_batch_stream,
     book_ticker_stream,
@@ -23,21 +46,49 @@ from .market_streams import (
 
 __all__ = [
     "BinaryDecoder",
+    "CANDLE_INTERVALS",
+    "ChannelQueue",
+    "ChannelRouter",
+    "DELIVER_ALL",
+    "DELIVER_LATEST",
+    "DELIVER_SAMPLED",
+    "FrameRecorder",
+    "HubSubscription",
+    "KeyedLatestQueue",
+    "LatencyHistogram",
+    "MarketDataHub",
+    "OVERFLOW_BLOCK",
+    "OVERFLOW_CONFLATE",
+    "OVERFLOW_DROP_OLDEST",
+    "MAX_SUBSCRIPTIONS_PER_CONNECTION",
     "MEXCWebSocketClient",
+    "RecordedFrame",
+    "StreamMonitor",
+    "ReplayClient",
     "WS_BASE",
     "DEFAULT_USER_STREAM_CHANNELS",
     "account_update_stream",
     "user_deals_stream",
     "user_orders_stream",
+    "WebSocketPool",
     "websocket_manager",
+    "websocket_pool_manager",
     "MessageHandler",
     "book_ticker_batch_stream",
     "book_ticker_stream",
+    "build_fast_decoder",
     "build_protobuf_decoder",
+    "decode_push_records",
     "diff_depth_stream",
     "kline_stream",
+    "market_hub",
     "mini_tickers_stream",
     "mini_ticker_stream",
     "partial_depth_stream",
+    "peek_channel",
+    "read_frames",
+    "start_recording",
+    "stop_recording",
+    "stream_monitor",
     "trade_stream",
 ]
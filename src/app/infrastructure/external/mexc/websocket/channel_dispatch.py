@@ -0,0 +1,75 @@
+"""
+Reader-task dispatch for the MEXC websocket client.
+
+Once a consumer asks for ``client.channel(name)`` the client owns a single
+reader task: it answers PING inline and routes every decoded push to the
+per-channel queues of :mod:`channel_router`. Messages nobody subscribed to
+(acks, unknown channels) remain available through ``recv()``.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Optional
+
+from .channel_router import OVERFLOW_DROP_OLDEST, ChannelQueue, ChannelRouter
+from .channel_stream import ChannelStreamMixin
+
+logger = logging.getLogger(__name__)
+
+
+class ChannelDispatchMixin(ChannelStreamMixin):
+    _reader_task: Optional[asyncio.Task] = None
+    _router: Optional[ChannelRouter] = None
+
+    @property
+    def router(self) -> ChannelRouter:
+        if self._router is None:
+            fallback = ChannelQueue(overflow=OVERFLOW_DROP_OLDEST, monitored=self.monitored)
+            self._router = ChannelRouter(fallback)
+        return self._router
+
+    def start_reader(self) -> None:
+        """Start routing frames to channel queues (idempotent)."""
+        if self._reader_task and not self._reader_task.done():
+            return
+        if not self._ws:
+            raise RuntimeError("WebSocket connection is not open")
+        self._reader_error = None
+        self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def stop_reader(self) -> None:
+        task, self._reader_task = self._reader_task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                raw = await self._ws.recv()
+                self.last_message_at = time.time()
+                parsed = self._parse(raw)
+                if parsed is None:
+                    continue
+                if self._is_ping(parsed):
+                    await self.send_pong()
+                    continue
+                await self.router.route(parsed)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            self._reader_error = exc
+            logger.debug("Websocket reader stopped: %s", exc)
+        finally:
+            self.router.close()
+
+    async def _on_channel_open(self) -> None:
+        self.start_reader()
+
+
+__all__ = ["ChannelDispatchMixin"]
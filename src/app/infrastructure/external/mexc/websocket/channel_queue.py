@@ -0,0 +1,84 @@
+"""
+Bounded per-subscription queue with an overflow policy.
+
+Every item is stamped on ``put`` so the time it spent queued reaches
+``stream_monitor`` when the consumer takes it (unless ``monitored`` is off).
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Optional
+
+from .stream_monitor import stream_monitor
+
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop-oldest"
+OVERFLOW_CONFLATE = "conflate-latest"
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_CONFLATE)
+
+CLOSED = object()
+
+
+def channel_of(message: Any) -> Optional[str]:
+    """Return the channel a decoded push belongs to, if any."""
+    if isinstance(message, dict):
+        return message.get("channel") or message.get("c")
+    return getattr(message, "channel", None)
+
+
+class ChannelQueue:
+    """Bounded queue applying one overflow policy."""
+
+    def __init__(
+        self, maxsize: int = 1000, overflow: str = OVERFLOW_BLOCK, monitored: bool = True
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        self.overflow = overflow
+        self.monitored = monitored
+        self.dropped = 0
+        size = 1 if overflow == OVERFLOW_CONFLATE else max(1, maxsize)
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=size)
+
+    def _evict(self) -> None:
+        try:
+            self._queue.get_nowait()
+        except asyncio.QueueEmpty:
+            return
+        self.dropped += 1
+
+    async def put(self, message: Any) -> None:
+        item = (time.perf_counter_ns(), message)
+        if self.overflow == OVERFLOW_BLOCK:
+            await self._queue.put(item)
+            return
+        if self._queue.full():
+            self._evict()
+        self._queue.put_nowait(item)
+
+    def close(self) -> None:
+        """Wake the consumer; never blocks, even under the block policy."""
+        if self._queue.full():
+            self._evict()
+        self._queue.put_nowait((0, CLOSED))
+
+    async def get(self) -> Any:
+        enqueued, message = await self._queue.get()
+        if self.monitored:
+            stream_monitor.on_consume(channel_of(message), message, enqueued)
+        return message
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+
+__all__ = [
+    "CLOSED",
+    "ChannelQueue",
+    "OVERFLOW_BLOCK",
+    "OVERFLOW_CONFLATE",
+    "OVERFLOW_DROP_OLDEST",
+    "OVERFLOW_POLICIES",
+    "channel_of",
+]
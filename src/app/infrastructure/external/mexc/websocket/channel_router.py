@@ -0,0 +1,80 @@
+"""
+Per-channel bounded queues for routing websocket pushes to consumers.
+
+Each subscription owns its own queue so a slow depth handler cannot stall
+trade processing. Overflow policies:
+
+* ``block``: the reader waits for room (backpressure on the socket).
+* ``drop-oldest``: discard the oldest pending message.
+* ``conflate-latest``: keep only the newest pending message.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+from .channel_queue import (
+    CLOSED,
+    OVERFLOW_BLOCK,
+    OVERFLOW_CONFLATE,
+    OVERFLOW_DROP_OLDEST,
+    OVERFLOW_POLICIES,
+    ChannelQueue,
+    channel_of,
+)
+
+
+class ChannelRouter:
+    """Fan decoded messages out to the queues registered for their channel."""
+
+    def __init__(self, fallback: Optional[ChannelQueue] = None):
+        self._routes: Dict[str, List[ChannelQueue]] = {}
+        self.fallback = fallback or ChannelQueue(overflow=OVERFLOW_DROP_OLDEST)
+
+    def add(self, channel: str, queue: ChannelQueue) -> None:
+        self._routes.setdefault(channel, []).append(queue)
+
+    def remove(self, channel: str, queue: ChannelQueue) -> None:
+        queues = self._routes.get(channel, [])
+        if queue in queues:
+            queues.remove(queue)
+        if not queues:
+            self._routes.pop(channel, None)
+
+    def channels(self) -> List[str]:
+        return list(self._routes)
+
+    async def route(self, message: Any) -> None:
+        """Deliver to every subscriber of the channel, else to the fallback."""
+        queues = self._routes.get(channel_of(message) or "")
+        if not queues:
+            await self.fallback.put(message)
+            return
+        for queue in queues:
+            await queue.put(message)
+
+    def close(self) -> None:
+        for queues in self._routes.values():
+            for queue in queues:
+                queue.close()
+        self.fallback.close()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        return {
+            channel: {
+                "pending": sum(q.qsize() for q in queues),
+                "dropped": sum(q.dropped for q in queues),
+            }
+            for channel, queues in self._routes.items()
+        }
+
+
+__all__ = [
+    "CLOSED",
+    "ChannelQueue",
+    "ChannelRouter",
+    "OVERFLOW_BLOCK",
+    "OVERFLOW_CONFLATE",
+    "OVERFLOW_DROP_OLDEST",
+    "OVERFLOW_POLICIES",
+    "channel_of",
+]
@@ -0,0 +1,54 @@
+"""Shared ``channel(name)`` iterator for router-backed websocket streams."""
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, Optional
+
+from .channel_router import CLOSED, ChannelQueue
+
+
+class ChannelStreamMixin:
+    """
+    Needs ``router``, ``subscribe()``, ``_queue_size`` and ``_overflow``.
+
+    ``_on_channel_open`` lets the host start whatever feeds the router.
+    ``monitored`` off keeps the host's traffic out of ``stream_monitor``.
+    """
+
+    _reader_error: Optional[BaseException] = None
+    monitored = True
+
+    async def _on_channel_open(self) -> None:
+        return None
+
+    async def channel(
+        self,
+        name: str,
+        maxsize: Optional[int] = None,
+        overflow: Optional[str] = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate the pushes of one channel through its own bounded queue."""
+        queue = ChannelQueue(
+            maxsize or self._queue_size, overflow or self._overflow, self.monitored
+        )
+        self.router.add(name, queue)
+        try:
+            await self.subscribe([name])
+            await self._on_channel_open()
+            while True:
+                message = await queue.get()
+                if message is CLOSED:
+                    return
+                yield message
+        finally:
+            self.router.remove(name, queue)
+
+    async def _recv_routed(self) -> Any:
+        """Next message no channel consumer claimed (acks, unknown channels)."""
+        message = await self.router.fallback.get()
+        if message is CLOSED:
+            self.router.fallback.close()  # keep later callers from hanging
+            raise self._reader_error or RuntimeError("WebSocket stream stopped")
+        return message
+
+
+__all__ = ["ChannelStreamMixin"]
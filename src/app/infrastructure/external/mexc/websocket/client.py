@@ -9,12 +9,20 @@ from contextlib import suppress
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+from .channel_dispatch import ChannelDispatchMixin
+from .channel_router import OVERFLOW_BLOCK, channel_of
+from .frame_recorder import active_recorder
+from .stream_monitor import stream_monitor
+
 WS_BASE = "wss://wbs-api.mexc.com/ws"
 
 
-class MEXCWebSocketClient:
+class MEXCWebSocketClient(ChannelDispatchMixin):
     """
     Websocket client with SUB/UNSUB and explicit PING/PONG.
+
+    ``channel(name)`` switches to reader-task dispatch with one bounded
+    queue per subscription (``queue_size``/``overflow`` are the defaults).
     
     Implements data flow heartbeat pattern from ✨.md:
     - Tracks last_message_at for data flow monitoring
@@ -29,6 +37,9 @@ class MEXCWebSocketClient:
         binary_decoder=None,
         heartbeat: float = 20.0,  # seconds
         close_timeout: float = 5.0,  # seconds
+        queue_size: int = 1000,
+        overflow: str = OVERFLOW_BLOCK,
+        recorder=None,
     ):
         self.url = url
         self._pending = set(subscriptions or [])
@@ -36,21 +47,30 @@ class MEXCWebSocketClient:
         self._binary_decoder = binary_decoder
         self._heartbeat = heartbeat
         self._close_timeout = close_timeout
+        self._queue_size = queue_size
+        self._overflow = overflow
         self._ws = None
         self._ping_task = None
+        self._recorder = recorder  # FrameRecorder; defaults to the active one
+        self._recording = None
         self.last_message_at = time.time()  # Track data flow for heartbeat
 
     async def __aenter__(self):
         self._ws = await websockets.connect(
             self.url, ping_interval=None, close_timeout=self._close_timeout
         )
-        if self._pending:
-            await self.subscribe(self._pending)
+        self._recording = self._recorder or active_recorder()
+        # Replay everything subscribed so far when re-entered after a drop.
+        channels = self._pending | self.subscriptions
+        self.subscriptions = set()
+        if channels:
+            await self.subscribe(channels)
         if self._heartbeat:
             self._ping_task = asyncio.create_task(self._auto_ping())
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop_reader()
         if self._ping_task:
             self._ping_task.cancel()
             with suppress(asyncio.CancelledError):
@@ -86,6 +106,7 @@ class MEXCWebSocketClient:
         await self._send("UNSUBSCRIPTION", targets)
         for channel in targets:
             self.subscriptions.discard(channel)
+            self._pending.discard(channel)
 
     async def send_ping(self):
         await self._send("PING")
@@ -94,6 +115,18 @@ class MEXCWebSocketClient:
         await self._send("PONG")
 
     def _parse(self, raw):
+        if self._recording is not None:
+            self._recording.write(raw)
+        received, started = time.time(), time.perf_counter_ns()
+        parsed = self._decode(raw)
+        if parsed is not None and self.monitored and stream_monitor.enabled:
+            stream_monitor.on_frame(
+                channel_of(parsed), parsed, len(raw), received,
+                time.perf_counter_ns() - started,
+            )
+        return parsed
+
+    def _decode(self, raw):
         if isinstance(raw, bytes):
             if self._binary_decoder:
                 try:
@@ -120,10 +153,14 @@ class MEXCWebSocketClient:
     async def recv(self):
         if not self._ws:
             raise RuntimeError("WebSocket connection is not open")
+        if self._reader_task is not None:
+            return await self._recv_routed()
         while True:
             raw = await self._ws.recv()
             self.last_message_at = time.time()  # Update on every message
             parsed = self._parse(raw)
+            if parsed is None:  # filtered out by the decoder
+                continue
             if self._is_ping(parsed):
                 await self.send_pong()
                 return {"type": "ping"}
@@ -0,0 +1,111 @@
+"""
+Sharded websocket pool for more channels than one MEXC socket accepts.
+
+Channels go to the least-loaded shard with room; after unsubscribes the
+emptiest shard is folded into the others. All shards feed one router, so
+``pool.channel(name)`` works regardless of placement.
+"""
+from __future__ import annotations
+
+from itertools import count
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from .channel_router import OVERFLOW_BLOCK, ChannelRouter
+from .channel_stream import ChannelStreamMixin
+from .client import MEXCWebSocketClient, WS_BASE
+from .shard import WebSocketShard
+
+MAX_SUBSCRIPTIONS_PER_CONNECTION = 30
+
+
+class WebSocketPool(ChannelStreamMixin):
+    def __init__(
+        self,
+        url: str = WS_BASE,
+        max_per_connection: int = MAX_SUBSCRIPTIONS_PER_CONNECTION,
+        reconnect_delay: float = 2.0,
+        queue_size: int = 1000,
+        overflow: str = OVERFLOW_BLOCK,
+        client_factory=MEXCWebSocketClient,
+        **client_options: Any,
+    ):
+        self.url = url
+        self.max_per_connection = max(1, max_per_connection)
+        self.router = ChannelRouter()
+        self.shards: List[WebSocketShard] = []
+        self._reconnect_delay = reconnect_delay
+        self._queue_size = queue_size
+        self._overflow = overflow
+        self._factory = client_factory
+        self._client_options = client_options
+        self._indices = count()
+
+    async def __aenter__(self) -> "WebSocketPool":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def _connect(self, channels: Set[str]):
+        return self._factory(
+            url=self.url, subscriptions=sorted(channels), **self._client_options
+        )
+
+    def _shard_for(self, channel: str) -> Optional[WebSocketShard]:
+        return next((s for s in self.shards if channel in s.channels), None)
+
+    def _new_shard(self) -> WebSocketShard:
+        shard = WebSocketShard(
+            next(self._indices), self._connect, self.router, self._reconnect_delay
+        )
+        self.shards.append(shard)
+        return shard
+
+    async def subscribe(self, channels: Iterable[str]) -> None:
+        for channel in channels:
+            if self._shard_for(channel):
+                continue
+            shard = min(self.shards, key=lambda s: len(s.channels), default=None)
+            if shard is None or len(shard.channels) >= self.max_per_connection:
+                shard = self._new_shard()
+            await shard.add({channel})
+            shard.start()
+
+    async def unsubscribe(self, channels: Iterable[str]) -> None:
+        for channel in channels:
+            shard = self._shard_for(channel)
+            if shard:
+                await shard.remove({channel})
+        await self._rebalance()
+
+    async def _rebalance(self) -> None:
+        """Fold the emptiest shard into the others while they have room."""
+        while self.shards:
+            donor = min(self.shards, key=lambda s: len(s.channels))
+            others = [s for s in self.shards if s is not donor]
+            spare = sum(self.max_per_connection - len(s.channels) for s in others)
+            if donor.channels and (not others or spare < len(donor.channels)):
+                return
+            for channel in sorted(donor.channels):
+                target = min(others, key=lambda s: len(s.channels))
+                await target.add({channel})
+            self.shards.remove(donor)
+            await donor.stop()
+
+    async def recv(self) -> Any:
+        return await self._recv_routed()
+
+    async def close(self) -> None:
+        shards, self.shards = self.shards, []
+        for shard in shards:
+            await shard.stop()
+        self.router.close()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "shards": [shard.status() for shard in self.shards],
+            "queues": self.router.stats(),
+        }
+
+
+__all__ = ["MAX_SUBSCRIPTIONS_PER_CONNECTION", "WebSocketPool"]
@@ -0,0 +1,107 @@
+"""
+Subscriber delivery policies for the in-process fan-out hub.
+
+* ``all``: every event through a bounded :class:`ChannelQueue`.
+* ``latest``: only the newest event per key (channel by default); a burst
+  of updates for one symbol reaches a slow consumer as a single event.
+* ``sampled``: like ``latest``, but released at most once per interval.
+
+:class:`KeyedLatestQueue` speaks the ``ChannelQueue`` interface, so the
+router delivers to either without knowing the policy.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Callable, Dict, Optional
+
+from .channel_queue import CLOSED, OVERFLOW_DROP_OLDEST, ChannelQueue, channel_of
+from .stream_monitor import stream_monitor
+
+DELIVER_ALL = "all"
+DELIVER_LATEST = "latest"
+DELIVER_SAMPLED = "sampled"
+DELIVERY_POLICIES = (DELIVER_ALL, DELIVER_LATEST, DELIVER_SAMPLED)
+
+
+class KeyedLatestQueue:
+    """Latest value per key, optionally released in batches every interval."""
+
+    def __init__(self, key: Callable[[Any], Any] = channel_of, interval_ms: int = 0):
+        self.dropped = 0  # values superseded before delivery
+        self._key = key
+        self._interval = interval_ms / 1000
+        self._pending: Dict[Any, Any] = {}
+        self._ready: deque = deque()
+        self._wakeup = asyncio.Event()
+        self._release_at = 0.0
+        self._closed = False
+
+    async def put(self, message: Any) -> None:
+        key = self._key(message)
+        if key in self._pending:
+            self.dropped += 1
+        self._pending[key] = (time.perf_counter_ns(), message)
+        self._wakeup.set()
+
+    def close(self) -> None:
+        self._closed = True
+        self._wakeup.set()
+
+    def qsize(self) -> int:
+        return len(self._pending) + len(self._ready)
+
+    def _release(self) -> None:
+        self._ready.extend(self._pending.values())
+        self._pending.clear()
+        self._release_at = time.monotonic() + self._interval
+
+    async def get(self) -> Any:
+        while not self._ready:
+            if not self._pending:
+                if self._closed:
+                    return CLOSED
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            if not self._interval:  # latest: always hand out the freshest value
+                return self._taken(self._pending.pop(next(iter(self._pending))))
+            wait = self._release_at - time.monotonic()
+            if wait > 0 and not self._closed:
+                await asyncio.sleep(wait)
+            self._release()
+        return self._taken(self._ready.popleft())
+
+    @staticmethod
+    def _taken(item) -> Any:
+        enqueued, message = item
+        stream_monitor.on_consume(channel_of(message), message, enqueued)
+        return message
+
+
+def delivery_queue(
+    policy: str = DELIVER_ALL,
+    maxsize: int = 1000,
+    overflow: str = OVERFLOW_DROP_OLDEST,
+    interval_ms: int = 250,
+    key: Optional[Callable[[Any], Any]] = None,
+):
+    """Build the subscriber queue for ``policy``."""
+    if policy == DELIVER_ALL:
+        return ChannelQueue(maxsize, overflow)
+    if policy == DELIVER_LATEST:
+        return KeyedLatestQueue(key or channel_of)
+    if policy == DELIVER_SAMPLED:
+        return KeyedLatestQueue(key or channel_of, max(1, interval_ms))
+    raise ValueError(f"Unknown delivery policy: {policy}")
+
+
+__all__ = [
+    "DELIVERY_POLICIES",
+    "DELIVER_ALL",
+    "DELIVER_LATEST",
+    "DELIVER_SAMPLED",
+    "KeyedLatestQueue",
+    "delivery_queue",
+]
@@ -0,0 +1,91 @@
+"""
+In-process fan-out of decoded market pushes to many subscribers.
+
+The hub owns one sharded upstream (:class:`WebSocketPool`) and subscribes a
+channel there only while at least one in-process subscriber wants it. Each
+subscriber gets its own queue and delivery policy, so a dashboard viewer or
+a second strategy costs a queue, not another exchange connection, and a
+slow subscriber never stalls the others.
+"""
+from __future__ import annotations
+
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .channel_router import OVERFLOW_DROP_OLDEST
+from .connection_pool import WebSocketPool
+from .delivery_queues import DELIVER_ALL, delivery_queue
+from .fast_decoders import decode_push_records
+from .hub_subscription import HubSubscription
+
+
+class MarketDataHub:
+    def __init__(self, **pool_options: Any):
+        pool_options.setdefault("binary_decoder", decode_push_records)
+        self.pool_options = pool_options
+        self.subscribers: List[HubSubscription] = []
+        self._refs: Counter = Counter()
+        self._pool: Optional[WebSocketPool] = None
+
+    def configure(self, **pool_options: Any) -> None:
+        """Update upstream options; applies to the next upstream opened."""
+        self.pool_options.update(pool_options)
+
+    @property
+    def pool(self) -> WebSocketPool:
+        if self._pool is None:
+            self._pool = WebSocketPool(**self.pool_options)
+        return self._pool
+
+    async def subscribe(
+        self,
+        channels: Iterable[str],
+        policy: str = DELIVER_ALL,
+        maxsize: int = 1000,
+        overflow: str = OVERFLOW_DROP_OLDEST,
+        interval_ms: int = 250,
+        key: Optional[Callable[[Any], Any]] = None,
+    ) -> HubSubscription:
+        """Add a subscriber; see :mod:`delivery_queues` for ``policy``."""
+        channels = list(dict.fromkeys(channels))
+        queue = delivery_queue(policy, maxsize, overflow, interval_ms, key)
+        subscription = HubSubscription(self, channels, policy, queue)
+        for channel in channels:
+            self.pool.router.add(channel, queue)
+            self._refs[channel] += 1
+        self.subscribers.append(subscription)
+        await self.pool.subscribe(channels)
+        return subscription
+
+    async def _release(self, subscription: HubSubscription) -> None:
+        subscription.queue.close()
+        if subscription not in self.subscribers:
+            return  # the hub was closed meanwhile
+        self.subscribers.remove(subscription)
+        idle = []
+        for channel in subscription.channels:
+            self.pool.router.remove(channel, subscription.queue)
+            self._refs[channel] -= 1
+            if self._refs[channel] <= 0:
+                del self._refs[channel]
+                idle.append(channel)
+        if idle:
+            await self.pool.unsubscribe(idle)
+
+    async def close(self) -> None:
+        """Close the upstream; subscribers see the end of their stream."""
+        pool, self._pool = self._pool, None
+        self.subscribers, self._refs = [], Counter()
+        if pool is not None:
+            await pool.close()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "upstream": self._pool.status() if self._pool else None,
+            "subscribers": [s.status() for s in self.subscribers],
+        }
+
+
+market_hub = MarketDataHub()
+
+__all__ = ["MarketDataHub", "market_hub"]
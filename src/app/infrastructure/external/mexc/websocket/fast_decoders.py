@@ -0,0 +1,130 @@
+"""
+Typed fast-path decoders for MEXC protobuf market pushes.
+
+Instead of converting every frame with ``MessageToDict``, the decoder reads
+the ``PushDataV3ApiWrapper`` oneof directly and builds slotted records with
+numeric strings parsed to floats once. Other bodies
+(private deals/orders, mini-ticker) still come back as dicts.
+"""
+from __future__ import annotations
+
+from typing import Any, Iterable, Optional
+
+from google.protobuf.json_format import MessageToDict
+
+from src.app.infrastructure.external.proto.websocket_pb import (
+    PushDataV3ApiWrapper_pb2,
+)
+
+from .market_streams import BinaryDecoder
+from .private_decoders import PRIVATE_DECODERS
+from .push_records import (
+    BUY,
+    SELL,
+    BookTickerPush,
+    DepthLevel,
+    DepthPush,
+    KlinePush,
+    TradeTick,
+    TradesPush,
+)
+
+
+def _trades(w, body) -> TradesPush:
+    ticks = tuple(
+        TradeTick(
+            float(d.price), float(d.quantity), BUY if d.tradeType == 1 else SELL, d.time
+        )
+        for d in body.deals
+    )
+    return TradesPush(w.channel, w.symbol, w.sendTime, ticks)
+
+
+def _levels(items) -> tuple:
+    return tuple(DepthLevel(float(i.price), float(i.quantity)) for i in items)
+
+
+def _diff_depth(w, body) -> DepthPush:
+    return DepthPush(
+        w.channel, w.symbol, w.sendTime, _levels(body.bids), _levels(body.asks),
+        int(body.fromVersion) if body.fromVersion else None,
+        int(body.toVersion) if body.toVersion else None,
+    )
+
+
+def _versioned_depth(w, body) -> DepthPush:
+    version = int(body.version) if body.version else None
+    return DepthPush(
+        w.channel, w.symbol, w.sendTime, _levels(body.bids), _levels(body.asks),
+        version, version,
+    )
+
+
+def _book_ticker(w, body) -> BookTickerPush:
+    return BookTickerPush(
+        w.channel, w.symbol, w.sendTime,
+        float(body.bidPrice), float(body.bidQuantity),
+        float(body.askPrice), float(body.askQuantity),
+    )
+
+
+def _kline(w, body) -> KlinePush:
+    return KlinePush(
+        w.channel, w.symbol, w.sendTime, body.interval,
+        body.windowStart, body.windowEnd,
+        float(body.openingPrice), float(body.highestPrice),
+        float(body.lowestPrice), float(body.closingPrice),
+        float(body.volume), float(body.amount),
+    )
+
+
+_BODY_DECODERS = {
+    "publicDeals": _trades,
+    "publicAggreDeals": _trades,
+    "publicAggreDepths": _diff_depth,
+    "publicIncreaseDepths": _versioned_depth,
+    "publicLimitDepths": _versioned_depth,
+    "publicBookTicker": _book_ticker,
+    "publicAggreBookTicker": _book_ticker,
+    "publicSpotKline": _kline,
+    **PRIVATE_DECODERS,
+}
+
+
+def peek_channel(raw: bytes) -> Optional[bytes]:
+    """Read the wrapper's leading ``channel`` field without parsing the frame."""
+    if not raw or raw[0] != 0x0A:  # field 1, length-delimited
+        return None
+    length, shift = 0, 0
+    for index in range(1, min(len(raw), 6)):
+        byte = raw[index]
+        length |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return raw[index + 1 : index + 1 + length]
+        shift += 7
+    return None
+
+
+def build_fast_decoder(channels: Optional[Iterable[str]] = None) -> BinaryDecoder:
+    """Create a typed decoder; frames outside ``channels`` return ``None`` unparsed."""
+    wanted = {c.encode() for c in channels} if channels is not None else None
+
+    def _decoder(raw: bytes) -> Any:
+        if wanted is not None:
+            channel = peek_channel(raw)
+            if channel is not None and channel not in wanted:
+                return None
+        wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper()
+        wrapper.ParseFromString(raw)
+        kind = wrapper.WhichOneof("body")
+        decode = _BODY_DECODERS.get(kind)
+        if decode is None:
+            return MessageToDict(wrapper, preserving_proto_field_name=True)
+        return decode(wrapper, getattr(wrapper, kind))
+
+    return _decoder
+
+
+decode_push_records = build_fast_decoder()
+
+__all__ = ["build_fast_decoder", "decode_push_records", "peek_channel"]
@@ -0,0 +1,61 @@
+"""
+Memory-mapped reader for segments written by :class:`FrameRecorder`.
+
+Segments are mapped read-only and walked record by record, so a day of
+frames is streamed without loading whole files; a torn trailing record
+(recorder killed mid-write) simply ends its segment.
+"""
+from __future__ import annotations
+
+import mmap
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Union
+
+from .frame_recorder import KIND_TEXT, RECORD_HEADER, SEGMENT_MAGIC, SEGMENT_SUFFIX
+
+
+@dataclass(frozen=True, slots=True)
+class RecordedFrame:
+    received_ns: int
+    channel: str
+    payload: Union[bytes, str]
+
+
+def segment_paths(source: Union[str, Path, Iterable[Path]]) -> List[Path]:
+    """Segments of a recording directory (or explicit files) in time order."""
+    if isinstance(source, (str, Path)):
+        source = Path(source)
+        if source.is_dir():
+            return sorted(source.glob(f"*{SEGMENT_SUFFIX}"))
+        return [source]
+    return list(source)
+
+
+def read_segment(path: Path) -> Iterator[RecordedFrame]:
+    """Yield the frames of one segment in write order."""
+    with open(path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as view:
+        if view[: len(SEGMENT_MAGIC)] != SEGMENT_MAGIC:
+            raise ValueError(f"{path} is not a frame recording")
+        offset, end = len(SEGMENT_MAGIC), len(view)
+        while offset + RECORD_HEADER.size <= end:
+            length, stamp, kind, chan_len = RECORD_HEADER.unpack_from(view, offset)
+            start = offset + RECORD_HEADER.size + chan_len
+            if start + length > end:
+                return
+            channel = view[start - chan_len : start].decode()
+            payload = view[start : start + length]
+            yield RecordedFrame(
+                stamp, channel, payload.decode() if kind == KIND_TEXT else payload
+            )
+            offset = start + length
+
+
+def read_frames(source: Union[str, Path, Iterable[Path]]) -> Iterator[RecordedFrame]:
+    for path in segment_paths(source):
+        yield from read_segment(path)
+
+
+__all__ = ["RecordedFrame", "read_frames", "read_segment", "segment_paths"]
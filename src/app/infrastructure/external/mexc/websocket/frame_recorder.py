@@ -0,0 +1,128 @@
+"""
+Append-only recorder of raw websocket frames.
+
+Segments start with ``SEGMENT_MAGIC`` followed by records of
+``RECORD_HEADER`` (payload length, receive time in ns, kind, channel
+length), the channel and the untouched payload. Writes go through a large
+userspace buffer; a segment rotates once it would exceed ``max_bytes``.
+Private (user-data) binary frames are skipped unless ``include_private``.
+"""
+from __future__ import annotations
+
+import logging
+import struct
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from .fast_decoders import peek_channel
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b"MXWSREC1"
+SEGMENT_SUFFIX = ".seg"
+RECORD_HEADER = struct.Struct(">IqBH")
+KIND_BINARY = 0
+KIND_TEXT = 1
+
+
+class FrameRecorder:
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        max_bytes: int = 256 * 1024 * 1024,
+        buffer_size: int = 1024 * 1024,
+        include_private: bool = False,
+    ):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.buffer_size = buffer_size
+        self.include_private = include_private
+        self.frames = 0
+        self.segments = 0
+        self.path: Optional[Path] = None
+        self._file = None
+        self._size = 0
+
+    def _open_segment(self) -> None:
+        self.close()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        self.path = self.directory / f"frames-{stamp}-{self.segments:04d}{SEGMENT_SUFFIX}"
+        self._file = open(self.path, "ab", buffering=self.buffer_size)
+        self._file.write(SEGMENT_MAGIC)
+        self._size = len(SEGMENT_MAGIC)
+        self.segments += 1
+
+    def write(self, raw: Union[bytes, str], received_ns: Optional[int] = None) -> None:
+        """Append one frame exactly as received from the socket."""
+        if isinstance(raw, str):
+            kind, payload, channel = KIND_TEXT, raw.encode(), b""
+        else:
+            kind, payload, channel = KIND_BINARY, raw, peek_channel(raw) or b""
+            if not self.include_private and b"@private" in channel:
+                return
+        size = RECORD_HEADER.size + len(channel) + len(payload)
+        if self._file is None or self._size + size > self.max_bytes:
+            self._open_segment()
+        stamp = time.time_ns() if received_ns is None else received_ns
+        write = self._file.write
+        write(RECORD_HEADER.pack(len(payload), stamp, kind, len(channel)))
+        write(channel)
+        write(payload)
+        self._size += size
+        self.frames += 1
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        file, self._file = self._file, None
+        if file is not None:
+            file.close()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path) if self.path else None,
+            "frames": self.frames,
+            "segments": self.segments,
+            "segment_bytes": self._size,
+        }
+
+
+_active: Optional[FrameRecorder] = None
+
+
+def start_recording(directory: Union[str, Path], **options: Any) -> FrameRecorder:
+    """Record frames of every websocket client opened from now on."""
+    global _active
+    stop_recording()
+    _active = FrameRecorder(directory, **options)
+    logger.info(f"Recording websocket frames to {directory}")
+    return _active
+
+
+def stop_recording() -> None:
+    global _active
+    recorder, _active = _active, None
+    if recorder is not None:
+        recorder.close()
+
+
+def active_recorder() -> Optional[FrameRecorder]:
+    return _active
+
+
+__all__ = [
+    "FrameRecorder",
+    "KIND_BINARY",
+    "KIND_TEXT",
+    "RECORD_HEADER",
+    "SEGMENT_MAGIC",
+    "SEGMENT_SUFFIX",
+    "active_recorder",
+    "start_recording",
+    "stop_recording",
+]
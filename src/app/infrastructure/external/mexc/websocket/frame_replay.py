@@ -0,0 +1,83 @@
+"""
+Paced replay of recorded websocket frames.
+
+``ReplayClient`` is a ``MEXCWebSocketClient`` whose socket is a recording,
+so ``recv()``, ``channel()`` and the configured ``binary_decoder`` behave
+exactly as live. ``speed`` 1.0 replays at wall-clock pace, N at N times
+that, and ``None`` as fast as possible.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Union
+
+from websockets.exceptions import ConnectionClosedOK
+
+from .client import MEXCWebSocketClient
+from .frame_reader import RecordedFrame, read_frames
+
+
+class ReplaySocket:
+    """The subset of a websockets connection the client uses."""
+
+    def __init__(self, frames: Iterable[RecordedFrame], speed: Optional[float] = 1.0):
+        self._frames = iter(frames)
+        self._speed = speed
+        self._origin: Optional[tuple] = None
+        self._count = 0
+        self.sent: List[str] = []
+
+    async def recv(self) -> Union[bytes, str]:
+        frame = next(self._frames, None)
+        if frame is None:
+            raise ConnectionClosedOK(None, None)
+        if not self._speed:
+            self._count += 1
+            if self._count % 256 == 0:
+                await asyncio.sleep(0)  # let other tasks run between bursts
+            return frame.payload
+        if self._origin is None:
+            self._origin = (frame.received_ns, time.monotonic())
+        recorded, started = self._origin
+        due = started + (frame.received_ns - recorded) / 1e9 / self._speed
+        delay = due - time.monotonic()
+        await asyncio.sleep(delay if delay > 0 else 0)
+        return frame.payload
+
+    async def send(self, message: str) -> None:
+        self.sent.append(message)  # subscriptions are already in the recording
+
+    async def close(self) -> None:
+        self._frames = iter(())
+
+
+class ReplayClient(MEXCWebSocketClient):
+    # Recorded sendTimes against today's clock would fill /diagnostics/ws
+    # with hours-old latencies, so replays are not monitored.
+    monitored = False
+
+    def __init__(
+        self,
+        source: Union[str, Path, Iterable[Path]],
+        speed: Optional[float] = 1.0,
+        channels: Optional[Iterable[str]] = None,
+        **client_options,
+    ):
+        super().__init__(heartbeat=0, **client_options)
+        self.source = source
+        self.speed = speed
+        self.channels = set(channels) if channels is not None else None
+
+    def _frames(self) -> Iterator[RecordedFrame]:
+        for frame in read_frames(self.source):
+            if self.channels is None or frame.channel in self.channels:
+                yield frame
+
+    async def __aenter__(self) -> "ReplayClient":
+        self._ws = ReplaySocket(self._frames(), self.speed)
+        return self
+
+
+__all__ = ["ReplayClient", "ReplaySocket"]
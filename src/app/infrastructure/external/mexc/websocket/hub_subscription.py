@@ -0,0 +1,66 @@
+"""
+A single subscriber of :class:`MarketDataHub`.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, List
+
+from websockets.exceptions import ConnectionClosedOK
+
+from .channel_router import CLOSED
+
+if TYPE_CHECKING:
+    from .fanout_hub import MarketDataHub
+
+
+class HubSubscription:
+    """One subscriber: ``async for``/``get()``; ``close()`` to leave."""
+
+    def __init__(self, hub: "MarketDataHub", channels: List[str], policy: str, queue):
+        self.channels = channels
+        self.policy = policy
+        self.queue = queue
+        self._hub = hub
+        self.closed = False
+
+    async def get(self) -> Any:
+        message = await self.queue.get()
+        if message is CLOSED:
+            self.queue.close()  # keep later callers from hanging
+            raise StopAsyncIteration
+        return message
+
+    async def recv(self) -> Any:
+        """Like :meth:`get`, but ends the way ``MEXCWebSocketClient.recv`` does."""
+        try:
+            return await self.get()
+        except StopAsyncIteration:
+            raise ConnectionClosedOK(None, None) from None
+
+    def __aiter__(self) -> "HubSubscription":
+        return self
+
+    async def __anext__(self) -> Any:
+        return await self.get()
+
+    async def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            await self._hub._release(self)
+
+    async def __aenter__(self) -> "HubSubscription":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "channels": self.channels,
+            "policy": self.policy,
+            "pending": self.queue.qsize(),
+            "dropped": self.queue.dropped,
+        }
+
+
+__all__ = ["HubSubscription"]
@@ -0,0 +1,90 @@
+"""
+HDR-style log-linear histogram for latency samples in microseconds.
+
+Values below ``2**SUB_BITS`` get exact buckets; above that every power of
+two is split into ``2**(SUB_BITS - 1)`` linear buckets, so any recorded
+value is reported within ~1.6% using a fixed ~2k-slot array. Recording is a
+couple of integer ops; percentiles walk the counts only when asked.
+"""
+from __future__ import annotations
+
+from typing import Dict, Iterable, List
+
+SUB_BITS = 7
+_SUB = 1 << SUB_BITS
+_HALF = _SUB >> 1
+MAX_VALUE_US = (1 << 40) - 1  # ~12.7 days; larger samples are clamped
+_SLOTS = _SUB + (MAX_VALUE_US.bit_length() - SUB_BITS) * _HALF
+
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def _index(value: int) -> int:
+    if value < _SUB:
+        return value
+    shift = value.bit_length() - SUB_BITS
+    return _SUB + (shift - 1) * _HALF + (value >> shift) - _HALF
+
+
+def _bucket_value(index: int) -> int:
+    """Midpoint of the values that map to ``index``."""
+    if index < _SUB:
+        return index
+    shift, offset = divmod(index - _SUB, _HALF)
+    shift += 1
+    low = (offset + _HALF) << shift
+    return low + ((1 << shift) - 1) // 2
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * _SLOTS
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def record(self, value_us: int) -> None:
+        value = min(max(int(value_us), 0), MAX_VALUE_US)
+        self.counts[_index(value)] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    def percentile(self, pct: float) -> int:
+        if not self.count:
+            return 0
+        rank = max(1, -(-self.count * pct // 100))  # ceil, at least one sample
+        seen = 0
+        for index, hits in enumerate(self.counts):
+            seen += hits
+            if seen >= rank:
+                return min(_bucket_value(index), self.max)
+        return self.max
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        if not other.count:
+            return
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.min = min(self.min, other.min) if self.count else other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """Milliseconds, rounded for display."""
+        out = {"count": self.count}
+        if self.count:
+            out["mean_ms"] = round(self.total / self.count / 1000, 3)
+            out["max_ms"] = round(self.max / 1000, 3)
+            for pct in percentiles:
+                out[f"p{pct:g}_ms"] = round(self.percentile(pct) / 1000, 3)
+        return out
+
+
+__all__ = ["DEFAULT_PERCENTILES", "LatencyHistogram", "MAX_VALUE_US", "SUB_BITS"]
@@ -3,6 +3,7 @@ from contextlib import asynccontextmanager
 from typing import AsyncIterator, Iterable, Optional
 
 from .client import MEXCWebSocketClient, WS_BASE
+from .connection_pool import MAX_SUBSCRIPTIONS_PER_CONNECTION, WebSocketPool
 
 
 @asynccontextmanager
@@ -17,4 +18,18 @@ async def websocket_manager(
         yield client
 
 
-__all__ = ["websocket_manager"]
+@asynccontextmanager
+async def websocket_pool_manager(
+    subscriptions: Optional[Iterable[str]] = None,
+    url: str = WS_BASE,
+    max_per_connection: int = MAX_SUBSCRIPTIONS_PER_CONNECTION,
+    **kwargs,
+) -> AsyncIterator[WebSocketPool]:
+    async with WebSocketPool(
+        url=url, max_per_connection=max_per_connection, **kwargs
+    ) as pool:
+        await pool.subscribe(subscriptions or [])
+        yield pool
+
+
+__all__ = ["websocket_manager", "websocket_pool_manager"]
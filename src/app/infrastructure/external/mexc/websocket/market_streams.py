@@ -28,6 +28,14 @@ _KLINE_INTERVALS = {
     "Week1",
     "Month1",
 }
+# Candle interval -> (kline stream interval, bar seconds)
+CANDLE_INTERVALS = {
+    "1m": ("Min1", 60),
+    "5m": ("Min5", 300),
+    "15m": ("Min15", 900),
+    "30m": ("Min30", 1800),
+    "1h": ("Min60", 3600),
+}
 
 
 def build_protobuf_decoder(message_cls: Type[Message]) -> BinaryDecoder:
@@ -91,6 +99,7 @@ def mini_ticker_stream(symbol: str, timezone: str = "UTC+0") -> str:
 
 
 __all__ = [
+    "CANDLE_INTERVALS",
     "BinaryDecoder",
     "build_protobuf_decoder",
     "decode_push_data",
@@ -0,0 +1,27 @@
+"""
+Typed decoders for MEXC private user-data pushes.
+
+Only ``privateAccount`` gets a record: it carries absolute balances, which is
+all a balance cache needs. Deal and order pushes stay dicts.
+"""
+from __future__ import annotations
+
+from .push_records import AccountPush
+
+
+def _num(value: str) -> float:
+    return float(value) if value else 0.0
+
+
+def _account(w, body) -> AccountPush:
+    return AccountPush(
+        w.channel, w.sendTime, body.vcoinName,
+        _num(body.balanceAmount), _num(body.frozenAmount),
+        _num(body.balanceAmountChange), _num(body.frozenAmountChange),
+        body.type, body.time,
+    )
+
+
+PRIVATE_DECODERS = {"privateAccount": _account}
+
+__all__ = ["PRIVATE_DECODERS"]
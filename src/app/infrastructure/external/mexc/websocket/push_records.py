@@ -0,0 +1,98 @@
+"""Slotted records decoded from MEXC protobuf market pushes."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+BUY = "BUY"
+SELL = "SELL"
+
+
+@dataclass(frozen=True, slots=True)
+class TradeTick:
+    price: float
+    quantity: float
+    side: str
+    time: int
+
+
+@dataclass(frozen=True, slots=True)
+class TradesPush:
+    channel: str
+    symbol: str
+    send_time: int
+    trades: Tuple[TradeTick, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class DepthLevel:
+    price: float
+    quantity: float
+
+
+@dataclass(frozen=True, slots=True)
+class DepthPush:
+    """Depth update; ``from_version``/``to_version`` are set on diff pushes."""
+
+    channel: str
+    symbol: str
+    send_time: int
+    bids: Tuple[DepthLevel, ...]
+    asks: Tuple[DepthLevel, ...]
+    from_version: Optional[int] = None
+    to_version: Optional[int] = None
+
+
+@dataclass(frozen=True, slots=True)
+class BookTickerPush:
+    channel: str
+    symbol: str
+    send_time: int
+    bid_price: float
+    bid_quantity: float
+    ask_price: float
+    ask_quantity: float
+
+
+@dataclass(frozen=True, slots=True)
+class KlinePush:
+    channel: str
+    symbol: str
+    send_time: int
+    interval: str
+    open_time: int
+    close_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    amount: float
+
+
+@dataclass(frozen=True, slots=True)
+class AccountPush:
+    """Private balance change; ``free``/``locked`` are absolute after the change."""
+
+    channel: str
+    send_time: int
+    asset: str
+    free: float
+    locked: float
+    free_change: float
+    locked_change: float
+    reason: str
+    time: int
+
+
+__all__ = [
+    "AccountPush",
+    "BUY",
+    "SELL",
+    "BookTickerPush",
+    "DepthLevel",
+    "DepthPush",
+    "KlinePush",
+    "TradeTick",
+    "TradesPush",
+]
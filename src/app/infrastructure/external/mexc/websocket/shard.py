@@ -0,0 +1,100 @@
+"""One socket of a sharded websocket pool, reconnected independently."""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, Callable, Optional, Set
+
+from .channel_router import ChannelRouter
+
+logger = logging.getLogger(__name__)
+
+
+class WebSocketShard:
+    """
+    Owns a set of channels and pumps their pushes into a shared router.
+
+    The shard keeps reconnecting with its *current* channel set until
+    stopped, so subscriptions changed while offline are applied on the
+    next connect.
+    """
+
+    def __init__(
+        self,
+        index: int,
+        connect: Callable[[Set[str]], Any],
+        router: ChannelRouter,
+        reconnect_delay: float = 2.0,
+    ):
+        self.index = index
+        self.channels: Set[str] = set()
+        self.client = None
+        self.reconnects = 0
+        self._connect = connect
+        self._router = router
+        self._reconnect_delay = reconnect_delay
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def connected(self) -> bool:
+        return self.client is not None
+
+    def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+
+    async def add(self, channels: Set[str]) -> None:
+        self.channels.update(channels)
+        if self.client is not None:
+            await self.client.subscribe(channels)
+
+    async def remove(self, channels: Set[str]) -> None:
+        self.channels.difference_update(channels)
+        if self.client is not None:
+            with suppress(Exception):
+                await self.client.unsubscribe(channels)
+
+    async def _sync(self, client) -> None:
+        """Apply channel changes made while the socket was connecting."""
+        await client.subscribe(set(self.channels))
+        stale = set(client.subscriptions) - self.channels
+        if stale:
+            await client.unsubscribe(stale)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self._connect(set(self.channels)) as client:
+                    self.client = client
+                    await self._sync(client)
+                    async for message in client:
+                        if isinstance(message, dict) and message.get("type") == "ping":
+                            continue
+                        await self._router.route(message)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.warning("WS shard %s dropped: %s", self.index, exc)
+            finally:
+                self.client = None
+            self.reconnects += 1
+            await asyncio.sleep(self._reconnect_delay)
+
+    def status(self) -> dict:
+        return {
+            "channels": len(self.channels),
+            "connected": self.connected,
+            "reconnects": self.reconnects,
+        }
+
+
+__all__ = ["WebSocketShard"]
@@ -0,0 +1,102 @@
+"""
+Process-wide registry of :class:`ChannelStats` fed by the websocket client
+(receive, decode) and the router queues (dwell, age).
+
+Exchange stamps are compared against the local clock corrected by
+``clock`` (the REST client's ``ServerClock``) when one is attached.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from typing import Any, Dict, Optional
+
+from .stream_stats import ChannelStats
+
+logger = logging.getLogger(__name__)
+
+
+def send_time_of(message: Any) -> Optional[int]:
+    """Exchange ``sendTime`` (ms) of a typed record or a decoded dict."""
+    if isinstance(message, dict):
+        stamp = message.get("sendTime") or message.get("t")
+        return int(stamp) if stamp else None
+    return getattr(message, "send_time", None)
+
+
+class StreamMonitor:
+    def __init__(self) -> None:
+        self.channels: Dict[str, ChannelStats] = {}
+        self.enabled = True
+        self.clock = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _offset_ms(self) -> float:
+        return self.clock.offset_ms if self.clock is not None else 0.0
+
+    def stats(self, channel: str) -> ChannelStats:
+        stats = self.channels.get(channel)
+        if stats is None:
+            stats = self.channels[channel] = ChannelStats()
+        return stats
+
+    def on_frame(
+        self, channel: Optional[str], message: Any, size: int, received: float, decode_ns: int
+    ) -> None:
+        """A frame left the socket at ``received`` (epoch s) and was decoded."""
+        if not self.enabled or not channel:
+            return
+        self.stats(channel).on_receive(
+            size, received * 1000 + self._offset_ms(), send_time_of(message), decode_ns // 1000
+        )
+
+    def on_consume(self, channel: Optional[str], message: Any, enqueued_ns: int) -> None:
+        """A consumer took ``message`` from a queue it entered at ``enqueued_ns``."""
+        if not self.enabled or not channel:
+            return
+        stats = self.stats(channel)
+        stats.stages["dwell"].record((time.perf_counter_ns() - enqueued_ns) // 1000)
+        sent = send_time_of(message)
+        if sent:
+            now_ms = time.time() * 1000 + self._offset_ms()
+            stats.stages["age"].record((now_ms - sent) * 1000)
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {name: stats.summary() for name, stats in sorted(self.channels.items())}
+
+    def log_summary(self) -> None:
+        for name, summary in self.snapshot().items():
+            stages = " ".join(
+                f"{stage}=p50:{summary[stage].get('p50_ms', '-')}/"
+                f"p99:{summary[stage].get('p99_ms', '-')}ms"
+                for stage in ("network", "decode", "dwell", "age")
+            )
+            logger.info(
+                f"WS {name}: {summary['messages_per_s']} msg/s "
+                f"{summary['bytes_per_s']} B/s {stages}"
+            )
+
+    async def _report_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.log_summary()
+
+    def start_reporting(self, interval: float = 60.0) -> None:
+        """Log per-channel summaries every ``interval`` seconds (idempotent)."""
+        if self._task and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._report_loop(interval))
+
+    async def stop_reporting(self) -> None:
+        task, self._task = self._task, None
+        if task:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+stream_monitor = StreamMonitor()
+
+__all__ = ["StreamMonitor", "send_time_of", "stream_monitor"]
@@ -0,0 +1,76 @@
+"""
+Per-channel latency and throughput of websocket pushes.
+
+For each channel four histograms split where time goes:
+
+* ``network``: exchange ``sendTime`` to socket receive (clock-offset aware).
+* ``decode``: protobuf/JSON decoding of the frame.
+* ``dwell``: router queue put to the consumer's ``get``.
+* ``age``: exchange ``sendTime`` to the consumer (end-to-end staleness).
+
+Throughput is counted per second over a sliding ``RATE_WINDOW``.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional
+
+from .latency_histogram import LatencyHistogram
+
+RATE_WINDOW = 10  # seconds
+STAGES = ("network", "decode", "dwell", "age")
+
+
+class ChannelStats:
+    __slots__ = ("stages", "messages", "bytes", "negative", "_seconds", "_counts")
+
+    def __init__(self) -> None:
+        self.stages = {stage: LatencyHistogram() for stage in STAGES}
+        self.messages = 0
+        self.bytes = 0
+        self.negative = 0  # receive before sendTime: clock offset is off
+        self._seconds: List[int] = [0] * RATE_WINDOW
+        self._counts: List[List[int]] = [[0, 0] for _ in range(RATE_WINDOW)]
+
+    def on_receive(
+        self, size: int, received_ms: float, send_ms: Optional[int], decode_us: int
+    ) -> None:
+        self.messages += 1
+        self.bytes += size
+        second = int(received_ms // 1000)
+        slot = second % RATE_WINDOW
+        if self._seconds[slot] != second:
+            self._seconds[slot] = second
+            self._counts[slot] = [0, 0]
+        self._counts[slot][0] += 1
+        self._counts[slot][1] += size
+        self.stages["decode"].record(decode_us)
+        if send_ms:
+            network = received_ms - send_ms
+            self.negative += network < 0
+            self.stages["network"].record(network * 1000)
+
+    def rates(self, now_s: Optional[float] = None) -> Dict[str, float]:
+        """Mean messages/bytes per second over the last full window."""
+        current = int(time.time() if now_s is None else now_s)
+        messages = size = 0
+        for second, (count, total) in zip(self._seconds, self._counts):
+            if current - RATE_WINDOW <= second < current:
+                messages += count
+                size += total
+        return {
+            "messages_per_s": round(messages / RATE_WINDOW, 2),
+            "bytes_per_s": round(size / RATE_WINDOW, 1),
+        }
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "messages": self.messages,
+            "bytes": self.bytes,
+            "negative_network": self.negative,
+            **self.rates(),
+            **{stage: hist.summary() for stage, hist in self.stages.items()},
+        }
+
+
+__all__ = ["ChannelStats", "RATE_WINDOW", "STAGES"]
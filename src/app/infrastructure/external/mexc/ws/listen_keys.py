@@ -0,0 +1,108 @@
+"""
+Listen-key lifecycle shared across user-stream reconnects.
+
+MEXC caps listen keys per account and each create/keepalive is a signed
+REST call. :class:`ListenKeyManager` creates one key (``reuse`` adopts an
+existing one instead), keeps it alive from one task and deletes it on
+shutdown only if it created it. Reconnects reuse the cached key.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import suppress
+from typing import Any, List, Optional
+
+logger = logging.getLogger(__name__)
+
+KEEPALIVE_INTERVAL = 25 * 60  # keys expire 60 min after a keepalive
+
+
+def listen_keys_of(response: Any) -> List[str]:
+    """Keys in a ``GET userDataStream`` response (list or one value)."""
+    keys = response.get("listenKey") if isinstance(response, dict) else None
+    if isinstance(keys, str):
+        return [keys]
+    return [key for key in keys or [] if key]
+
+
+class ListenKeyManager:
+    def __init__(
+        self, mexc_client, keepalive_interval: float = KEEPALIVE_INTERVAL, reuse: bool = False
+    ):
+        self._client = mexc_client
+        self.keepalive_interval = keepalive_interval
+        self.reuse = reuse
+        self.key: Optional[str] = None
+        self.owned = False  # created by this manager
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    async def acquire(self) -> str:
+        """Current key, created (or adopted) on first use."""
+        async with self._lock:
+            if self.key is None:
+                adopted = await self._adopt()
+                self.owned = adopted is None
+                self.key = adopted or await self._create()
+                logger.info(f"Using listen key {self.key[:8]}...")
+                if self.keepalive_interval:
+                    self._task = asyncio.create_task(self._keepalive_loop(self.key))
+            return self.key
+
+    async def _adopt(self) -> Optional[str]:
+        if not self.reuse:
+            return None
+        try:
+            async with self._client:
+                keys = listen_keys_of(await self._client.get_listen_keys())
+        except Exception as exc:
+            logger.warning(f"Listing listen keys failed: {exc}")
+            return None
+        return keys[0] if keys else None
+
+    async def _create(self) -> str:
+        async with self._client:
+            response = await self._client.create_listen_key()
+        key = response.get("listenKey") if isinstance(response, dict) else None
+        if not key:
+            raise RuntimeError("listenKey was not returned by MEXC")
+        return key
+
+    async def _keepalive_loop(self, key: str) -> None:
+        while True:
+            await asyncio.sleep(self.keepalive_interval)
+            try:
+                async with self._client:
+                    await self._client.keepalive_listen_key(key)
+            except Exception as exc:
+                logger.warning(f"Listen key keepalive failed: {exc}")
+                self.invalidate(key)
+                return
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """Drop ``key`` (default: current); acquire replaces it."""
+        if key is not None and key != self.key:
+            return
+        self.key = None
+        task, self._task = self._task, None
+        if task and task is not asyncio.current_task():
+            task.cancel()
+
+    async def close(self) -> None:
+        """Stop the keepalive; delete the key if this manager created it."""
+        key, task = self.key if self.owned else None, self._task
+        self.key, self._task = None, None
+        if task:
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+        if key:
+            try:
+                async with self._client:
+                    await self._client.close_listen_key(key)
+            except Exception as exc:
+                logger.warning(f"Closing listen key failed: {exc}")
+
+
+__all__ = ["KEEPALIVE_INTERVAL", "ListenKeyManager", "listen_keys_of"]
@@ -0,0 +1,75 @@
+"""
+Re-enterable user-data stream for supervisors.
+
+Each ``async with`` opens a fresh :func:`connect_user_stream` connection and
+closes it on exit, so a reconnect loop can treat the private stream like a
+``MEXCWebSocketClient``. The listen key comes from a shared
+:class:`ListenKeyManager`, so reconnects reuse it without signed REST calls.
+A connection that ends before delivering anything (an expired or rejected
+key, a failed handshake) drops the key so the next attempt gets a new one.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from typing import Iterable, Optional
+
+from src.app.infrastructure.external.mexc.websocket.fast_decoders import (
+    decode_push_records,
+)
+from src.app.infrastructure.external.mexc.websocket.market_streams import BinaryDecoder
+
+from .listen_keys import ListenKeyManager
+from .ws_client import connect_user_stream
+
+
+class UserStreamSession:
+    def __init__(
+        self,
+        mexc_client,
+        channels: Optional[Iterable[str]] = None,
+        binary_decoder: Optional[BinaryDecoder] = decode_push_records,
+        listen_keys: Optional[ListenKeyManager] = None,
+    ):
+        self._mexc = mexc_client
+        self._channels = channels
+        self._decoder = binary_decoder
+        self.listen_keys = listen_keys or ListenKeyManager(mexc_client)
+        self._stream = None
+        self._key: Optional[str] = None
+        self._delivered = False
+
+    async def __aenter__(self):
+        self._key = await self.listen_keys.acquire()
+        self._delivered = False
+        self._stream = self._relay(
+            connect_user_stream(
+                self._mexc,
+                self._channels,
+                listen_key=self._key,
+                binary_decoder=self._decoder,
+                keepalive_interval=None,  # the manager keeps the key alive
+            )
+        )
+        return self._stream
+
+    async def _relay(self, stream):
+        async with aclosing(stream):
+            async for message in stream:
+                self._delivered = True
+                yield message
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            await stream.aclose()
+        cancelled = exc_type is not None and issubclass(exc_type, asyncio.CancelledError)
+        if not self._delivered and not cancelled:
+            self.listen_keys.invalidate(self._key)
+
+    async def close(self) -> None:
+        """Release the listen key; call once the supervisor has stopped."""
+        await self.listen_keys.close()
+
+
+__all__ = ["UserStreamSession"]
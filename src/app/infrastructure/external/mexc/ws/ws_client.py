@@ -39,8 +39,15 @@ async def connect_public_trades(
     symbol: str,
     interval: str = "100ms",
     binary_decoder: Optional[BinaryDecoder] = decode_push_data,
+    hub=None,
 ) -> AsyncIterator[Any]:
+    """With ``hub`` the hub's shared upstream (and typed decoder) is used."""
     channel = trade_stream(symbol, interval)
+    if hub is not None:
+        async with await hub.subscribe([channel]) as subscription:
+            async for msg in subscription:
+                yield msg
+        return
     async with MEXCWebSocketClient(
         subscriptions=[channel], binary_decoder=binary_decoder
     ) as stream:
@@ -3,53 +3,113 @@ Live WebSocket Feed - Real-time market data implementation
 
 Implements MarketFeed port for live trading.
 """
-from typing import AsyncIterator
-from datetime import datetime
+import asyncio
+import time
+from typing import AsyncIterator, Iterable, Optional
+
+from websockets.exceptions import ConnectionClosedOK
 
 from src.app.domain.ports.market_feed import MarketFeed
+from src.app.application.market.candle_builder import CandleBuilder
 from src.app.application.market.timeframe_aggregator import MarketCandle
-from src.app.infrastructure.external.mexc.ws.ws_client import connect_public_trades
+from src.app.infrastructure.external.mexc.websocket import (
+    CANDLE_INTERVALS,
+    MEXCWebSocketClient,
+    decode_push_records,
+    kline_stream,
+    trade_stream,
+)
+from src.app.infrastructure.external.mexc.websocket.push_records import (
+    KlinePush,
+    TradesPush,
+)
+
+SOURCE_TRADES = "trades"
+SOURCE_KLINE = "kline"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
 
 
 class LiveWSFeed(MarketFeed):
     """
     Live market data from MEXC WebSocket.
-    
+
     From ✨.md Section 6.5: "LiveWSFeed for real-time WS data"
+
+    Candles are built from deal ticks or kline pushes and close on
+    wall-clock boundaries plus ``close_delay``.
     """
 
-    def __init__(self, symbol: str, interval: str = "1m"):
+    def __init__(
+        self, symbol: str, interval: str = "1m", source: str = SOURCE_TRADES,
+        close_delay: float = 0.25, hub=None,
+    ):
         """
         Initialize live WS feed.
-        
+
         Args:
             symbol: Trading symbol (e.g., "QRLUSDT")
-            interval: Kline interval (default "1m")
+            interval: Candle interval (default "1m")
+            source: SOURCE_TRADES or SOURCE_KLINE
+            close_delay: Grace seconds past a bar boundary
+            hub: Optional shared MarketDataHub
         """
+        if interval not in CANDLE_INTERVALS:
+            raise ValueError(f"interval must be one of {sorted(CANDLE_INTERVALS)}")
+        if source not in (SOURCE_TRADES, SOURCE_KLINE):
+            raise ValueError(f"source must be {SOURCE_TRADES} or {SOURCE_KLINE}")
         self.symbol = symbol
         self.interval = interval
+        self.source = source
+        self.close_delay_ms = int(close_delay * 1000)
+        kline_interval, seconds = CANDLE_INTERVALS[interval]
+        self.channel = trade_stream(symbol)
+        if source == SOURCE_KLINE:
+            self.channel = kline_stream(symbol, kline_interval)
+        self.builder = CandleBuilder(symbol, seconds)
+        self.hub = hub
+
+    def provisional(self) -> Optional[MarketCandle]:
+        """The in-progress candle."""
+        return self.builder.provisional()
+
+    def on_push(self, push) -> Iterable[MarketCandle]:
+        """Feed one decoded push; returns closed candles."""
+        if isinstance(push, TradesPush):
+            closed = []
+            for tick in push.trades:
+                closed += self.builder.on_trade(tick.price, tick.quantity, tick.time)
+            return closed
+        if isinstance(push, KlinePush):
+            return self.builder.on_kline(push)
+        return ()
 
     async def stream(self) -> AsyncIterator[MarketCandle]:
-        """
-        Stream live market candles from MEXC WebSocket.
-        
-        Yields:
-            MarketCandle instances from live data
-        """
-        async for raw_data in connect_public_trades(self.symbol, self.interval):
-            # Map raw MEXC data to MarketCandle
-            if isinstance(raw_data, dict) and "k" in raw_data:
-                kline = raw_data["k"]
-                candle = MarketCandle(
-                    symbol=self.symbol,
-                    open=float(kline.get("o", 0)),
-                    high=float(kline.get("h", 0)),
-                    low=float(kline.get("l", 0)),
-                    close=float(kline.get("c", 0)),
-                    volume=float(kline.get("v", 0)),
-                    closed_at=datetime.fromtimestamp(kline.get("t", 0) / 1000),
-                )
-                yield candle
-
-
-__all__ = ["LiveWSFeed"]
+        """Stream live candles, including flat candles for silent bars."""
+        if self.hub is not None:
+            source = await self.hub.subscribe([self.channel])
+        else:
+            source = MEXCWebSocketClient(
+                subscriptions=[self.channel], binary_decoder=decode_push_records
+            )
+        async with source as ws:
+            while True:
+                cutoff = _now_ms() - self.close_delay_ms
+                due = self.builder.next_close_ms(cutoff) + self.close_delay_ms
+                try:
+                    push = await asyncio.wait_for(
+                        ws.recv(), timeout=max(due - _now_ms(), 0) / 1000
+                    )
+                except asyncio.TimeoutError:
+                    push = None
+                except ConnectionClosedOK:
+                    return
+                for candle in self.on_push(push):
+                    yield candle
+                for candle in self.builder.on_time(_now_ms() - self.close_delay_ms):
+                    yield candle
+
+
+__all__ = ["LiveWSFeed", "SOURCE_KLINE", "SOURCE_TRADES"]
@@ -7,6 +7,7 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException
 
 from src.app.application.account.balance_service import BalanceService
+from src.app.application.account.live_balance_service import LiveBalanceService
 from src.app.application.account.list_orders import get_orders
 from src.app.application.account.list_trades import get_trades
 
@@ -17,7 +18,7 @@ logger = logging.getLogger(__name__)
 def _build_balance_service() -> BalanceService:
     from src.app.infrastructure.external import mexc_client
     from src.app.infrastructure.external import redis_client
-    return BalanceService(mexc_client, redis_client)
+    return LiveBalanceService(mexc_client, redis_client)
 
 
 def _get_mexc_client():
@@ -0,0 +1,67 @@
+"""
+Diagnostics HTTP routes - runtime state of the exchange clients.
+"""
+import logging
+from datetime import datetime
+from typing import Any, Dict
+
+from fastapi import APIRouter
+
+router = APIRouter(prefix="/diagnostics", tags=["Diagnostics"])
+logger = logging.getLogger(__name__)
+
+
+def _get_mexc_client():
+    """Get MEXC client instance from infrastructure."""
+    from src.app.infrastructure.external import mexc_client
+    return mexc_client
+
+
+@router.get("/mexc")
+async def mexc_diagnostics_endpoint() -> Dict[str, Any]:
+    """MEXC REST client state (rate limits, clock offset, circuit breakers)."""
+    mexc_client = _get_mexc_client()
+    return {
+        "success": True,
+        "rate_limit": mexc_client.rate_limit_status(),
+        "clock": mexc_client.clock_status(),
+        "circuits": mexc_client.circuit_status(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@router.get("/streams")
+async def stream_diagnostics_endpoint() -> Dict[str, Any]:
+    """Long-lived websocket consumers and the frame recorder."""
+    from src.app.application.account.balance_stream import balance_stream
+    from src.app.infrastructure.external.mexc.orderbook import order_books
+    from src.app.infrastructure.external.mexc.websocket import market_hub
+    from src.app.infrastructure.external.mexc.websocket.frame_recorder import (
+        active_recorder,
+    )
+
+    recorder = active_recorder()
+    return {
+        "success": True,
+        "balance_stream": balance_stream.status(),
+        "order_books": order_books.status(),
+        "market_hub": market_hub.status(),
+        "recorder": recorder.status() if recorder else None,
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@router.get("/ws")
+async def websocket_latency_endpoint() -> Dict[str, Any]:
+    """Per-channel websocket latency histograms and throughput."""
+    from src.app.infrastructure.external.mexc.websocket import stream_monitor
+
+    return {
+        "success": True,
+        "enabled": stream_monitor.enabled,
+        "channels": stream_monitor.snapshot(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+__all__ = ["router"]
@@ -7,8 +7,10 @@ from fastapi import APIRouter, HTTPException
 from typing import Optional
 
 from src.app.application.market.get_price import get_price
+from src.app.application.market.estimate_fill import estimate_fill
 from src.app.application.market.get_orderbook import get_orderbook
 from src.app.application.market.get_klines import get_klines
+from src.app.application.market.stale_fallback import SOURCE_CACHE, fetch_or_stale
 
 router = APIRouter(prefix="/market", tags=["Market Data"])
 logger = logging.getLogger(__name__)
@@ -20,12 +22,24 @@ def _get_mexc_client():
     return mexc_client
 
 
+def _get_market_cache():
+    """Get the Redis market cache used as a stale fallback."""
+    from src.app.infrastructure.external import redis_client
+    return redis_client
+
+
+def _get_live_book(symbol: str):
+    """Get the in-sync local order book for a symbol, if one is streaming."""
+    from src.app.infrastructure.external.mexc.orderbook import order_books
+    return order_books.get(symbol)
+
+
 @router.get("/price/{symbol}")
 async def price_endpoint(symbol: str):
     """Get current price for a symbol (Direct MEXC API)."""
     try:
         mexc_client = _get_mexc_client()
-        result = await get_price(symbol, mexc_client)
+        result = await get_price(symbol, mexc_client, cache=_get_market_cache())
         return result
     except Exception as e:
         logger.error(f"Failed to get price for {symbol}: {e}")
@@ -37,13 +51,33 @@ async def orderbook_endpoint(symbol: str, limit: int = 20):
     """Get order book depth for a symbol."""
     try:
         mexc_client = _get_mexc_client()
-        result = await get_orderbook(symbol, mexc_client, limit=limit)
+        result = await get_orderbook(
+            symbol,
+            mexc_client,
+            limit=limit,
+            cache=_get_market_cache(),
+            book=_get_live_book(symbol),
+        )
         return result
     except Exception as e:
         logger.error(f"Failed to get orderbook for {symbol}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/orderbook/{symbol}/fill")
+async def orderbook_fill_endpoint(symbol: str, side: str, quantity: float):
+    """Estimate average price and cost to fill a market order of ``quantity``."""
+    try:
+        return await estimate_fill(
+            symbol, side, quantity, _get_mexc_client(), book=_get_live_book(symbol)
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"Failed to estimate fill for {symbol}: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/klines/{symbol}")
 async def klines_endpoint(
     symbol: str,
@@ -62,6 +96,7 @@ async def klines_endpoint(
             limit=limit,
             start_time=start_time,
             end_time=end_time,
+            cache=_get_market_cache(),
         )
         return result
     except Exception as e:
@@ -73,13 +108,19 @@ async def klines_endpoint(
 async def ticker_endpoint(symbol: str):
     """Get 24-hour ticker data for a symbol."""
     mexc_client = _get_mexc_client()
+    cache = _get_market_cache()
     try:
         logger.info(f"Fetching ticker for {symbol} from MEXC API")
         async with mexc_client:
-            ticker = await mexc_client.get_ticker_24hr(symbol)
+            ticker, source = await fetch_or_stale(
+                lambda: mexc_client.get_ticker_24hr(symbol),
+                lambda: cache.get_ticker_24hr(symbol),
+                lambda data: cache.set_ticker_24hr(symbol, data),
+            )
             return {
                 "success": True,
-                "source": "api",
+                "source": source,
+                "stale": source == SOURCE_CACHE,
                 "symbol": symbol,
                 "data": ticker,
                 "timestamp": datetime.now().isoformat(),
@@ -131,13 +172,19 @@ async def book_ticker_endpoint(symbol: str):
 async def trades_endpoint(symbol: str, limit: int = 200):
     """Get recent trades for a symbol."""
     mexc_client = _get_mexc_client()
+    cache = _get_market_cache()
     try:
         logger.info(f"Fetching recent trades for {symbol} from MEXC API")
         async with mexc_client:
-            trades = await mexc_client.get_recent_trades(symbol, limit)
+            trades, source = await fetch_or_stale(
+                lambda: mexc_client.get_recent_trades(symbol, limit),
+                lambda: cache.get_recent_trades(symbol),
+                lambda data: cache.set_recent_trades(symbol, data),
+            )
             return {
                 "success": True,
-                "source": "api",
+                "source": source,
+                "stale": source == SOURCE_CACHE,
                 "symbol": symbol,
                 "data": trades,
                 "count": len(trades),
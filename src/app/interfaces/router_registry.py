@@ -21,7 +21,7 @@ def register_all_routers(app: FastAPI) -> None:
     Register all API routers to the FastAPI application.
 
     This function consolidates router registration from:
-    - HTTP endpoints (status, market, account, bot, sub_account)
+    - HTTP endpoints (status, market, account, bot, sub_account, diagnostics)
     - Task endpoints (via tasks aggregator)
 
     Args:
@@ -50,6 +50,7 @@ def _register_http_routers(app: FastAPI) -> None:
     - account: /account/*
     - bot: /bot/*
     - sub_account: /account/sub-account/*
+    - diagnostics: /diagnostics/*
 
     Args:
         app: The FastAPI application instance
@@ -60,6 +61,7 @@ def _register_http_routers(app: FastAPI) -> None:
         from src.app.interfaces.http.account import router as account_router
         from src.app.interfaces.http.bot import router as bot_router
         from src.app.interfaces.http.sub_account import router as sub_account_router
+        from src.app.interfaces.http.diagnostics import router as diagnostics_router
 
         # Register HTTP routers in order
         app.include_router(status_router)
@@ -67,9 +69,11 @@ def _register_http_routers(app: FastAPI) -> None:
         app.include_router(account_router)
         app.include_router(bot_router)
         app.include_router(sub_account_router)
+        app.include_router(diagnostics_router)
 
         logger.info(
-            "HTTP routers registered: status, market, account, bot, sub_account"
+            "HTTP routers registered: status, market, account, bot, sub_account, "
+            "diagnostics"
         )
 
     except Exception as e:
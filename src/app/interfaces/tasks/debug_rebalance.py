@@ -13,7 +13,10 @@ from typing import Optional
 
 from fastapi import APIRouter, Header
 
-from src.app.application.account.balance_service import BalanceService
+from src.app.application.account.live_balance_service import LiveBalanceService
+from src.app.application.trading.services.trading.order_sizing import (
+    load_symbol_filters,
+)
 from src.app.application.trading.services.trading.rebalance_service import (
     RebalanceService,
 )
@@ -40,7 +43,7 @@ async def debug_rebalance_status():
     """
     try:
         # Get balance snapshot
-        balance_service = BalanceService(mexc_client, redis_client)
+        balance_service = LiveBalanceService(mexc_client, redis_client)
         snapshot = await balance_service.get_account_balance()
         
         # Generate rebalance plan
@@ -83,17 +86,8 @@ async def debug_rebalance_status():
         qrl_ratio = (qrl_value / total_value * 100) if total_value > 0 else 0
         usdt_ratio = (usdt_total / total_value * 100) if total_value > 0 else 0
         
-        # Get exchange info for min order size
-        try:
-            exchange_info = await mexc_client.get_exchange_info(QRL_USDT_SYMBOL)
-            symbol_info = exchange_info.get("symbols", [{}])[0] if exchange_info.get("symbols") else {}
-            filters = {f.get("filterType"): f for f in symbol_info.get("filters", [])}
-            lot_size = filters.get("LOT_SIZE", {})
-            min_notional = filters.get("MIN_NOTIONAL", {})
-        except Exception as e:
-            logger.warning(f"Could not fetch exchange info: {e}")
-            lot_size = {}
-            min_notional = {}
+        # Exchange rules for min order size (cached symbol filters)
+        filters = await load_symbol_filters(mexc_client, QRL_USDT_SYMBOL)
         
         return {
             "status": "success",
@@ -129,10 +123,10 @@ async def debug_rebalance_status():
                 checks["deviation_exceeds_threshold"],
             ]),
             "exchange_constraints": {
-                "min_qty": lot_size.get("minQty"),
-                "max_qty": lot_size.get("maxQty"),
-                "step_size": lot_size.get("stepSize"),
-                "min_notional": min_notional.get("minNotional"),
+                "min_qty": str(filters.min_qty) if filters else None,
+                "step_size": str(filters.step_size) if filters else None,
+                "tick_size": str(filters.tick_size) if filters else None,
+                "min_notional": str(filters.min_notional) if filters else None,
             },
         }
         
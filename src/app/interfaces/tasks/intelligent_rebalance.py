@@ -17,11 +17,15 @@ from typing import Optional
 
 from fastapi import APIRouter, Header, HTTPException
 
-from src.app.application.account.balance_service import BalanceService
+from src.app.application.account.live_balance_service import LiveBalanceService
+from src.app.application.trading.services.trading.order_sizing import (
+    load_symbol_filters,
+)
 from src.app.application.trading.services.trading.intelligent_rebalance_service import (
     IntelligentRebalanceService,
 )
 from src.app.infrastructure.external import mexc_client, redis_client, QRL_USDT_SYMBOL
+from src.app.infrastructure.external.mexc.orderbook import order_books
 from src.app.interfaces.tasks.shared import require_scheduler_auth
 
 logger = logging.getLogger(__name__)
@@ -87,11 +91,13 @@ async def task_rebalance_intelligent(
 
     try:
         # Step 3: Generate intelligent rebalance plan
-        balance_service = BalanceService(mexc_client, redis_client)
+        balance_service = LiveBalanceService(mexc_client, redis_client)
         intelligent_service = IntelligentRebalanceService(
             balance_service=balance_service,
             mexc_client=mexc_client,
             redis_client=redis_client,
+            symbol_filters=await load_symbol_filters(mexc_client, QRL_USDT_SYMBOL),
+            order_book=order_books.get(QRL_USDT_SYMBOL),
         )
         plan = await intelligent_service.generate_plan()
 
@@ -115,6 +121,7 @@ async def task_rebalance_intelligent(
                     symbol=QRL_USDT_SYMBOL,
                     side=plan["action"],
                     quantity=plan["quantity"],
+                    reference_price=plan.get("price"),
                 )
                 order_result = {
                     "executed": True,
@@ -13,11 +13,15 @@ from typing import Optional
 
 from fastapi import APIRouter, Header, HTTPException
 
-from src.app.application.account.balance_service import BalanceService
+from src.app.application.account.live_balance_service import LiveBalanceService
+from src.app.application.trading.services.trading.order_sizing import (
+    load_symbol_filters,
+)
 from src.app.application.trading.services.trading.rebalance_service import (
     RebalanceService,
 )
 from src.app.infrastructure.external import mexc_client, redis_client, QRL_USDT_SYMBOL
+from src.app.infrastructure.external.mexc.orderbook import order_books
 from src.app.interfaces.tasks.shared import require_scheduler_auth
 
 logger = logging.getLogger(__name__)
@@ -80,8 +84,13 @@ async def task_15_min_job(
 
         # Step 4: Execute rebalance
         logger.info("[15-min-job] Executing rebalance plan generation...")
-        balance_service = BalanceService(mexc_client, redis_client)
-        rebalance_service = RebalanceService(balance_service, redis_client)
+        balance_service = LiveBalanceService(mexc_client, redis_client)
+        rebalance_service = RebalanceService(
+            balance_service,
+            redis_client,
+            symbol_filters=await load_symbol_filters(mexc_client, QRL_USDT_SYMBOL),
+            order_book=order_books.get(QRL_USDT_SYMBOL),
+        )
 
         # Get balance snapshot for debugging
         snapshot = await balance_service.get_account_balance()
@@ -122,6 +131,7 @@ async def task_15_min_job(
                     symbol=QRL_USDT_SYMBOL,
                     side=rebalance_plan["action"],
                     quantity=rebalance_plan["quantity"],
+                    reference_price=rebalance_plan.get("price"),
                 )
                 order_result = {
                     "executed": True,
@@ -0,0 +1,126 @@
+"""
+Micro-benchmark: MessageToDict push decoding vs. the typed fast path.
+
+Usage:
+    python tests/bench_ws_decoders.py [frames.bin | recording] [--repeat N]
+
+``frames.bin`` holds raw websocket frames, each prefixed by a 4-byte
+big-endian length; a recording is a ``FrameRecorder`` directory or segment,
+which is also replayed end to end through ``ReplayClient``. Without a file
+a synthetic mix of aggregated trades and diff-depth frames is used.
+"""
+import argparse
+import asyncio
+import struct
+import sys
+import time
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    ReplayClient,
+    build_fast_decoder,
+    decode_push_records,
+)
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    frame_reader,
+    frame_recorder,
+)
+from src.app.infrastructure.external.mexc.ws.ws_client import decode_push_data  # noqa: E402
+from src.app.infrastructure.external.proto.websocket_pb import (  # noqa: E402
+    PushDataV3ApiWrapper_pb2,
+)
+
+_DEPTH = "spot@public.aggre.depth.v3.api.pb@100ms@BTCUSDT"
+
+
+def is_recording(path: Path) -> bool:
+    if path.is_dir():
+        return True
+    with open(path, "rb") as file:
+        magic = frame_recorder.SEGMENT_MAGIC
+        return file.read(len(magic)) == magic
+
+
+def read_frames(path: Path) -> list:
+    if is_recording(path):
+        return [
+            frame.payload
+            for frame in frame_reader.read_frames(path)
+            if isinstance(frame.payload, bytes)
+        ]
+    data = path.read_bytes()
+    frames, offset = [], 0
+    while offset + 4 <= len(data):
+        (length,) = struct.unpack_from(">I", data, offset)
+        frames.append(data[offset + 4 : offset + 4 + length])
+        offset += 4 + length
+    return frames
+
+
+def synthetic_frames(count: int = 2000) -> list:
+    frames = []
+    for index in range(count):
+        wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper()
+        wrapper.symbol, wrapper.sendTime = "BTCUSDT", 1700000000000 + index
+        if index % 2:
+            wrapper.channel = "spot@public.aggre.deals.v3.api.pb@100ms@BTCUSDT"
+            for n in range(5):
+                deal = wrapper.publicAggreDeals.deals.add()
+                deal.price, deal.quantity = f"{42000 + n}.5", "0.01"
+                deal.tradeType, deal.time = 1 + n % 2, index
+        else:
+            wrapper.channel = _DEPTH
+            body = wrapper.publicAggreDepths
+            for n in range(10):
+                bid, ask = body.bids.add(), body.asks.add()
+                bid.price, bid.quantity = f"{41999 - n}.9", "1.5"
+                ask.price, ask.quantity = f"{42000 + n}.1", "0.7"
+            body.fromVersion, body.toVersion = str(index), str(index + 1)
+        frames.append(wrapper.SerializeToString())
+    return frames
+
+
+def bench(name: str, decoder, frames: list, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for frame in frames:
+            decoder(frame)
+    elapsed = time.perf_counter() - start
+    per_frame = elapsed / (len(frames) * repeat) * 1e6
+    print(f"{name:<24} {per_frame:8.2f} us/frame")
+    return per_frame
+
+
+async def bench_replay(path: Path) -> None:
+    """Recorded frames through the client, decoder and ``recv`` at full speed."""
+    count = 0
+    start = time.perf_counter()
+    async with ReplayClient(path, speed=None, binary_decoder=decode_push_records) as ws:
+        async for _ in ws:
+            count += 1
+    elapsed = time.perf_counter() - start
+    print(f"{'replay (client path)':<24} {count / elapsed:8.0f} frames/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("frames", nargs="?", type=Path)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    frames = read_frames(args.frames) if args.frames else synthetic_frames()
+    print(f"{len(frames)} frames x {args.repeat}")
+    baseline = bench("MessageToDict", decode_push_data, frames, args.repeat)
+    fast = bench("typed fast path", decode_push_records, frames, args.repeat)
+    bench("fast path (depth only)", build_fast_decoder([_DEPTH]), frames, args.repeat)
+    print(f"speedup: {baseline / fast:.1f}x")
+    if args.frames and is_recording(args.frames):
+        asyncio.run(bench_replay(args.frames))
+
+
+if __name__ == "__main__":
+    main()
@@ -69,22 +69,29 @@ class TestTimeframeAggregator:
         candles = [
             MarketCandle(
                 symbol="QRLUSDT",
-                open=1.0,
-                high=1.2,
-                low=0.9,
-                close=1.1,
+                open=1.0 + i,
+                high=1.2 + i,
+                low=0.9 - i,
+                close=1.1 + i,
                 volume=100.0,
-                closed_at=datetime(2024, 1, 1, 0, i, 0),
+                closed_at=datetime(2024, 1, 1, 0, i + 1, 0),
             )
             for i in range(3)
         ]
         
-        # Manually merge to test logic
-        for candle in candles:
-            aggregator.on_candle(candle)
+        completed = []
+        for candle in candles[:2]:
+            completed += aggregator.on_candle(candle)
         
-        # Buffer should have 3 candles
-        assert len(aggregator.buffers[3]) == 3
+        # Accumulator holds the open bucket until its last minute arrives
+        assert completed == []
+        assert len(aggregator.buffers[3]) == 2
+        
+        completed = aggregator.on_candle(candles[2])
+        assert completed == [
+            (3, MarketCandle("QRLUSDT", 1.0, 3.2, -1.1, 3.1, 300.0, datetime(2024, 1, 1, 0, 3)))
+        ]
+        assert len(aggregator.buffers[3]) == 0
 
 
 class TestWSClientHeartbeat:
@@ -0,0 +1,165 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.application.account import balance_stream as stream_module  # noqa: E402
+from src.app.application.account.live_balance_service import LiveBalanceService  # noqa: E402
+from src.app.application.account.live_balances import LiveBalances  # noqa: E402
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    decode_push_records,
+)
+from src.app.infrastructure.external.mexc.websocket.push_records import (  # noqa: E402
+    AccountPush,
+)
+from src.app.infrastructure.external.proto.websocket_pb import (  # noqa: E402
+    PushDataV3ApiWrapper_pb2,
+)
+
+ACCOUNT = "spot@private.account.v3.api.pb"
+SNAPSHOT = {
+    "balances": {},
+    "prices": {"QRLUSDT": 0.5},
+    "raw": {
+        "balances": [
+            {"asset": "QRL", "free": "100", "locked": "0"},
+            {"asset": "USDT", "free": "20", "locked": "5"},
+        ]
+    },
+}
+
+
+def _push(asset: str, free: float, locked: float, time: int) -> AccountPush:
+    return AccountPush(ACCOUNT, time, asset, free, locked, 0.0, 0.0, "ENTRUST", time)
+
+
+class FakeMexcClient:
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.calls = 0
+        self.ticker = {"symbol": "QRLUSDT", "price": "0.75"}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def get_balance_snapshot(self):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("REST down")
+        return SNAPSHOT
+
+    async def get_ticker_price(self, symbol):
+        if self.ticker is None:
+            raise RuntimeError("ticker down")
+        return self.ticker
+
+
+class FakeRedis:
+    def __init__(self):
+        self.storage = {}
+
+    async def set_cached_account_balance(self, balance_data, ttl=45):
+        self.storage["cache"] = (balance_data, ttl)
+        return True
+
+    async def set_mexc_account_balance(self, balance_data):
+        self.storage["mexc_balance"] = balance_data
+        return True
+
+
+def test_decoder_builds_account_push():
+    wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper()
+    wrapper.channel, wrapper.sendTime = ACCOUNT, 1700000000123
+    body = wrapper.privateAccount
+    body.vcoinName, body.balanceAmount, body.frozenAmount = "USDT", "12.5", "7.5"
+    body.balanceAmountChange, body.frozenAmountChange = "-7.5", "7.5"
+    body.type, body.time = "ENTRUST_PLACE", 1700000000100
+
+    push = decode_push_records(wrapper.SerializeToString())
+
+    assert push == AccountPush(
+        ACCOUNT, 1700000000123, "USDT", 12.5, 7.5, -7.5, 7.5,
+        "ENTRUST_PLACE", 1700000000100,
+    )
+
+
+def test_live_balances_orders_pushes_against_rest_snapshot():
+    state = LiveBalances()
+    assert state.apply(_push("USDT", 10.0, 15.0, 2_000))
+    state.load(SNAPSHOT, as_of_ms=1_000)
+
+    # The push is newer than the REST request, so it survives the reload.
+    usdt = state.snapshot()["balances"]["USDT"]
+    assert (usdt["free"], usdt["locked"], usdt["total"]) == ("10.0", "15.0", 25.0)
+    assert state.snapshot()["balances"]["QRL"]["total"] == 100.0
+
+    assert not state.apply(_push("USDT", 99.0, 0.0, 1_500))
+    assert state.stale_pushes == 1
+    assert state.snapshot()["prices"]["QRLUSDT"] == 0.5
+
+
+class FakeSession:
+    def __init__(self, pushes):
+        self.pushes = pushes
+        self.entered = 0
+        self.closed = False
+
+    async def __aenter__(self):
+        self.entered += 1
+        return self._stream()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def close(self):
+        self.closed = True
+
+    async def _stream(self):
+        yield {"id": 0, "code": 0, "msg": ACCOUNT}
+        await asyncio.sleep(0.01)
+        for push in self.pushes:
+            yield push
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_balance_stream_keeps_service_and_cache_hot(monkeypatch):
+    session = FakeSession([_push("QRL", 60.0, 40.0, 2**62)])
+    monkeypatch.setattr(stream_module, "UserStreamSession", lambda client: session)
+    mexc, redis = FakeMexcClient(), FakeRedis()
+    stream = stream_module.BalanceStream(reconcile_interval=60.0)
+    stream.start(mexc, redis)
+    try:
+        for _ in range(100):
+            if stream.state.pushes:
+                break
+            await asyncio.sleep(0.01)
+        assert stream.live
+        cached, ttl = redis.storage["cache"]
+        assert cached["balances"]["QRL"]["locked"] == "40.0" and ttl == 120
+
+        mexc.fail = True
+        service = LiveBalanceService(mexc, redis, live=stream)
+        result = await service.get_account_balance()
+        assert result["source"] == "stream"
+        assert result["balances"]["QRL"]["free"] == "60.0"
+        assert result["prices"]["QRLUSDT"] == 0.75  # per-request ticker, not the seed
+        assert mexc.calls == 1  # only the seeding reconciliation hit REST
+
+        # Without a fresh price the stream snapshot is not served.
+        mexc.fail, mexc.ticker = False, None
+        result = await service.get_account_balance()
+        assert result["source"] == "api" and mexc.calls == 2
+    finally:
+        await stream.stop()
+    assert not stream.live
+    assert await stream.snapshot() is None
+    assert session.closed
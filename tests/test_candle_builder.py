@@ -0,0 +1,82 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.application.market.candle_builder import CandleBuilder  # noqa: E402
+from src.app.infrastructure.external.mexc.websocket.push_records import (  # noqa: E402
+    KlinePush,
+    TradeTick,
+    TradesPush,
+)
+from src.app.infrastructure.market.live_ws_feed import LiveWSFeed  # noqa: E402
+
+T0 = 1_700_000_040_000  # a minute boundary in ms
+
+
+def _kline(start_s, close, volume):
+    return KlinePush(
+        "k", "QRLUSDT", 0, "Min1", start_s, start_s + 60, 1.0, 1.2, 0.9, close, volume, 0
+    )
+
+
+def test_trades_build_epoch_aligned_bars():
+    builder = CandleBuilder("QRLUSDT")
+    assert builder.on_trade(1.0, 2, T0 + 1_000) == []
+    builder.on_trade(1.3, 1, T0 + 20_000)
+    builder.on_trade(0.8, 1, T0 + 59_999)
+
+    closed = builder.on_trade(1.1, 5, T0 + 60_000)
+
+    assert len(closed) == 1
+    bar = closed[0]
+    assert (bar.open, bar.high, bar.low, bar.close, bar.volume) == (1.0, 1.3, 0.8, 0.8, 4)
+    assert bar.closed_at.timestamp() * 1000 == T0 + 60_000
+    assert builder.provisional().open == 1.1
+
+
+def test_bars_close_on_time_and_fill_silent_minutes():
+    builder = CandleBuilder("QRLUSDT")
+    builder.on_trade(1.0, 1, T0)
+
+    assert builder.on_time(T0 + 59_000) == []
+    closed = builder.on_time(T0 + 180_500)
+
+    assert [c.volume for c in closed] == [1, 0, 0]
+    assert all(c.close == 1.0 for c in closed)
+    assert builder.provisional() is None
+
+    builder.on_trade(2.0, 1, T0 + 30_000)  # late tick for a closed bar
+    assert builder.late_ticks == 1
+
+
+def test_kline_pushes_restate_window():
+    builder = CandleBuilder("QRLUSDT")
+    start = T0 // 1000
+    builder.on_kline(_kline(start, 1.1, 10))
+    builder.on_kline(_kline(start, 1.15, 12))
+
+    closed = builder.on_kline(_kline(start + 60, 1.2, 1))
+
+    assert [(c.close, c.volume) for c in closed] == [(1.15, 12)]
+
+
+def test_live_feed_turns_deal_pushes_into_candles():
+    feed = LiveWSFeed("QRLUSDT")
+    candles = []
+    for minute in range(6):
+        ticks = (TradeTick(1.0 + minute, 1.0, "BUY", T0 + minute * 60_000),)
+        candles += feed.on_push(TradesPush("c", "QRLUSDT", 0, ticks))
+
+    assert [c.open for c in candles] == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert feed.provisional().open == 6.0
+    assert feed.on_push({"id": 0, "msg": "ack"}) == ()
+
+
+def test_live_feed_rejects_unknown_interval():
+    with pytest.raises(ValueError):
+        LiveWSFeed("QRLUSDT", interval="7m")
@@ -0,0 +1,140 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.ws import (  # noqa: E402
+    user_stream_session as session_module,
+)
+from src.app.infrastructure.external.mexc.ws.listen_keys import (  # noqa: E402
+    ListenKeyManager,
+    listen_keys_of,
+)
+
+
+class FakeMexcClient:
+    def __init__(self, existing=None, keepalive_fails=False):
+        self.existing = list(existing or [])
+        self.keepalive_fails = keepalive_fails
+        self.calls = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def get_listen_keys(self):
+        self.calls.append(("list",))
+        return {"listenKey": self.existing}
+
+    async def create_listen_key(self):
+        self.calls.append(("create",))
+        return {"listenKey": f"new-{len(self.calls)}"}
+
+    async def keepalive_listen_key(self, key):
+        self.calls.append(("keepalive", key))
+        if self.keepalive_fails:
+            raise RuntimeError("listen key expired")
+        return {"listenKey": key}
+
+    async def close_listen_key(self, key):
+        self.calls.append(("close", key))
+        return {"listenKey": key}
+
+
+def test_listen_keys_of_accepts_list_or_single_key():
+    assert listen_keys_of({"listenKey": ["a", "", "b"]}) == ["a", "b"]
+    assert listen_keys_of({"listenKey": "a"}) == ["a"]
+    assert listen_keys_of({}) == [] and listen_keys_of(None) == []
+
+
+@pytest.mark.asyncio
+async def test_reconnects_reuse_one_key_and_shutdown_closes_it():
+    client = FakeMexcClient(existing=["held"])
+    keys = ListenKeyManager(client, keepalive_interval=0.01)
+
+    key = await keys.acquire()
+    assert [await keys.acquire() for _ in range(4)] == [key] * 4
+    await asyncio.sleep(0.035)
+    await keys.close()
+
+    kinds = [call[0] for call in client.calls]
+    assert kinds[0] == "create" and "list" not in kinds  # no adoption by default
+    assert 2 <= kinds.count("keepalive") <= 4
+    assert client.calls[-1] == ("close", key)
+    assert keys.key is None
+
+
+@pytest.mark.asyncio
+async def test_adopted_key_is_never_deleted():
+    client = FakeMexcClient(existing=["held"])
+    keys = ListenKeyManager(client, keepalive_interval=0, reuse=True)
+
+    assert await keys.acquire() == "held"
+    assert not keys.owned
+    await keys.close()
+
+    assert client.calls == [("list",)]  # another instance may still stream on it
+
+
+@pytest.mark.asyncio
+async def test_failed_keepalive_rotates_to_a_new_key():
+    client = FakeMexcClient(keepalive_fails=True)
+    keys = ListenKeyManager(client, keepalive_interval=0.01)
+
+    first = await keys.acquire()
+    await asyncio.sleep(0.03)
+    second = await keys.acquire()
+    await keys.close()
+
+    assert first != second
+    assert [call[0] for call in client.calls].count("create") == 2
+
+
+@pytest.mark.asyncio
+async def test_user_stream_session_reconnects_without_rest_calls(monkeypatch):
+    opened = []
+
+    async def fake_connect(client, channels, listen_key=None, keepalive_interval=0, **_):
+        opened.append((listen_key, keepalive_interval))
+        yield {"id": 0}
+
+    monkeypatch.setattr(session_module, "connect_user_stream", fake_connect)
+    client = FakeMexcClient()
+    session = session_module.UserStreamSession(client)
+    for _ in range(3):
+        async with session as stream:
+            assert await stream.__anext__() == {"id": 0}
+    await session.close()
+
+    assert opened == [("new-1", None)] * 3
+    assert [call[0] for call in client.calls] == ["create", "close"]
+
+
+@pytest.mark.asyncio
+async def test_rejected_key_is_dropped_before_the_next_reconnect(monkeypatch):
+    opened = []
+
+    async def fake_connect(client, channels, listen_key=None, **_):
+        opened.append(listen_key)
+        if listen_key == "new-1":
+            raise ConnectionError("HTTP 400: listen key expired")
+        yield {"id": 0}
+
+    monkeypatch.setattr(session_module, "connect_user_stream", fake_connect)
+    session = session_module.UserStreamSession(FakeMexcClient())
+    with pytest.raises(ConnectionError):
+        async with session as stream:
+            await stream.__anext__()
+    for _ in range(2):
+        async with session as stream:
+            assert await stream.__anext__() == {"id": 0}
+    await session.close()
+
+    assert opened == ["new-1", "new-2", "new-2"]
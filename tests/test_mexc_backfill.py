@@ -0,0 +1,89 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc import MEXCClient  # noqa: E402
+from src.app.infrastructure.external.mexc.pagination import split_windows  # noqa: E402
+
+
+def test_split_windows_covers_range_without_overlap():
+    assert split_windows(0, 249, 100) == [(0, 99), (100, 199), (200, 249)]
+
+
+@pytest.mark.asyncio
+async def test_iter_klines_yields_ordered_unique_rows(monkeypatch):
+    client = MEXCClient(api_key="k", secret_key="s")
+    requested = []
+
+    async def fake_get_klines(symbol, interval, start_time=None, end_time=None, limit=500):
+        requested.append((start_time, end_time))
+        # Exchange returns the boundary candle of the previous window too.
+        first = max(0, start_time - 60_000)
+        return [[t, "1", "1", "1", "1", "1", t + 59_999] for t in range(first, end_time + 1, 60_000)]
+
+    monkeypatch.setattr(client, "get_klines", fake_get_klines)
+
+    rows = [row async for row in client.iter_klines("QRLUSDT", "1m", 0, 599_999, limit=3)]
+
+    assert [row[0] for row in rows] == [i * 60_000 for i in range(10)]
+    assert len(requested) == 4
+
+
+@pytest.mark.asyncio
+async def test_iter_aggregate_trades_pages_full_windows(monkeypatch):
+    client = MEXCClient(api_key="k", secret_key="s")
+    trades = [{"a": i, "T": 1_000 + i // 2, "p": "1"} for i in range(7)]
+
+    async def fake_agg(symbol, limit=500, from_id=None, start_time=None, end_time=None):
+        if from_id is not None:
+            return [t for t in trades if t["a"] >= from_id][:limit]
+        rows = [t for t in trades if start_time <= t["T"] <= end_time]
+        return rows[:limit]
+
+    monkeypatch.setattr(client, "get_aggregate_trades", fake_agg)
+
+    rows = [row async for row in client.iter_aggregate_trades("QRLUSDT", 0, 5_000, limit=3)]
+
+    assert [row["a"] for row in rows] == list(range(7))
+
+
+@pytest.mark.asyncio
+async def test_iter_my_trades_pages_by_id_within_one_millisecond(monkeypatch):
+    client = MEXCClient(api_key="k", secret_key="s")
+    trades = [{"id": i, "time": 1_000 if i < 5 else 1_001} for i in range(7)]
+    requested = []
+
+    async def fake_my_trades(symbol, start_time=None, end_time=None, limit=500, from_id=None):
+        requested.append((start_time, from_id))
+        if from_id is not None:
+            return [t for t in trades if t["id"] >= from_id][:limit]
+        return [t for t in trades if start_time <= t["time"] <= end_time][:limit]
+
+    monkeypatch.setattr(client, "get_my_trades", fake_my_trades)
+
+    rows = [row async for row in client.iter_my_trades("QRLUSDT", 1_000, 5_000, limit=2)]
+
+    assert [row["id"] for row in rows] == list(range(7))
+    assert requested[:3] == [(1_000, None), (None, 2), (None, 4)]
+
+
+@pytest.mark.asyncio
+async def test_get_klines_sends_a_zero_start_time(monkeypatch):
+    client = MEXCClient(api_key="k", secret_key="s")
+    sent = {}
+
+    async def fake_request(method, path, params=None, **kwargs):
+        sent.update(params)
+        return []
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    await client.get_klines("QRLUSDT", "1m", 0, 59_999, limit=1)
+
+    assert sent["startTime"] == 0
+    assert sent["endTime"] == 59_999
@@ -0,0 +1,122 @@
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.client import MEXCClient  # noqa: E402
+from src.app.infrastructure.external.mexc.records import BatchOrder  # noqa: E402
+
+QRLUSDT_INFO = {
+    "symbol": "QRLUSDT",
+    "baseAssetPrecision": 2,
+    "quotePrecision": 4,
+    "quoteAmountPrecision": "1",
+}
+
+
+@pytest.mark.asyncio
+async def test_batch_orders_split_at_limit_and_map_client_ids(monkeypatch):
+    client = MEXCClient(api_key="dummy_key", secret_key="dummy_secret")
+    batches = []
+
+    async def fake_request(method, endpoint, params=None, signed=False, max_retries=3):
+        if endpoint == "/api/v3/exchangeInfo":
+            return {"symbols": [QRLUSDT_INFO]}
+        assert signed and endpoint == "/api/v3/batchOrders"
+        orders = orjson.loads(params["batchOrders"])
+        batches.append(orders)
+        results = []
+        for order in orders:
+            if order["newClientOrderId"] == "o-7":
+                results.append({"code": 30004, "msg": "Insufficient position"})
+            else:
+                results.append({"orderId": f"x{order['newClientOrderId']}", "symbol": "QRLUSDT"})
+        return results
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    ladder = [
+        BatchOrder("BUY", quantity=10.129, price=0.1, client_order_id=f"o-{i}")
+        for i in range(45)
+    ]
+    ladder.append(BatchOrder("BUY", quantity=1, price=0.1, client_order_id="tiny"))
+
+    result = await client.create_orders_batch("QRLUSDT", ladder)
+
+    assert [len(batch) for batch in batches] == [20, 20, 5]
+    assert result.requests == 3
+    assert batches[0][0]["quantity"] == "10.12"
+    assert result.succeeded["o-0"]["orderId"] == "xo-0"
+    assert result.failed["o-7"] == "Insufficient position"
+    # Below min notional: rejected locally, never sent.
+    assert "tiny" in result.failed
+    assert len(result.succeeded) == 44
+    assert not result.ok
+
+
+@pytest.mark.asyncio
+async def test_unanswered_batches_are_unknown_not_failed(monkeypatch):
+    import httpx
+
+    from src.app.infrastructure.external.mexc.exceptions import MexcDeadlineExceeded
+    from src.app.infrastructure.external.mexc.repos import batch_order_repo
+
+    client = MEXCClient(api_key="dummy_key", secret_key="dummy_secret")
+    request = httpx.Request("POST", "https://api.mexc.com/api/v3/batchOrders")
+    errors = {
+        "timeout": httpx.ReadTimeout("read timed out", request=request),
+        "deadline": MexcDeadlineExceeded("budget spent"),
+        "busy": httpx.HTTPStatusError(
+            "503", request=request, response=httpx.Response(503, request=request)
+        ),
+        "rejected": httpx.HTTPStatusError(
+            "400", request=request, response=httpx.Response(400, request=request)
+        ),
+    }
+
+    async def fake_request(method, endpoint, params=None, signed=False, max_retries=3):
+        if endpoint == "/api/v3/exchangeInfo":
+            return {"symbols": [QRLUSDT_INFO]}
+        assert max_retries == 1  # never resent
+        (order,) = orjson.loads(params["batchOrders"])
+        raise errors[order["newClientOrderId"]]
+
+    monkeypatch.setattr(client, "_request", fake_request)
+    monkeypatch.setattr(batch_order_repo, "BATCH_ORDER_LIMIT", 1)  # one order per call
+
+    ladder = [BatchOrder("BUY", quantity=20, price=0.1, client_order_id=i) for i in errors]
+    result = await client.create_orders_batch("QRLUSDT", ladder)
+
+    assert set(result.unknown) == {"timeout", "deadline", "busy"}
+    assert set(result.failed) == {"rejected"}
+    assert not result.succeeded and not result.ok
+
+
+@pytest.mark.asyncio
+async def test_cancel_batch_reports_partial_failures(monkeypatch):
+    client = MEXCClient(api_key="dummy_key", secret_key="dummy_secret")
+
+    async def fake_cancel(symbol, order_id=None, orig_client_order_id=None):
+        if orig_client_order_id == "b":
+            raise RuntimeError("Unknown order")
+        return {"origClientOrderId": orig_client_order_id, "orderId": "1"}
+
+    async def fake_request(method, endpoint, params=None, signed=False, max_retries=3):
+        assert (method, endpoint) == ("DELETE", "/api/v3/openOrders")
+        return [{"origClientOrderId": "a", "orderId": "1"}, {"orderId": "2"}]
+
+    monkeypatch.setattr(client, "cancel_order", fake_cancel)
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    partial = await client.cancel_orders_batch("QRLUSDT", ["a", "b"])
+    assert set(partial.succeeded) == {"a"}
+    assert partial.failed == {"b": "Unknown order"}
+
+    everything = await client.cancel_orders_batch("QRLUSDT")
+    assert set(everything.succeeded) == {"a", "2"}
+    assert everything.requests == 1
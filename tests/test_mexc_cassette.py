@@ -0,0 +1,78 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.cassette import request_key  # noqa: E402
+from src.app.infrastructure.external.mexc.cassette_transport import (  # noqa: E402
+    CassetteMiss,
+    RecordingTransport,
+    ReplayTransport,
+)
+from src.app.infrastructure.external.mexc.connection import MexcConnection  # noqa: E402
+from src.app.infrastructure.external.mexc.pool import ClientPool  # noqa: E402
+from src.app.infrastructure.external.mexc.session import build_async_client  # noqa: E402
+
+
+def test_request_key_ignores_signing_params():
+    signed = "https://api.mexc.com/api/v3/account?timestamp=1&recvWindow=5000&signature=ab"
+    other = "https://api.mexc.com/api/v3/account?timestamp=2&signature=cd"
+    assert request_key("get", signed) == request_key("GET", other)
+    assert request_key("GET", "https://x/api/v3/depth?symbol=A&limit=5") == (
+        "GET /api/v3/depth?limit=5&symbol=A"
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_without_network(tmp_path):
+    cassette = str(tmp_path / "mexc.cassette.gz")
+    prices = iter(["1.0", "2.0"])
+
+    def handler(request):
+        return httpx.Response(
+            200,
+            json={"symbol": "QRLUSDT", "price": next(prices)},
+            headers={"x-mexc-used-weight-1m": "3"},
+        )
+
+    recorder = RecordingTransport(httpx.MockTransport(handler), cassette)
+    async with httpx.AsyncClient(transport=recorder) as client:
+        for _ in range(2):
+            await client.get("https://api.mexc.com/api/v3/ticker/price?symbol=QRLUSDT")
+
+    conn = MexcConnection("https://api.mexc.com", {}, 5)
+    conn._pool = ClientPool(
+        lambda: build_async_client({}, 5, cassette=cassette, cassette_mode="replay")
+    )
+    async with conn:
+        replayed = [
+            await conn._send("GET", "/api/v3/ticker/price", {"symbol": "QRLUSDT"}, 1)
+            for _ in range(3)
+        ]
+
+    # Recorded order first, then the recording cycles.
+    assert [r["price"] for r in replayed] == ["1.0", "2.0", "1.0"]
+
+
+@pytest.mark.asyncio
+async def test_replay_of_unrecorded_request_fails_loudly():
+    async with httpx.AsyncClient(transport=ReplayTransport({})) as client:
+        with pytest.raises(CassetteMiss):
+            await client.get("https://api.mexc.com/api/v3/depth?symbol=QRLUSDT")
+
+
+def test_cassette_mode_is_normalised_and_never_falls_back_to_live(tmp_path):
+    cassette = tmp_path / "session.jsonl"
+    cassette.write_text("")
+
+    client = build_async_client({}, 5, cassette=str(cassette), cassette_mode=" Replay ")
+    assert isinstance(client._transport, ReplayTransport)
+
+    for mode in (None, "replya"):
+        with pytest.raises(ValueError):
+            build_async_client({}, 5, cassette=str(cassette), cassette_mode=mode)
@@ -0,0 +1,151 @@
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.circuit_breaker import (  # noqa: E402
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+)
+from src.app.infrastructure.external.mexc.breaker_policy import endpoint_family  # noqa: E402
+from src.app.infrastructure.external.mexc.exceptions import MexcCircuitOpen  # noqa: E402
+
+
+def _status_error(status):
+    request = httpx.Request("GET", "https://api.mexc.com/api/v3/depth")
+    return httpx.HTTPStatusError(
+        "error", request=request, response=httpx.Response(status, request=request)
+    )
+
+
+def test_endpoint_families():
+    assert endpoint_family("/api/v3/depth") == "market"
+    assert endpoint_family("/api/v3/account") == "account"
+    assert endpoint_family("/api/v3/userDataStream") == "account"
+    assert endpoint_family("/api/v3/order") == "order"
+    assert endpoint_family("/api/v3/batchOrders") == "order"
+    assert endpoint_family("/api/v3/broker/sub-account/list") == "sub-account"
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_fails_fast_and_probes(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(
+        "src.app.infrastructure.external.mexc.circuit_breaker.time.monotonic",
+        lambda: now[0],
+    )
+    breaker = CircuitBreaker("market", failure_threshold=2, reset_timeout=30)
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        raise _status_error(503)
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            await breaker.call(failing)
+    assert breaker.state == OPEN
+
+    with pytest.raises(MexcCircuitOpen):
+        await breaker.call(failing)
+    assert len(calls) == 2
+
+    now[0] = 31.0
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    # Only one probe at a time while half-open.
+    with pytest.raises(MexcCircuitOpen):
+        breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_client_errors_do_not_open_the_circuit():
+    breaker = CircuitBreaker("order", failure_threshold=1)
+
+    async def rejected():
+        raise _status_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await breaker.call(rejected)
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_caller_deadlines_do_not_count_as_exchange_failures():
+    from src.app.infrastructure.external.mexc.exceptions import MexcDeadlineExceeded
+
+    breaker = CircuitBreaker("market", failure_threshold=1)
+
+    async def out_of_budget():
+        raise MexcDeadlineExceeded("MEXC request deadline exceeded")
+
+    for _ in range(3):
+        with pytest.raises(MexcDeadlineExceeded):
+            await breaker.call(out_of_budget)
+    assert breaker.state == CLOSED and breaker.failures == 0
+
+    # Nor does it prove MEXC healthy: a half-open probe stays unresolved.
+    breaker.state, breaker.opened_at = OPEN, -60.0
+    with pytest.raises(MexcDeadlineExceeded):
+        await breaker.call(out_of_budget)
+    assert breaker.state == HALF_OPEN
+
+
+@pytest.mark.asyncio
+async def test_local_errors_during_a_probe_do_not_close_the_circuit():
+    from src.app.infrastructure.external.mexc.cassette_transport import CassetteMiss
+
+    breaker = CircuitBreaker("market", failure_threshold=1)
+    for error in (KeyError("price"), CassetteMiss("never recorded")):
+        breaker.state, breaker.opened_at = OPEN, -60.0
+
+        async def broken():
+            raise error
+
+        with pytest.raises(type(error)):
+            await breaker.call(broken)
+        assert breaker.state == HALF_OPEN
+
+    async def rejected():
+        raise _status_error(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await breaker.call(rejected)
+    assert breaker.state == CLOSED
+
+
+@pytest.mark.asyncio
+async def test_open_market_circuit_serves_stale_cache():
+    from src.app.application.market.get_orderbook import get_orderbook
+
+    class FailingClient:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return None
+
+        async def get_orderbook(self, symbol, limit=20):
+            raise MexcCircuitOpen("MEXC market circuit is open")
+
+    class Cache:
+        async def get_orderbook(self, symbol):
+            return {"bids": [["1.5", "2"]], "asks": []}
+
+        async def set_orderbook(self, symbol, data):
+            raise AssertionError("stale data must not be written back")
+
+    result = await get_orderbook("QRLUSDT", FailingClient(), cache=Cache())
+
+    assert result["source"] == "cache"
+    assert result["stale"] is True
+    assert result["bids"][0]["price"] == 1.5
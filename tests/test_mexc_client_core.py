@@ -69,3 +69,100 @@ async def test_listen_key_helpers_call_expected_endpoints(monkeypatch):
     assert calls[2][:2] == ("GET", "/api/v3/userDataStream")
     assert calls[3][:3] == ("DELETE", "/api/v3/userDataStream", {"listenKey": "abc"})
     assert all(call[3] for call in calls)
+
+
+def test_signer_matches_generate_signature_and_formats_floats():
+    from src.app.infrastructure.external.mexc.signer import Signer, encode_params
+
+    signer = Signer("dummy_secret")
+    params = {"symbol": "QRLUSDT", "quantity": 0.00001, "timestamp": 1}
+
+    query = signer.encode(params)
+
+    assert encode_params(params) == "quantity=0.00001&symbol=QRLUSDT&timestamp=1"
+    assert query == (
+        f"{encode_params(params)}&signature={generate_signature('dummy_secret', params)}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_signed_request_sends_the_signed_bytes(monkeypatch):
+    import httpx
+
+    from src.app.infrastructure.external.mexc.pool import ClientPool
+
+    client = MEXCClient(api_key="dummy_key", secret_key="dummy_secret")
+    seen = []
+
+    def handler(request):
+        if request.url.path == "/api/v3/exchangeInfo":
+            return httpx.Response(200, json={"symbols": []})
+        seen.append(request)
+        return httpx.Response(200, json={"orderId": "1"})
+
+    client._conn._pool = ClientPool(
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    client._conn.limiter = None
+    monkeypatch.setattr(client.clock, "now_ms", lambda: 1000)
+
+    await client.create_order("QRLUSDT", "BUY", "LIMIT", quantity=1.5, price=0.01)
+
+    query = seen[0].url.query.decode()
+    expected = client._get_signer().encode(
+        {
+            "symbol": "QRLUSDT",
+            "side": "BUY",
+            "type": "LIMIT",
+            "quantity": 1.5,
+            "price": 0.01,
+            "timeInForce": "GTC",
+            "timestamp": 1000,
+            "recvWindow": 5000,
+        }
+    )
+    assert seen[0].method == "POST"
+    assert query == expected
+    assert seen[0].content == b""
+
+
+def test_server_clock_tracks_offset_and_recv_window():
+    from src.app.infrastructure.external.mexc.server_clock import ServerClock
+
+    clock = ServerClock(alpha=0.5)
+    clock.record(sent_ms=1_000, server_ms=3_050, received_ms=1_100)
+
+    assert clock.offset_ms == 2_000
+    assert clock.rtt_ms == 100
+    assert clock.recv_window() == 5000
+
+    clock.record(sent_ms=2_000, server_ms=4_000, received_ms=6_000)
+    assert clock.rtt_ms == 2_050
+    assert clock.recv_window() > 5000
+
+
+@pytest.mark.asyncio
+async def test_timestamp_rejection_triggers_resync_and_single_retry(monkeypatch):
+    import httpx
+
+    from src.app.infrastructure.external.mexc.pool import ClientPool
+
+    client = MEXCClient(api_key="dummy_key", secret_key="dummy_secret")
+    responses = [
+        httpx.Response(400, json={"code": 700003, "msg": "outside recvWindow"}),
+        httpx.Response(200, json={"serverTime": 0}),
+        httpx.Response(200, json={"balances": []}),
+    ]
+
+    def handler(request):
+        return responses.pop(0)
+
+    client._conn._pool = ClientPool(
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    client._conn.limiter = None
+
+    result = await client.get_account_info()
+
+    assert result == {"balances": []}
+    assert client.clock.samples == 1
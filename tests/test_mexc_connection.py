@@ -0,0 +1,269 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.connection import MexcConnection  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_nested_leases_share_one_client():
+    conn = MexcConnection("https://api.mexc.com", {}, 5)
+
+    async with conn:
+        first = conn._pool.get()
+        async with conn:
+            assert conn._pool.get() is first
+        assert conn._pool.is_open
+        assert not first.is_closed
+
+    assert not conn._pool.is_open
+    assert first.is_closed
+
+
+@pytest.mark.asyncio
+async def test_pinned_client_survives_lease_exit():
+    conn = MexcConnection("https://api.mexc.com", {}, 5)
+    await conn.open()
+    client = conn._pool.get()
+
+    async with conn:
+        pass
+
+    assert conn._pool.get() is client
+    assert not client.is_closed
+
+    await conn.close()
+    assert client.is_closed
+    assert not conn._pool.is_pinned
+
+
+@pytest.mark.asyncio
+async def test_concurrent_public_gets_are_coalesced(monkeypatch):
+    import asyncio
+
+    conn = MexcConnection("https://api.mexc.com", {}, 5, coalesce_ttl=0.25)
+    calls = []
+
+    async def fake_send(
+        method, endpoint, params, max_retries, signed_query=None, deadline=None
+    ):
+        calls.append((method, endpoint, params))
+        await asyncio.sleep(0.01)
+        return {"symbol": params["symbol"]}
+
+    monkeypatch.setattr(conn, "_send", fake_send)
+
+    results = await asyncio.gather(
+        *[conn.request("GET", "/api/v3/ticker/24hr", {"symbol": "QRLUSDT"}) for _ in range(5)]
+    )
+    late = await conn.request("GET", "/api/v3/ticker/24hr", {"symbol": "QRLUSDT"})
+
+    assert len(calls) == 1
+    assert all(result == {"symbol": "QRLUSDT"} for result in results)
+    assert late is results[0]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_waiters_keep_their_own_deadlines(monkeypatch):
+    import asyncio
+
+    from src.app.infrastructure.external.mexc.deadline import Deadline
+    from src.app.infrastructure.external.mexc.exceptions import MexcDeadlineExceeded
+
+    conn = MexcConnection("https://api.mexc.com", {}, 5)
+    budgets = []
+
+    async def fake_send(
+        method, endpoint, params, max_retries, signed_query=None, deadline=None
+    ):
+        budgets.append(deadline)
+        await asyncio.sleep(0.2)
+        return {"price": "1"}
+
+    monkeypatch.setattr(conn, "_send", fake_send)
+    args = ("GET", "/api/v3/ticker/price", {"symbol": "QRLUSDT"})
+
+    short, unbounded = await asyncio.gather(
+        conn.request(*args, deadline=Deadline.after(0.05)),
+        conn.request(*args),
+        return_exceptions=True,
+    )
+
+    assert isinstance(short, MexcDeadlineExceeded)
+    assert unbounded == {"price": "1"}
+    assert budgets == [None]
+
+
+@pytest.mark.asyncio
+async def test_signed_requests_are_never_coalesced(monkeypatch):
+    import asyncio
+
+    conn = MexcConnection("https://api.mexc.com", {}, 5, coalesce_ttl=0.25)
+    calls = []
+
+    async def fake_send(
+        method, endpoint, params, max_retries, signed_query=None, deadline=None
+    ):
+        calls.append(endpoint)
+        return {}
+
+    monkeypatch.setattr(conn, "_send", fake_send)
+
+    await asyncio.gather(
+        conn.request("GET", "/api/v3/account", {}, signed=True),
+        conn.request("GET", "/api/v3/account", {}, signed=True),
+    )
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_deadline_stops_retries_that_cannot_fit():
+    import httpx
+
+    from src.app.infrastructure.external.mexc.deadline import Deadline
+    from src.app.infrastructure.external.mexc.exceptions import MexcDeadlineExceeded
+    from src.app.infrastructure.external.mexc.pool import ClientPool
+
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(503)
+
+    conn = MexcConnection("https://api.mexc.com", {}, 5)
+    conn._pool = ClientPool(
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+
+    # The 1s backoff after the first 503 does not fit a 0.5s budget.
+    with pytest.raises(httpx.HTTPStatusError):
+        await conn.request(
+            "GET", "/api/v3/time", max_retries=3, deadline=Deadline.after(0.5)
+        )
+    assert len(calls) == 1
+
+    with pytest.raises(MexcDeadlineExceeded):
+        await conn.request("GET", "/api/v3/time", deadline=Deadline.after(0))
+
+
+@pytest.mark.asyncio
+async def test_deadline_scope_only_shortens_budget():
+    from src.app.infrastructure.external.mexc.deadline import (
+        current_deadline,
+        deadline_scope,
+    )
+
+    assert current_deadline() is None
+    with deadline_scope(10) as outer:
+        with deadline_scope(60):
+            assert current_deadline().expires_at == outer.expires_at
+        assert current_deadline(0.5).expires_at < outer.expires_at
+
+
+@pytest.mark.asyncio
+async def test_slow_attempt_is_hedged():
+    import asyncio
+
+    from src.app.infrastructure.external.mexc.hedging import hedged
+
+    delays = [1.0, 0.0]
+    started = []
+
+    async def call():
+        delay = delays[len(started)]
+        started.append(delay)
+        await asyncio.sleep(delay)
+        return delay
+
+    assert await asyncio.wait_for(hedged(call, 0.01), timeout=0.5) == 0.0
+    assert started == [1.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_hedge_leaves_no_attempt_running():
+    import asyncio
+
+    from src.app.infrastructure.external.mexc.hedging import hedged
+
+    started = []
+
+    async def call():
+        task = asyncio.current_task()
+        started.append(task)
+        await asyncio.sleep(10)
+
+    # Cancelled before the hedge delay, and again after the hedge started.
+    for timeout in (0.02, 0.1):
+        started.clear()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(hedged(call, 0.05), timeout=timeout)
+        await asyncio.sleep(0)
+        assert started and all(task.cancelled() for task in started)
+    assert len(started) == 2
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_queueing_does_not_trigger_hedge():
+    import asyncio
+
+    import httpx
+
+    from src.app.infrastructure.external.mexc.retry import send_with_retries
+
+    class SlowLimiter:
+        acquired = 0
+
+        async def acquire(self, bucket, weight):
+            self.acquired += 1
+            await asyncio.sleep(0.1)
+
+        def observe(self, bucket, status, headers):
+            return None
+
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"serverTime": 1})
+
+    latencies, limiter = [], SlowLimiter()
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        result = await send_with_retries(
+            client, "GET", "https://api.mexc.com/api/v3/time", {}, 1,
+            limiter=limiter, hedge_after=0.02, on_latency=latencies.append,
+        )
+
+    assert result == {"serverTime": 1}
+    assert len(calls) == 1 and limiter.acquired == 1  # no hedge was started
+    assert latencies[0] < 0.05
+
+
+def test_latency_tracker_needs_samples_before_hedging():
+    from src.app.infrastructure.external.mexc.hedging import LatencyTracker
+
+    tracker = LatencyTracker(min_samples=10)
+    for ms in range(9):
+        tracker.record("/api/v3/depth", ms / 1000)
+    assert tracker.hedge_delay("/api/v3/depth", 0.95) is None
+
+    tracker.record("/api/v3/depth", 0.5)
+    assert tracker.hedge_delay("/api/v3/depth", 0.95) == 0.5
+    assert tracker.hedge_delay("/api/v3/depth", 0) is None
+
+
+def test_missing_h2_falls_back_to_http1_with_a_warning(monkeypatch, caplog):
+    from src.app.infrastructure.external.mexc import session
+    from src.app.infrastructure.external.mexc.config import MexcSettings
+    from src.app.infrastructure.config import config
+
+    assert MexcSettings(None, None, "", 5).http2 == config.MEXC_HTTP2
+    monkeypatch.setattr(session, "h2", None)
+    with caplog.at_level("WARNING", logger=session.__name__):
+        session.build_async_client({}, 5, http2=True)
+    assert "HTTP/2 requested" in caplog.text
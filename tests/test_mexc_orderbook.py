@@ -0,0 +1,182 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.application.market.get_orderbook import get_orderbook  # noqa: E402
+from src.app.application.trading.services.trading.book_pricing import (  # noqa: E402
+    apply_book_liquidity,
+    price_snapshot_from_book,
+)
+from src.app.infrastructure.external.mexc.orderbook import (  # noqa: E402
+    OrderBook,
+    OrderBookSync,
+    PriceLadder,
+)
+from src.app.infrastructure.external.mexc.websocket.push_records import (  # noqa: E402
+    DepthLevel,
+    DepthPush,
+)
+
+SNAPSHOT = {
+    "lastUpdateId": 100,
+    "bids": [["0.99", "10"], ["0.98", "20"], ["0.97", "30"]],
+    "asks": [["1.01", "5"], ["1.02", "15"], ["1.05", "50"]],
+}
+
+
+def _push(first, last, bids=(), asks=()):
+    return DepthPush(
+        "depth",
+        "QRLUSDT",
+        0,
+        tuple(DepthLevel(p, q) for p, q in bids),
+        tuple(DepthLevel(p, q) for p, q in asks),
+        first,
+        last,
+    )
+
+
+def test_ladder_keeps_best_first_order_and_removes_zero_levels():
+    bids = PriceLadder(descending=True)
+    bids.load(SNAPSHOT["bids"])
+    bids.update(0.995, 4)
+    bids.update(0.98, 0)
+
+    assert bids.top(3) == [(0.995, 4.0), (0.99, 10.0), (0.97, 30.0)]
+    assert bids.cumulative(2) == [(0.995, 4.0), (0.99, 14.0)]
+
+
+def test_cost_to_fill_walks_levels():
+    book = OrderBook.from_snapshot("QRLUSDT", SNAPSHOT)
+
+    estimate = book.cost_to_fill("BUY", 10)
+    assert estimate.complete and estimate.levels == 2
+    assert estimate.cost == pytest.approx(5 * 1.01 + 5 * 1.02)
+    assert estimate.worst_price == 1.02
+
+    short = book.cost_to_fill("SELL", 100)
+    assert not short.complete and short.filled == 60
+
+
+def test_book_ignores_stale_and_detects_gaps():
+    book = OrderBook.from_snapshot("QRLUSDT", SNAPSHOT)
+
+    assert book.apply(_push(95, 100, bids=[(0.99, 0)]))
+    assert book.best_bid() == (0.99, 10.0)
+    assert book.apply(_push(99, 102, asks=[(1.0, 3)]))
+    assert book.best_ask() == (1.0, 3.0) and book.version == 102
+
+    assert not book.apply(_push(105, 106))
+    assert not book.synced
+
+
+class FakeClient:
+    def __init__(self, snapshots):
+        self.snapshots = list(snapshots)
+        self.calls = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def get_order_book(self, symbol, limit):
+        self.calls += 1
+        return self.snapshots.pop(0)
+
+
+async def _stream(pushes):
+    for push in pushes:
+        yield push
+
+
+@pytest.mark.asyncio
+async def test_sync_bootstraps_and_resyncs_after_gap():
+    later = {**SNAPSHOT, "lastUpdateId": 110, "asks": [["1.03", "1"]]}
+    client = FakeClient([SNAPSHOT, later])
+    sync = OrderBookSync("QRLUSDT", client)
+    seen = []
+
+    async def pushes():
+        async for push in _stream(
+            [_push(101, 101), _push(104, 105), _push(106, 111, asks=[(1.04, 2)])]
+        ):
+            yield push
+            seen.append(sync.book.version)
+
+    await sync.run(pushes())
+
+    assert client.calls == 2 and sync.resyncs == 1
+    assert seen == [101, 101, 111]
+    assert sync.book.top(2)["asks"] == [(1.03, 1.0), (1.04, 2.0)]
+
+
+@pytest.mark.asyncio
+async def test_get_orderbook_prefers_synced_book():
+    book = OrderBook.from_snapshot("QRLUSDT", SNAPSHOT)
+
+    result = await get_orderbook("QRLUSDT", mexc_client=None, limit=2, book=book)
+
+    assert result["source"] == "stream"
+    assert [level["price"] for level in result["asks"]] == [1.01, 1.02]
+
+
+def test_planner_uses_book_mid_and_visible_depth():
+    book = OrderBook.from_snapshot("QRLUSDT", SNAPSHOT)
+    snapshot = price_snapshot_from_book({"prices": {"QRLUSDT": 0.5}}, book)
+    assert snapshot["prices"]["QRLUSDT"] == pytest.approx(1.0)
+
+    plan = apply_book_liquidity({"action": "BUY", "quantity": 100}, book)
+
+    assert plan["quantity"] == 70
+    assert plan["worst_fill_price"] == 1.05
+    assert plan["expected_fill_price"] == pytest.approx(plan["notional_usdt"] / 70)
+
+
+def test_buy_plan_walks_asks_within_usdt_budget():
+    book = OrderBook.from_snapshot(
+        "QRLUSDT",
+        {"lastUpdateId": 1, "bids": [["0.99", "500"]], "asks": [["1.01", "50"], ["1.05", "200"]]},
+    )
+    plan = {
+        "action": "BUY",
+        "quantity": 120.0,
+        "notional_usdt": 120.0,
+        "usdt_balance": 100.0,
+        "target_ratio": 1.0,
+    }
+
+    plan = apply_book_liquidity(plan, book)
+
+    assert plan["notional_usdt"] == pytest.approx(100.0)
+    assert plan["quantity"] == pytest.approx(50 + 49.5 / 1.05)
+    assert plan["worst_fill_price"] == 1.05
+    assert book.cost_to_spend(20.0).filled == pytest.approx(20 / 1.01)
+
+
+def test_lot_size_snapping_keeps_the_book_walked_cost():
+    from src.app.application.trading.services.trading.order_sizing import (
+        apply_symbol_filters,
+    )
+    from src.app.infrastructure.external.mexc.symbol_filters import SymbolFilters
+
+    book = OrderBook.from_snapshot(
+        "QRLUSDT",
+        {"lastUpdateId": 1, "bids": [["0.5", "500"]], "asks": [["1.0", "50"], ["2.0", "50"]]},
+    )
+    plan = apply_book_liquidity({"action": "BUY", "price": 0.75, "quantity": 75.555}, book)
+    filters = SymbolFilters.from_raw(
+        {"symbol": "QRLUSDT", "baseAssetPrecision": 2, "quoteAmountPrecision": "1"}
+    )
+
+    plan = apply_symbol_filters(plan, filters)
+
+    # 50 @ 1.0 + 25.55 @ 2.0, not 75.55 at the 0.75 mid.
+    assert plan["quantity"] == 75.55
+    assert plan["notional_usdt"] == pytest.approx(50 * 1.0 + 25.55 * 2.0, rel=1e-3)
@@ -0,0 +1,57 @@
+import sys
+import time
+from pathlib import Path
+
+import httpx
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.rate_limiter import (  # noqa: E402
+    RateLimiter,
+    TokenBucket,
+)
+from src.app.infrastructure.external.mexc.rate_limits import (  # noqa: E402
+    IP_BUCKET,
+    ORDER_BUCKET,
+    endpoint_bucket,
+    endpoint_weight,
+)
+
+
+def test_endpoint_weights_and_buckets():
+    assert endpoint_weight("GET", "/api/v3/account") == 10
+    assert endpoint_weight("GET", "/api/v3/depth", {"limit": 20}) == 1
+    assert endpoint_weight("GET", "/api/v3/depth", {"limit": 1000}) == 10
+    assert endpoint_weight("GET", "/api/v3/ticker/24hr", {"symbol": "QRLUSDT"}) == 1
+    assert endpoint_weight("GET", "/api/v3/ticker/24hr", {}) == 40
+    assert endpoint_bucket("POST", "/api/v3/order") == ORDER_BUCKET
+    assert endpoint_bucket("GET", "/api/v3/order") == IP_BUCKET
+
+
+@pytest.mark.asyncio
+async def test_bucket_queues_when_budget_exhausted():
+    bucket = TokenBucket(capacity=10, period=0.1)
+    await bucket.acquire(10)
+    assert bucket.utilization() > 0.9
+
+    started = time.monotonic()
+    await bucket.acquire(5)
+    assert time.monotonic() - started >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_retry_after_blocks_bucket_and_orders_stay_available():
+    limiter = RateLimiter(weight_per_period=100, order_per_period=10, period=10)
+
+    pause = limiter.observe(IP_BUCKET, 429, httpx.Headers({"Retry-After": "0.05"}))
+
+    assert pause == 0.05
+    assert limiter.status()[IP_BUCKET]["utilization"] == 1.0
+    started = time.monotonic()
+    await limiter.acquire(ORDER_BUCKET, 1)
+    assert time.monotonic() - started < 0.01
+    await limiter.acquire(IP_BUCKET, 1)
+    assert time.monotonic() - started >= 0.04
@@ -0,0 +1,81 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.records import (  # noqa: E402
+    AccountRecord,
+    DepthRecord,
+    KlineRecord,
+    TickerRecord,
+)
+from src.app.infrastructure.external.mexc.utils import decode_json  # noqa: E402
+
+
+def test_decode_json_reads_raw_bytes():
+    assert decode_json(b'{"price":"0.123","n":[1,2]}') == {"price": "0.123", "n": [1, 2]}
+
+
+def test_account_record_parses_balances_once():
+    account = AccountRecord.from_raw(
+        {
+            "canTrade": True,
+            "balances": [
+                {"asset": "QRL", "free": "1.5", "locked": "0.5"},
+                {"asset": "BTC", "free": "0", "locked": "0"},
+            ],
+        }
+    )
+
+    assert account.balance("QRL").total == 2.0
+    assert account.balance("USDT").total == 0.0
+    assert list(account.non_zero()) == ["QRL"]
+
+
+def test_market_records_convert_numeric_strings():
+    kline = KlineRecord.from_raw(
+        [1, "0.1", "0.2", "0.05", "0.15", "100", 59999, "15"]
+    )
+    depth = DepthRecord.from_raw(
+        {"lastUpdateId": 7, "bids": [["0.1", "5"]], "asks": [["0.2", "3"]]}
+    )
+    ticker = TickerRecord.from_raw({"symbol": "QRLUSDT", "lastPrice": "0.12"})
+
+    assert kline.as_dict()["close"] == 0.15
+    assert kline.close_time == 59999
+    assert depth.bids == [(0.1, 5.0)] and depth.asks == [(0.2, 3.0)]
+    assert ticker.last_price == 0.12 and ticker.volume == 0.0
+
+
+def test_market_snapshot_indexes_and_values_assets():
+    import asyncio
+
+    from src.app.infrastructure.external.mexc import MEXCClient
+
+    client = MEXCClient(api_key="k", secret_key="s")
+    calls = []
+
+    async def fake_request(method, endpoint, params=None, signed=False, max_retries=3):
+        calls.append(endpoint)
+        return [
+            {"symbol": "QRLUSDT", "lastPrice": "0.5"},
+            {"symbol": "USDTBRL", "lastPrice": "5"},
+        ]
+
+    client._request = fake_request
+
+    async def run():
+        first = await client.get_market_snapshot()
+        second = await client.get_market_snapshot(symbols=["qrlusdt"])
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert calls == ["/api/v3/ticker/24hr"]
+    assert list(second.tickers) == ["QRLUSDT"]
+    assert first.value_in("QRL", 10) == 5.0
+    assert first.value_in("BRL", 10) == 2.0
+    assert first.value_in("USDT", 3) == 3
+    assert first.value_in("XYZ", 1) is None
@@ -0,0 +1,96 @@
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.client import MEXCClient  # noqa: E402
+from src.app.infrastructure.external.mexc.symbol_filters import (  # noqa: E402
+    OrderFilterError,
+    SymbolFilters,
+)
+
+QRLUSDT_INFO = {
+    "symbol": "QRLUSDT",
+    "baseAssetPrecision": 2,
+    "quotePrecision": 4,
+    "quoteAssetPrecision": 4,
+    "baseSizePrecision": "0",
+    "quoteAmountPrecision": "1",
+    "filters": [],
+}
+
+
+def test_mexc_native_precisions_become_steps():
+    filters = SymbolFilters.from_raw(QRLUSDT_INFO)
+
+    assert filters.step_size == Decimal("0.01")
+    assert filters.tick_size == Decimal("0.0001")
+    assert filters.min_notional == Decimal("1")
+    assert filters.quantize_qty(12.3456) == Decimal("12.34")
+    assert filters.quantize_price(0.123456) == Decimal("0.1234")
+
+
+def test_binance_style_filters_take_precedence():
+    info = dict(
+        QRLUSDT_INFO,
+        filters=[
+            {"filterType": "LOT_SIZE", "stepSize": "0.5", "minQty": "1"},
+            {"filterType": "MIN_NOTIONAL", "minNotional": "5"},
+        ],
+    )
+    filters = SymbolFilters.from_raw(info)
+
+    assert filters.quantize_qty(7.9) == Decimal("7.5")
+    with pytest.raises(OrderFilterError):
+        filters.prepare(quantity=0.9)
+    with pytest.raises(OrderFilterError):
+        filters.prepare(quantity=2, reference_price=2)
+    assert filters.prepare(quantity=3.2, reference_price=2)[0] == Decimal("3")
+
+
+@pytest.mark.asyncio
+async def test_create_order_quantizes_before_sending(monkeypatch):
+    client = MEXCClient(api_key="dummy_key", secret_key="dummy_secret")
+    calls = []
+
+    async def fake_request(method, endpoint, params=None, signed=False, max_retries=3):
+        calls.append((method, endpoint, params))
+        if endpoint == "/api/v3/exchangeInfo":
+            return {"symbols": [QRLUSDT_INFO]}
+        return {"orderId": "1"}
+
+    monkeypatch.setattr(client, "_request", fake_request)
+
+    await client.create_order("QRLUSDT", "BUY", "LIMIT", quantity=10.129, price=0.123456)
+    await client.create_order("QRLUSDT", "SELL", "LIMIT", quantity=10, price=0.2)
+
+    orders = [params for _, endpoint, params in calls if endpoint == "/api/v3/order"]
+    assert orders[0]["quantity"] == Decimal("10.12")
+    assert orders[0]["price"] == Decimal("0.1234")
+    # Exchange info is fetched once and then served from the cache.
+    assert sum(1 for _, endpoint, _ in calls if endpoint == "/api/v3/exchangeInfo") == 1
+
+    with pytest.raises(OrderFilterError):
+        await client.create_order("QRLUSDT", "BUY", "LIMIT", quantity=1, price=0.2)
+    assert len(orders) == 2
+
+
+def test_rebalance_plan_is_snapped_to_lot_size():
+    from src.app.application.trading.services.trading.order_sizing import (
+        apply_symbol_filters,
+    )
+
+    filters = SymbolFilters.from_raw(QRLUSDT_INFO)
+    plan = apply_symbol_filters(
+        {"action": "BUY", "price": 2.0, "quantity": 15.3333333}, filters
+    )
+    assert plan["quantity"] == 15.33
+    assert plan["notional_usdt"] == pytest.approx(30.66)
+
+    small = apply_symbol_filters({"action": "SELL", "price": 2.0, "quantity": 0.3}, filters)
+    assert small["action"] == "HOLD"
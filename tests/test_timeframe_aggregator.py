@@ -0,0 +1,110 @@
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.application.market.timeframe_aggregator import (  # noqa: E402
+    MarketCandle,
+    TimeframeAggregator,
+)
+from src.app.application.market.timeframes import (  # noqa: E402
+    cascade,
+    timeframe_seconds,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _bar(closed_at: datetime, price: float, volume: float = 1.0) -> MarketCandle:
+    return MarketCandle("QRLUSDT", price, price + 1, price - 1, price, volume, closed_at)
+
+
+def _minutes(aggregator, first: int, last: int):
+    completed = []
+    for minute in range(first, last + 1):
+        completed += aggregator.on_candle(_bar(START + timedelta(minutes=minute), minute))
+    return completed
+
+
+def test_timeframe_specs_and_cascade_sources():
+    assert [timeframe_seconds(tf) for tf in (5, "30s", "4h", "1d")] == [300, 30, 14400, 86400]
+    with pytest.raises(ValueError):
+        timeframe_seconds("5x")
+    assert cascade([60, 1, 15, 5, 10, "1d"], 60) == {
+        None: [1], 1: [5], 5: [10, 15], 15: [60], 60: ["1d"],
+    }
+    with pytest.raises(ValueError):
+        TimeframeAggregator(["90s"])
+
+
+def test_cascade_emits_aligned_bars_through_a_day():
+    aggregator = TimeframeAggregator([1, 5, 15, 60, "1d"])
+    completed = _minutes(aggregator, 1, 24 * 60)
+
+    counts = {tf: sum(1 for t, _ in completed if t == tf) for tf in aggregator.timeframes}
+    assert counts == {1: 1440, 5: 288, 15: 96, 60: 24, "1d": 1}
+    hour = next(c for tf, c in completed if tf == 60)
+    assert (hour.open, hour.high, hour.low, hour.close, hour.volume) == (1, 61, 0, 60, 60.0)
+    assert hour.closed_at == START + timedelta(hours=1)
+    assert [c for tf, c in completed if tf == "1d"][0].closed_at == START + timedelta(days=1)
+    assert completed[-2:] == [(60, completed[-2][1]), ("1d", completed[-1][1])]
+
+
+def test_joining_mid_bucket_skips_the_leading_partial():
+    aggregator = TimeframeAggregator([5])
+    completed = _minutes(aggregator, 3, 10)
+
+    assert [c.closed_at.minute for _, c in completed] == [10]
+    assert completed[0][1].open == 6
+
+
+def test_gap_closes_the_open_bucket_on_its_own_boundary():
+    aggregator = TimeframeAggregator([5])
+    _minutes(aggregator, 1, 3)  # 00:04 and 00:05 never arrive
+
+    completed = aggregator.on_candle(_bar(START + timedelta(minutes=12), 12))
+    assert [(tf, c.closed_at, c.close, c.volume) for tf, c in completed] == [
+        (5, START + timedelta(minutes=5), 3, 3.0),
+    ]
+    assert len(aggregator.buffers[5]) == 1
+
+
+def test_late_bars_are_dropped_and_on_time_flushes():
+    aggregator = TimeframeAggregator([5])
+    _minutes(aggregator, 1, 3)
+    assert aggregator.on_candle(_bar(START + timedelta(minutes=2), 99)) == []
+    assert aggregator.late == 1
+
+    completed = aggregator.on_time(START + timedelta(minutes=5, seconds=2, microseconds=200))
+    assert [(c.closed_at, c.high) for _, c in completed] == [(START + timedelta(minutes=5), 4)]
+    assert aggregator.on_candle(_bar(START + timedelta(minutes=5), 5)) == []
+    assert aggregator.late == 2
+
+
+def test_on_time_waits_for_a_final_bar_still_in_flight():
+    aggregator = TimeframeAggregator([1, 5])
+    _minutes(aggregator, 1, 4)
+
+    assert aggregator.on_time(START + timedelta(minutes=5, milliseconds=200)) == []
+    completed = _minutes(aggregator, 5, 5)
+    assert [(tf, c.closed_at, c.volume) for tf, c in completed] == [
+        (1, START + timedelta(minutes=5), 1.0),
+        (5, START + timedelta(minutes=5), 5.0),
+    ]
+    assert aggregator.late == 0
+
+
+def test_second_level_bars_from_one_second_candles():
+    aggregator = TimeframeAggregator(["5s", "15s", "1m"], base_seconds=1)
+    completed = []
+    for second in range(1, 61):
+        completed += aggregator.on_candle(_bar(START + timedelta(seconds=second), second))
+
+    assert [sum(1 for t, _ in completed if t == tf) for tf in aggregator.timeframes] == [12, 4, 1]
+    minute = completed[-1][1]
+    assert completed[-1][0] == "1m" and (minute.open, minute.close, minute.volume) == (1, 60, 60.0)
@@ -0,0 +1,137 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.websocket import client as ws_module  # noqa: E402
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    OVERFLOW_CONFLATE,
+    OVERFLOW_DROP_OLDEST,
+    ChannelQueue,
+    MEXCWebSocketClient,
+)
+
+
+class FakeWebSocket:
+    def __init__(self, incoming=None):
+        self.incoming = asyncio.Queue()
+        for item in incoming or []:
+            self.incoming.put_nowait(item)
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(data)
+
+    async def recv(self):
+        return await self.incoming.get()
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def fake_ws(monkeypatch):
+    ws = FakeWebSocket()
+
+    async def fake_connect(*args, **kwargs):
+        return ws
+
+    monkeypatch.setattr(ws_module.websockets, "connect", fake_connect)
+    return ws
+
+
+async def _collect(iterator):
+    return [message async for message in iterator]
+
+
+async def _take(iterator, count):
+    return [await iterator.__anext__() for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_channel_iterators_route_by_channel_and_answer_ping(fake_ws):
+    async with MEXCWebSocketClient(heartbeat=None) as client:
+        depth = client.channel("depth")
+        deals = client.channel("deals")
+        first_depth = asyncio.create_task(depth.__anext__())
+        first_deal = asyncio.create_task(deals.__anext__())
+        await asyncio.sleep(0)
+        for message in (
+            {"channel": "depth", "n": 1},
+            {"method": "PING"},
+            {"channel": "deals", "n": 2},
+            {"id": 0, "code": 0, "msg": "ack"},
+            {"channel": "depth", "n": 3},
+        ):
+            fake_ws.incoming.put_nowait(json.dumps(message))
+
+        received = [await asyncio.wait_for(first_depth, 1)]
+        received += await asyncio.wait_for(_take(depth, 1), 1)
+        trade = await asyncio.wait_for(first_deal, 1)
+        ack = await asyncio.wait_for(client.recv(), 1)
+        await depth.aclose()
+        await deals.aclose()
+
+    assert [m["n"] for m in received] == [1, 3]
+    assert trade["n"] == 2
+    assert ack["msg"] == "ack"
+    sent = [json.loads(raw) for raw in fake_ws.sent]
+    assert {"method": "PONG"} in sent
+    assert {"method": "SUBSCRIPTION", "params": ["depth"]} in sent
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_and_conflate_policies():
+    dropping = ChannelQueue(maxsize=2, overflow=OVERFLOW_DROP_OLDEST)
+    conflating = ChannelQueue(maxsize=10, overflow=OVERFLOW_CONFLATE)
+    for n in range(4):
+        await dropping.put(n)
+        await conflating.put(n)
+
+    assert [await dropping.get(), await dropping.get()] == [2, 3]
+    assert dropping.dropped == 2
+    assert await conflating.get() == 3
+    assert conflating.qsize() == 0
+
+
+@pytest.mark.asyncio
+async def test_block_policy_applies_backpressure():
+    queue = ChannelQueue(maxsize=1)
+    await queue.put("a")
+    pending = asyncio.create_task(queue.put("b"))
+    await asyncio.sleep(0)
+    assert not pending.done()
+
+    assert await queue.get() == "a"
+    await asyncio.wait_for(pending, 1)
+    assert await queue.get() == "b"
+
+
+@pytest.mark.asyncio
+async def test_channel_iterator_ends_when_connection_drops(fake_ws):
+    class Closed(Exception):
+        pass
+
+    async def failing_recv():
+        raise Closed()
+
+    async with MEXCWebSocketClient(heartbeat=None) as client:
+        fake_ws.recv = failing_recv
+        received = await asyncio.wait_for(
+            _collect(client.channel("depth")), 1
+        )
+        with pytest.raises(Closed):
+            await client.recv()
+
+    assert received == []
+
+
+def test_unknown_overflow_policy_rejected():
+    with pytest.raises(ValueError):
+        ChannelQueue(overflow="spill")
@@ -0,0 +1,67 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.websocket import WebSocketPool  # noqa: E402
+from ws_fakes import FakeClient, reset_fake_clients, settle  # noqa: E402,F401
+
+
+def _client_for(pool, channel):
+    return next(s.client for s in pool.shards if channel in s.channels)
+
+
+@pytest.mark.asyncio
+async def test_pool_shards_channels_by_limit_and_merges_streams():
+    async with WebSocketPool(max_per_connection=2, client_factory=FakeClient) as pool:
+        await pool.subscribe(["a", "b", "c", "d", "e"])
+        await settle()
+
+        assert sorted(len(s.channels) for s in pool.shards) == [1, 2, 2]
+        stream = pool.channel("e")
+        pending = asyncio.create_task(stream.__anext__())
+        await settle()
+        _client_for(pool, "e").incoming.put_nowait({"channel": "e", "n": 1})
+        _client_for(pool, "a").incoming.put_nowait({"channel": "zzz"})
+
+        assert (await asyncio.wait_for(pending, 1))["n"] == 1
+        assert (await asyncio.wait_for(pool.recv(), 1))["channel"] == "zzz"
+        await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_pool_rebalances_after_unsubscribe():
+    async with WebSocketPool(max_per_connection=2, client_factory=FakeClient) as pool:
+        await pool.subscribe(["a", "b", "c", "d"])
+        await settle()
+        assert len(pool.shards) == 2
+
+        await pool.unsubscribe(["a", "c"])
+        await settle()
+
+        assert len(pool.shards) == 1
+        assert pool.shards[0].channels == {"b", "d"}
+        assert _client_for(pool, "b").subscriptions == {"b", "d"}
+
+
+@pytest.mark.asyncio
+async def test_shard_reconnects_independently():
+    pool = WebSocketPool(
+        max_per_connection=1, reconnect_delay=0, client_factory=FakeClient
+    )
+    await pool.subscribe(["a", "b"])
+    await settle()
+    first_a, first_b = _client_for(pool, "a"), _client_for(pool, "b")
+
+    first_a.incoming.put_nowait(ConnectionError("dropped"))
+    await settle()
+
+    assert _client_for(pool, "a") is not first_a
+    assert _client_for(pool, "b") is first_b
+    assert [s.status()["reconnects"] for s in pool.shards] == [1, 0]
+    await pool.close()
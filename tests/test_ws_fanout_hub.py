@@ -0,0 +1,104 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    DELIVER_LATEST,
+    DELIVER_SAMPLED,
+    KeyedLatestQueue,
+    MarketDataHub,
+)
+from ws_fakes import FakeClient, reset_fake_clients, settle  # noqa: E402,F401
+
+
+@pytest.mark.asyncio
+async def test_hub_shares_one_upstream_and_refcounts_channels():
+    hub = MarketDataHub(client_factory=FakeClient)
+    strategy = await hub.subscribe(["deals"])
+    dashboard = await hub.subscribe(["deals", "ticker"], policy=DELIVER_LATEST)
+    await settle()
+    (upstream,) = FakeClient.instances
+    assert upstream.subscriptions == {"deals", "ticker"}
+
+    upstream.incoming.put_nowait({"channel": "deals", "n": 1})
+    assert (await asyncio.wait_for(strategy.get(), 1))["n"] == 1
+    assert (await asyncio.wait_for(dashboard.get(), 1))["n"] == 1
+
+    await dashboard.close()
+    assert upstream.unsubscribed == ["ticker"]  # "deals" still has a subscriber
+    await strategy.close()
+    assert upstream.unsubscribed == ["ticker", "deals"]
+    assert hub.status()["subscribers"] == []
+
+    with pytest.raises(StopAsyncIteration):
+        await strategy.get()
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_does_not_stall_fast_one():
+    hub = MarketDataHub(client_factory=FakeClient)
+    fast = await hub.subscribe(["deals"])
+    async with await hub.subscribe(["deals"], maxsize=2) as slow:
+        await settle()
+        for n in range(10):
+            FakeClient.instances[0].incoming.put_nowait({"channel": "deals", "n": n})
+        received = [(await asyncio.wait_for(fast.get(), 1))["n"] for _ in range(10)]
+        assert received == list(range(10))
+        assert [(await slow.get())["n"] for _ in range(2)] == [8, 9]
+        assert slow.status()["dropped"] == 8
+    await hub.close()
+    assert [m async for m in fast] == []  # closing the hub ends every stream
+
+
+@pytest.mark.asyncio
+async def test_latest_policy_conflates_per_key_in_first_seen_order():
+    queue = KeyedLatestQueue(key=lambda m: m["symbol"])
+    for symbol, price in [("BTC", 1), ("ETH", 10), ("BTC", 2), ("BTC", 3)]:
+        await queue.put({"symbol": symbol, "price": price})
+
+    assert await queue.get() == {"symbol": "BTC", "price": 3}
+    await queue.put({"symbol": "ETH", "price": 11})
+    assert await queue.get() == {"symbol": "ETH", "price": 11}
+    assert queue.dropped == 3
+
+
+@pytest.mark.asyncio
+async def test_sampled_policy_releases_at_most_once_per_interval():
+    hub = MarketDataHub(client_factory=FakeClient)
+    sampled = await hub.subscribe(["ticker"], policy=DELIVER_SAMPLED, interval_ms=100)
+    await settle()
+    upstream = FakeClient.instances[0]
+    loop = asyncio.get_running_loop()
+
+    upstream.incoming.put_nowait({"channel": "ticker", "n": 1})
+    assert (await asyncio.wait_for(sampled.get(), 1))["n"] == 1
+    released = loop.time()
+    for n in range(2, 6):
+        upstream.incoming.put_nowait({"channel": "ticker", "n": n})
+    assert (await asyncio.wait_for(sampled.get(), 1))["n"] == 5
+    assert loop.time() - released >= 0.09
+    await hub.close()
+
+
+@pytest.mark.asyncio
+async def test_live_feed_on_hub_ends_cleanly_when_hub_closes():
+    from src.app.infrastructure.market.live_ws_feed import LiveWSFeed
+
+    hub = MarketDataHub(client_factory=FakeClient)
+    feed = LiveWSFeed("QRLUSDT", hub=hub)
+
+    async def drain():
+        return [candle async for candle in feed.stream()]
+
+    task = asyncio.create_task(drain())
+    await settle()
+    assert hub.status()["subscribers"]
+    await hub.close()
+    assert await asyncio.wait_for(task, 1) == []
@@ -0,0 +1,117 @@
+import sys
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    build_fast_decoder,
+    decode_push_records,
+    peek_channel,
+)
+from src.app.infrastructure.external.mexc.websocket.push_records import (  # noqa: E402
+    BUY,
+    SELL,
+    BookTickerPush,
+    DepthPush,
+    KlinePush,
+    TradesPush,
+)
+from src.app.infrastructure.external.proto.websocket_pb import (  # noqa: E402
+    PushDataV3ApiWrapper_pb2,
+)
+
+DEALS = "spot@public.aggre.deals.v3.api.pb@100ms@BTCUSDT"
+DEPTH = "spot@public.aggre.depth.v3.api.pb@100ms@BTCUSDT"
+
+
+def _wrapper(channel: str) -> PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper:
+    wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper()
+    wrapper.channel = channel
+    wrapper.symbol = "BTCUSDT"
+    wrapper.sendTime = 1700000000123
+    return wrapper
+
+
+def _deals_frame() -> bytes:
+    wrapper = _wrapper(DEALS)
+    deal = wrapper.publicAggreDeals.deals.add()
+    deal.price, deal.quantity, deal.tradeType, deal.time = "42000.5", "0.01", 1, 1
+    deal = wrapper.publicAggreDeals.deals.add()
+    deal.price, deal.quantity, deal.tradeType, deal.time = "41999", "0.2", 2, 2
+    return wrapper.SerializeToString()
+
+
+def _depth_frame() -> bytes:
+    wrapper = _wrapper(DEPTH)
+    body = wrapper.publicAggreDepths
+    level = body.bids.add()
+    level.price, level.quantity = "41999.9", "1.5"
+    level = body.asks.add()
+    level.price, level.quantity = "42000.1", "0"
+    body.fromVersion, body.toVersion = "100", "104"
+    return wrapper.SerializeToString()
+
+
+def test_peek_channel_reads_prefix_without_parsing():
+    assert peek_channel(_deals_frame()) == DEALS.encode()
+    assert peek_channel(b"") is None
+    assert peek_channel(b"\x12\x00") is None
+
+
+def test_fast_decoder_builds_trade_records():
+    push = decode_push_records(_deals_frame())
+
+    assert isinstance(push, TradesPush)
+    assert push.channel == DEALS and push.symbol == "BTCUSDT"
+    assert [(t.price, t.quantity, t.side) for t in push.trades] == [
+        (42000.5, 0.01, BUY),
+        (41999.0, 0.2, SELL),
+    ]
+
+
+def test_fast_decoder_builds_depth_with_versions():
+    push = decode_push_records(_depth_frame())
+
+    assert isinstance(push, DepthPush)
+    assert push.bids[0].price == 41999.9 and push.bids[0].quantity == 1.5
+    assert push.asks[0].quantity == 0.0
+    assert (push.from_version, push.to_version) == (100, 104)
+
+
+def test_fast_decoder_book_ticker_and_kline():
+    wrapper = _wrapper("spot@public.aggre.bookTicker.v3.api.pb@100ms@BTCUSDT")
+    ticker = wrapper.publicAggreBookTicker
+    ticker.bidPrice, ticker.bidQuantity = "1.1", "2"
+    ticker.askPrice, ticker.askQuantity = "1.2", "3"
+    push = decode_push_records(wrapper.SerializeToString())
+    assert isinstance(push, BookTickerPush)
+    assert (push.bid_price, push.ask_quantity) == (1.1, 3.0)
+
+    wrapper = _wrapper("spot@public.kline.v3.api.pb@BTCUSDT@Min1")
+    kline = wrapper.publicSpotKline
+    kline.interval, kline.windowStart, kline.windowEnd = "Min1", 60, 120
+    kline.openingPrice, kline.highestPrice = "1", "3"
+    kline.lowestPrice, kline.closingPrice = "0.5", "2"
+    kline.volume, kline.amount = "10", "20"
+    push = decode_push_records(wrapper.SerializeToString())
+    assert isinstance(push, KlinePush)
+    assert (push.open, push.high, push.low, push.close) == (1.0, 3.0, 0.5, 2.0)
+
+
+def test_channel_filter_skips_other_channels():
+    decoder = build_fast_decoder(channels=[DEPTH])
+
+    assert decoder(_deals_frame()) is None
+    assert isinstance(decoder(_depth_frame()), DepthPush)
+
+
+def test_unknown_bodies_fall_back_to_dict():
+    wrapper = _wrapper("spot@public.miniTicker.v3.api.pb@BTCUSDT@UTC+8")
+    wrapper.publicMiniTicker.price = "1"
+
+    payload = decode_push_records(wrapper.SerializeToString())
+
+    assert isinstance(payload, dict)
+    assert payload["channel"].startswith("spot@public.miniTicker")
@@ -0,0 +1,120 @@
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    FrameRecorder,
+    MEXCWebSocketClient,
+    ReplayClient,
+    decode_push_records,
+    read_frames,
+)
+from src.app.infrastructure.external.mexc.websocket.frame_reader import (  # noqa: E402
+    segment_paths,
+)
+from src.app.infrastructure.external.mexc.websocket.push_records import (  # noqa: E402
+    TradesPush,
+)
+from src.app.infrastructure.external.proto.websocket_pb import (  # noqa: E402
+    PushDataV3ApiWrapper_pb2,
+)
+
+DEALS = "spot@public.aggre.deals.v3.api.pb@100ms@BTCUSDT"
+ACCOUNT = "spot@private.account.v3.api.pb"
+
+
+def _deals_frame(price: str, channel: str = DEALS) -> bytes:
+    wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper()
+    wrapper.channel, wrapper.symbol, wrapper.sendTime = channel, "BTCUSDT", 1
+    deal = wrapper.publicAggreDeals.deals.add()
+    deal.price, deal.quantity, deal.tradeType, deal.time = price, "0.1", 1, 1
+    return wrapper.SerializeToString()
+
+
+def _record(directory: Path, frames, gap_ns: int = 1_000_000, **options) -> FrameRecorder:
+    recorder = FrameRecorder(directory, **options)
+    for index, raw in enumerate(frames):
+        recorder.write(raw, received_ns=1_700_000_000_000_000_000 + index * gap_ns)
+    recorder.close()
+    return recorder
+
+
+def test_recorder_rotates_segments_and_reader_round_trips(tmp_path):
+    frames = ['{"id":0,"code":0,"msg":"' + DEALS + '"}']
+    frames += [_deals_frame(f"{42000 + n}.5") for n in range(20)]
+    recorder = _record(tmp_path, frames + [_deals_frame("1", ACCOUNT)], max_bytes=400)
+
+    assert recorder.frames == 21  # the private frame is not persisted
+    assert recorder.segments > 1
+    assert len(segment_paths(tmp_path)) == recorder.segments
+
+    replayed = list(read_frames(tmp_path))
+    assert [f.payload for f in replayed] == frames
+    assert replayed[0].channel == "" and replayed[1].channel == DEALS
+    stamps = [f.received_ns for f in replayed]
+    assert stamps == sorted(stamps)
+
+
+def test_reader_stops_at_torn_trailing_record(tmp_path):
+    _record(tmp_path, [_deals_frame("1"), _deals_frame("2")])
+    (segment,) = segment_paths(tmp_path)
+    segment.write_bytes(segment.read_bytes()[:-5])
+
+    assert [f.payload for f in read_frames(segment)] == [_deals_frame("1")]
+
+
+def test_client_records_frames_as_received(tmp_path):
+    recorder = FrameRecorder(tmp_path)
+    client = MEXCWebSocketClient(binary_decoder=decode_push_records)
+    client._recording = recorder
+    client._parse(_deals_frame("42000.5"))
+    client._parse("PONG")
+    recorder.close()
+
+    assert [f.payload for f in read_frames(tmp_path)] == [_deals_frame("42000.5"), "PONG"]
+
+
+@pytest.mark.asyncio
+async def test_replay_feeds_decoder_and_channel_queues(tmp_path):
+    from src.app.infrastructure.external.mexc.websocket import stream_monitor
+
+    _record(tmp_path, ['{"code":0}'] + [_deals_frame(str(n)) for n in range(1, 6)])
+    stream_monitor.channels.clear()
+
+    async with ReplayClient(tmp_path, speed=None, binary_decoder=decode_push_records) as ws:
+        pushes = [push async for push in ws]
+    assert pushes[0] == {"code": 0}
+    assert all(isinstance(p, TradesPush) for p in pushes[1:])
+    assert [p.trades[0].price for p in pushes[1:]] == [1.0, 2.0, 3.0, 4.0, 5.0]
+
+    client = ReplayClient(
+        tmp_path, speed=None, channels=[DEALS], binary_decoder=decode_push_records
+    )
+    async with client as ws:
+        prices = [push.trades[0].price async for push in ws.channel(DEALS)]
+    assert prices == [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert stream_monitor.channels == {}  # recorded latencies stay out of diagnostics
+
+
+@pytest.mark.asyncio
+async def test_replay_paces_by_recorded_time_and_speed(tmp_path):
+    # 5 frames recorded 100 ms apart: 0.4 s of market time.
+    _record(tmp_path, [_deals_frame(str(n)) for n in range(5)], gap_ns=100_000_000)
+
+    async def replay(speed):
+        start = time.monotonic()
+        async with ReplayClient(tmp_path, speed=speed) as ws:
+            async for _ in ws:
+                pass
+        return time.monotonic() - start
+
+    assert await replay(None) < 0.05
+    assert 0.03 <= await replay(10.0) < 0.2
+    assert await asyncio.wait_for(replay(2.0), timeout=2) >= 0.19
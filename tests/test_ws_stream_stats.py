@@ -0,0 +1,117 @@
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    ChannelQueue,
+    LatencyHistogram,
+    MEXCWebSocketClient,
+    StreamMonitor,
+    decode_push_records,
+)
+from src.app.infrastructure.external.mexc.websocket import (  # noqa: E402
+    channel_queue,
+    client as client_module,
+)
+from src.app.infrastructure.external.mexc.websocket.stream_stats import (  # noqa: E402
+    ChannelStats,
+)
+from src.app.infrastructure.external.proto.websocket_pb import (  # noqa: E402
+    PushDataV3ApiWrapper_pb2,
+)
+
+DEALS = "spot@public.aggre.deals.v3.api.pb@100ms@BTCUSDT"
+
+
+class FixedClock:
+    offset_ms = 0.0
+
+
+@pytest.fixture
+def monitor(monkeypatch):
+    monitor = StreamMonitor()
+    monitor.clock = FixedClock()
+    monkeypatch.setattr(client_module, "stream_monitor", monitor)
+    monkeypatch.setattr(channel_queue, "stream_monitor", monitor)
+    return monitor
+
+
+def _deals_frame(send_time: int) -> bytes:
+    wrapper = PushDataV3ApiWrapper_pb2.PushDataV3ApiWrapper()
+    wrapper.channel, wrapper.symbol, wrapper.sendTime = DEALS, "BTCUSDT", send_time
+    deal = wrapper.publicAggreDeals.deals.add()
+    deal.price, deal.quantity, deal.tradeType, deal.time = "1", "1", 1, send_time
+    return wrapper.SerializeToString()
+
+
+def test_histogram_percentiles_stay_within_bucket_precision():
+    rng = random.Random(7)
+    values = sorted(rng.randint(0, 5_000_000) for _ in range(20_000))
+    histogram = LatencyHistogram()
+    for value in values:
+        histogram.record(value)
+
+    for pct in (50, 90, 99, 99.9):
+        exact = values[int(len(values) * pct / 100) - 1]
+        assert abs(histogram.percentile(pct) - exact) <= exact * 0.02
+    assert histogram.percentile(100) == histogram.max == values[-1]
+
+    small = LatencyHistogram()
+    for value in (3, 3, 3, 100):
+        small.record(value)
+    assert small.percentile(50) == 3 and small.percentile(99) == 100
+    small.merge(histogram)
+    assert small.count == 20_004 and small.min == min(3, values[0])
+
+
+def test_channel_rates_cover_the_last_full_window():
+    stats = ChannelStats()
+    for second in range(100, 112):
+        stats.on_receive(size=500, received_ms=second * 1000 + 1, send_ms=None, decode_us=5)
+
+    rates = stats.rates(now_s=112.5)
+    assert rates == {"messages_per_s": 1.0, "bytes_per_s": 500.0}
+    assert stats.rates(now_s=200)["messages_per_s"] == 0.0
+
+
+def test_client_records_network_and_decode_time(monitor):
+    client = MEXCWebSocketClient(binary_decoder=decode_push_records)
+    sent = int(time.time() * 1000) - 40  # pushed 40 ms ago by exchange clock
+
+    client._parse(_deals_frame(sent))
+    client._parse('{"id":0,"code":0,"msg":"ack"}')  # no channel: not counted
+
+    summary = monitor.snapshot()[DEALS]
+    assert summary["messages"] == 1 and summary["bytes"] == len(_deals_frame(sent))
+    assert 35 <= summary["network"]["p50_ms"] <= 1000
+    assert summary["decode"]["count"] == 1
+
+    monitor.clock.offset_ms = -1000.0  # local clock 1 s ahead of the exchange
+    client._parse(_deals_frame(int(time.time() * 1000)))
+    assert monitor.channels[DEALS].negative == 1
+
+
+@pytest.mark.asyncio
+async def test_queue_dwell_and_consumer_age(monitor):
+    queue = ChannelQueue(maxsize=10)
+    push = decode_push_records(_deals_frame(int(time.time() * 1000) - 100))
+    await queue.put(push)
+    await asyncio.sleep(0.05)
+    assert await queue.get() is push
+
+    summary = monitor.snapshot()[DEALS]
+    assert summary["dwell"]["count"] == 1 and summary["dwell"]["p50_ms"] >= 45
+    assert summary["age"]["p50_ms"] >= 145
+
+    monitor.enabled = False
+    await queue.put(push)
+    await queue.get()
+    assert monitor.channels[DEALS].stages["dwell"].count == 1
@@ -0,0 +1,117 @@
+import asyncio
+import json
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+if str(ROOT_DIR) not in sys.path:
+    sys.path.insert(0, str(ROOT_DIR))
+
+from src.app.application.market.stream_metrics import jittered_backoff  # noqa: E402
+from src.app.application.market.ws_supervisor import (  # noqa: E402
+    MarketStreamSupervisor,
+)
+from src.app.infrastructure.external.mexc.websocket import client as ws_module  # noqa: E402
+
+
+class StallingClient:
+    """Delivers one message per connection, then blocks without data."""
+
+    def __init__(self):
+        self.entered = 0
+
+    async def __aenter__(self):
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def __aiter__(self):
+        yield {"n": self.entered}
+        await asyncio.Event().wait()
+
+
+@pytest.mark.asyncio
+async def test_watchdog_cancels_stalled_stream_and_reconnects():
+    client = StallingClient()
+    received = []
+
+    async def on_message(message):
+        received.append(message["n"])
+        if len(received) == 2:
+            supervisor.stop()
+
+    supervisor = MarketStreamSupervisor(
+        client, on_message, reconnect_delay=0.001, heartbeat_timeout=0.05
+    )
+    task = asyncio.create_task(supervisor.run())
+    while len(received) < 2:
+        await asyncio.sleep(0.01)
+    await asyncio.wait_for(task, 1)
+
+    metrics = supervisor.metrics.snapshot()
+    assert received == [1, 2]
+    assert metrics["stale_timeouts"] == 1
+    assert metrics["reconnects"] == 1 and metrics["connects"] == 2
+    assert metrics["last_downtime"] >= 0.05
+    assert metrics["time_to_first_message"] is not None
+
+
+@pytest.mark.asyncio
+async def test_slow_handler_is_not_a_stall():
+    client = StallingClient()
+
+    async def slow_handler(message):
+        await asyncio.sleep(0.1)
+        supervisor.stop()
+
+    supervisor = MarketStreamSupervisor(client, slow_handler, heartbeat_timeout=0.03)
+    task = asyncio.create_task(supervisor.run())
+    await asyncio.sleep(0.12)
+
+    await asyncio.wait_for(task, 1)
+    assert supervisor.metrics.stale_timeouts == 0
+
+
+def test_jittered_backoff_grows_and_caps():
+    rng = random.Random(7)
+    delays = [jittered_backoff(n, 1.0, 8.0, rng) for n in range(6)]
+
+    for attempt, delay in enumerate(delays):
+        ceiling = min(8.0, 2 ** attempt)
+        assert ceiling / 2 <= delay <= ceiling
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, data):
+        self.sent.append(json.loads(data))
+
+    async def close(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_client_replays_subscriptions_on_reconnect(monkeypatch):
+    sockets = []
+
+    async def fake_connect(*args, **kwargs):
+        sockets.append(FakeWebSocket())
+        return sockets[-1]
+
+    monkeypatch.setattr(ws_module.websockets, "connect", fake_connect)
+    client = ws_module.MEXCWebSocketClient(subscriptions=["a"], heartbeat=None)
+
+    async with client:
+        await client.subscribe(["b"])
+        await client.unsubscribe(["a"])
+    async with client:
+        pass
+
+    assert sockets[1].sent == [{"method": "SUBSCRIPTION", "params": ["b"]}]
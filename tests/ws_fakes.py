@@ -0,0 +1,50 @@
+"""Shared fakes for the websocket pool and hub tests."""
+import asyncio
+
+import pytest
+
+
+class FakeClient:
+    """Stands in for MEXCWebSocketClient; one instance per shard connect."""
+
+    instances = []
+
+    def __init__(self, url=None, subscriptions=None, **kwargs):
+        self.subscriptions = set(subscriptions or [])
+        self.incoming = asyncio.Queue()
+        self.unsubscribed = []
+        FakeClient.instances.append(self)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def subscribe(self, channels):
+        self.subscriptions.update(channels)
+
+    async def unsubscribe(self, channels):
+        self.unsubscribed.extend(channels)
+        self.subscriptions.difference_update(channels)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        message = await self.incoming.get()
+        if isinstance(message, Exception):
+            raise message
+        return message
+
+
+async def settle():
+    """Let background reader tasks run a few steps."""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_clients():
+    """Start every test in a module that imports this with no connected fakes."""
+    FakeClient.instances = []